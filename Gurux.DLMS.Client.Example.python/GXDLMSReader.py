@@ -44,6 +44,10 @@ from gurux_dlms import (
     GXDLMSTranslator,
     GXDLMSException,
     GXDLMSAccessItem,
+    GXDLMSRequestPipeline,
+    GXHdlcWindow,
+    GXDLMSGbtWindow,
+    GXDLMSTracer,
 )
 from gurux_dlms.enums import (
     InterfaceType,
@@ -55,6 +59,7 @@ from gurux_dlms.enums import (
     AssociationResult,
     SourceDiagnostic,
     AccessServiceCommandType,
+    RequestTypes,
 )
 from gurux_dlms.objects import (
     GXDLMSObject,
@@ -94,6 +99,8 @@ class GXDLMSReader:
         self.waitTime = 5000
         self.logFile = open("logFile.txt", "w")
         self.trace = trace
+        # Sent and received data is written also to gurux_dlms logger.
+        self.tracer = GXDLMSTracer()
         self.media = media
         self.invocationCounter = invocationCounter
         self.client = client
@@ -155,7 +162,23 @@ class GXDLMSReader:
     def writeTrace(self, line, level):
         if self.trace >= level:
             print(line)
-        self.logFile.write(line + "\n")
+            self.logFile.write(line + "\n")
+
+    # Write sent or received data. Hex string is generated only if the
+    # level is traced here or in the gurux_dlms logger.
+    def writeData(self, tx, data, level=TraceLevel.VERBOSE):
+        if self.trace >= level:
+            if tx:
+                line = "TX: "
+            else:
+                line = "RX: "
+            self.writeTrace(
+                line + self.now() + "\t" + str(GXDLMSTracer.hex(data)), level
+            )
+        if tx:
+            self.tracer.tx(data)
+        else:
+            self.tracer.rx(data)
 
     def readDLMSPacket(self, data, reply=None):
         if not reply:
@@ -190,10 +213,7 @@ class GXDLMSReader:
         rd = GXByteBuffer()
         with self.media.getSynchronous():
             if not reply.isStreaming():
-                self.writeTrace(
-                    "TX: " + self.now() + "\t" + GXByteBuffer.hex(data),
-                    TraceLevel.VERBOSE,
-                )
+                self.writeData(True, data)
                 self.media.send(data)
             pos = 0
             try:
@@ -218,9 +238,9 @@ class GXDLMSReader:
                     rd.set(p.reply)
                     p.reply = None
             except Exception as e:
-                self.writeTrace("RX: " + self.now() + "\t" + str(rd), TraceLevel.ERROR)
+                self.writeData(False, rd, TraceLevel.ERROR)
                 raise e
-            self.writeTrace("RX: " + self.now() + "\t" + str(rd), TraceLevel.VERBOSE)
+            self.writeData(False, rd)
             if reply.error != 0:
                 raise GXDLMSException(reply.error)
 
@@ -232,13 +252,151 @@ class GXDLMSReader:
                     self.readDataBlock(it, reply)
                 return reply.error == 0
             else:
-                self.readDLMSPacket(data, reply)
+                if self.useHdlcWindow():
+                    read = self.readHdlcWindow
+                elif self.useGbtWindow():
+                    read = self.readGbtWindow
+                else:
+                    read = self.readDLMSPacket
+                read(data, reply)
                 while reply.isMoreData():
                     if reply.isStreaming():
                         data = None
                     else:
                         data = self.client.receiverReady(reply)
-                    self.readDLMSPacket(data, reply)
+                    read(data, reply)
+
+    # Are HDLC frames received using sliding window.
+    def useHdlcWindow(self):
+        return (
+            self.client.interfaceType == InterfaceType.HDLC
+            and self.client.hdlcSettings.windowSizeRX != 1
+        )
+
+    # Send request and receive reply frames so that a window of frames is
+    # acknowledged with one RR.
+    def readHdlcWindow(self, data, reply):
+        window = GXHdlcWindow(self.client.settings)
+        p = ReceiveParameters()
+        p.eop = 0x7E
+        p.count = 5
+        p.allData = True
+        p.waitTime = self.waitTime
+        self.media.eop = p.eop
+        rd = GXByteBuffer()
+        frames = [data]
+        received = False
+        with self.media.getSynchronous():
+            while not received or (reply.moreData & RequestTypes.FRAME) != 0:
+                for it in frames:
+                    self.writeData(True, it)
+                    self.media.send(it)
+                frames = []
+                pos = 0
+                while not self.media.receive(p):
+                    pos += 1
+                    if pos == 3:
+                        raise TimeoutException(
+                            "Failed to receive reply from the device in given time."
+                        )
+                    # Request is sent again if nothing is received. If the
+                    # final frame of the window is lost, the meter is polled
+                    # with the current N(R).
+                    print("Data send failed.  Try to resend " + str(pos) + "/3")
+                    for it in window.timeout() if received else [data]:
+                        self.writeData(True, it)
+                        self.media.send(it)
+                rd.set(p.reply)
+                p.reply = None
+                for it in self.getHdlcFrames(rd):
+                    self.writeData(False, it)
+                    frames.extend(window.handleFrame(it, reply))
+                    received = True
+        if reply.error != 0:
+            raise GXDLMSException(reply.error)
+
+    # Are General Block Transfer blocks received using a window.
+    def useGbtWindow(self):
+        return (
+            self.client.gbtWindowSize > 1
+            and (self.client.negotiatedConformance & Conformance.GENERAL_BLOCK_TRANSFER)
+            != 0
+        )
+
+    # Send request and receive the reply so that the meter streams a window
+    # of GBT blocks and only the missing blocks are asked again.
+    def readGbtWindow(self, data, reply):
+        if reply.gbtWindow is None:
+            reply.gbtWindow = GXDLMSGbtWindow(self.client.settings)
+        window = reply.gbtWindow
+        notify = GXReplyData()
+        eop = 0x7E
+        # In network connection terminator is not used.
+        if self.client.interfaceType == InterfaceType.WRAPPER and isinstance(
+            self.media, GXNet
+        ):
+            eop = None
+        p = ReceiveParameters()
+        p.eop = eop
+        p.allData = True
+        p.waitTime = self.waitTime
+        if eop is None:
+            p.count = 8
+        else:
+            p.count = 5
+        self.media.eop = eop
+        rd = GXByteBuffer()
+        with self.media.getSynchronous():
+            if data:
+                self.writeData(True, data)
+                self.media.send(data)
+            pos = 0
+            while True:
+                if self.client.getData(rd, reply, notify):
+                    if (reply.moreData & RequestTypes.GBT) == 0:
+                        break
+                    # Acknowledge asks the missing blocks or the next window.
+                    for it in window.getRequests():
+                        self.writeData(True, it)
+                        self.media.send(it)
+                    continue
+                if not p.eop:
+                    p.count = self.client.getFrameSize(rd)
+                while not self.media.receive(p):
+                    pos += 1
+                    if pos == 3:
+                        raise TimeoutException(
+                            "Failed to receive reply from the device in given time."
+                        )
+                    # Last block of the window is lost. Missing blocks are
+                    # asked again. Request is sent again if nothing is
+                    # received.
+                    print("Data send failed.  Try to resend " + str(pos) + "/3")
+                    for it in window.timeout() or ([data] if data else []):
+                        self.writeData(True, it)
+                        self.media.send(it)
+                rd.set(p.reply)
+                p.reply = None
+            self.writeData(False, rd)
+        if reply.error != 0:
+            raise GXDLMSException(reply.error)
+
+    # Remove complete HDLC frames from the received data.
+    @classmethod
+    def getHdlcFrames(cls, data):
+        frames = []
+        while data.available() > 2:
+            pos = data.position
+            if data.getUInt8(pos) != 0x7E or (data.getUInt8(pos + 1) & 0xF0) != 0xA0:
+                data.position = pos + 1
+                continue
+            size = 2 + (((data.getUInt8(pos + 1) & 0x7) << 8) | data.getUInt8(pos + 2))
+            if data.available() < size:
+                break
+            frames.append(data.subArray(pos, size))
+            data.position = pos + size
+        data.trim()
+        return frames
 
     def initializeOpticalHead(self):
         if self.client.interfaceType == InterfaceType.HDLC_WITH_MODE_E:
@@ -426,6 +584,36 @@ class GXDLMSReader:
                 raise ValueError("Invalid reply. Read items count do not match.")
             self.client.updateValues(list_, values)
 
+    # Read attributes so that several requests are sent before the replies
+    # are received. This hides the latency of the slow (cellular)
+    # connections. Only WRAPPER interface is supported.
+    def readPipelined(self, list_, window=4):
+        pipeline = GXDLMSRequestPipeline(self.client, list_, window)
+        p = ReceiveParameters()
+        p.eop = None
+        p.allData = True
+        p.waitTime = self.waitTime
+        self.media.eop = None
+        rd = GXByteBuffer()
+        with self.media.getSynchronous():
+            data = pipeline.getRequests()
+            while not pipeline.isDone():
+                for it in data:
+                    self.writeData(True, it)
+                    self.media.send(it)
+                p.count = self.client.getFrameSize(rd)
+                if p.count < 1:
+                    p.count = 8
+                if not self.media.receive(p):
+                    raise TimeoutException(
+                        "Failed to receive reply from the device in given time."
+                    )
+                rd.set(p.reply)
+                p.reply = None
+                self.writeData(False, rd)
+                data = pipeline.handleReply(rd)
+        return pipeline.errors
+
     def write(self, item, attributeIndex):
         data = self.client.write(item, attributeIndex)
         self.readDLMSPacket(data)
@@ -38,7 +38,8 @@ import traceback
 from gurux_common.enums import TraceLevel
 from gurux_common.io import Parity, StopBits
 from gurux_common import ReceiveParameters, GXCommon, TimeoutException
-from gurux_dlms import GXByteBuffer, GXReplyData, GXDLMSTranslator, GXDLMSException, GXDLMSAccessItem
+from gurux_dlms import GXByteBuffer, GXReplyData, GXDLMSTranslator, GXDLMSException, GXDLMSAccessItem,\
+    GXDLMSTracer
 from gurux_dlms.enums import InterfaceType, ObjectType, Authentication, Conformance, DataType,\
     Security, AssociationResult, SourceDiagnostic, AccessServiceCommandType
 from gurux_dlms.objects import GXDLMSObject, GXDLMSObjectCollection, GXDLMSData, GXDLMSRegister,\
@@ -54,6 +55,8 @@ class GXDLMSReader:
         self.waitTime = 5000
         self.logFile = open("logFile.txt", "w")
         self.trace = trace
+        # Sent and received data is written also to gurux_dlms logger.
+        self.tracer = GXDLMSTracer()
         self.media = media
         self.invocationCounter = invocationCounter
         self.client = client
@@ -130,7 +133,21 @@ class GXDLMSReader:
     def writeTrace(self, line, level):
         if self.trace >= level:
             print(line)
-        self.logFile.write(line + "\n")
+            self.logFile.write(line + "\n")
+
+    # Write sent or received data. Hex string is generated only if the
+    # level is traced here or in the gurux_dlms logger.
+    def writeData(self, tx, data, level=TraceLevel.VERBOSE):
+        if self.trace >= level:
+            if tx:
+                line = "TX: "
+            else:
+                line = "RX: "
+            self.writeTrace(line + self.now() + "\t" + str(GXDLMSTracer.hex(data)), level)
+        if tx:
+            self.tracer.tx(data)
+        else:
+            self.tracer.rx(data)
 
     def readDLMSPacket(self, data, reply=None):
         if not reply:
@@ -163,7 +180,7 @@ class GXDLMSReader:
         rd = GXByteBuffer()
         with self.media.getSynchronous():
             if not reply.isStreaming():
-                self.writeTrace("TX: " + self.now() + "\t" + GXByteBuffer.hex(data), TraceLevel.VERBOSE)
+                self.writeData(True, data)
                 self.media.send(data)
             pos = 0
             try:
@@ -186,9 +203,9 @@ class GXDLMSReader:
                     rd.set(p.reply)
                     p.reply = None
             except Exception as e:
-                self.writeTrace("RX: " + self.now() + "\t" + str(rd), TraceLevel.ERROR)
+                self.writeData(False, rd, TraceLevel.ERROR)
                 raise e
-            self.writeTrace("RX: " + self.now() + "\t" + str(rd), TraceLevel.VERBOSE)
+            self.writeData(False, rd)
             if reply.error != 0:
                 raise GXDLMSException(reply.error)
 
@@ -0,0 +1,118 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for parsing association view. Synthetic association view with
+# given amount of objects is parsed. Access rights and OBIS code information
+# are updated when they are accessed the first time.
+#
+# Usage: python association_view.py [object count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXDLMSClient, GXByteBuffer
+from gurux_dlms.enums import DataType
+from gurux_dlms.internal._GXCommon import _GXCommon
+from gurux_dlms.objects import (
+    GXDLMSAssociationLogicalName,
+    GXDLMSClock,
+    GXDLMSData,
+    GXDLMSProfileGeneric,
+    GXDLMSRegister,
+)
+
+
+def getAssociationView(count):
+    types = [GXDLMSData, GXDLMSRegister, GXDLMSProfileGeneric, GXDLMSClock]
+    items = [GXDLMSAssociationLogicalName()]
+    for pos in range(count - 1):
+        ln = "1.0.%d.%d.0.255" % (int(pos / 250), pos % 250)
+        items.append(types[pos % len(types)](ln))
+    data = GXByteBuffer()
+    data.setUInt8(DataType.ARRAY)
+    _GXCommon.setObjectCount(len(items), data)
+    for it in items:
+        data.setUInt8(DataType.STRUCTURE)
+        data.setUInt8(4)
+        _GXCommon.setData(None, data, DataType.UINT16, it.objectType)
+        _GXCommon.setData(None, data, DataType.UINT8, it.version)
+        _GXCommon.setData(
+            None,
+            data,
+            DataType.OCTET_STRING,
+            _GXCommon.logicalNameToBytes(it.logicalName),
+        )
+        data.setUInt8(DataType.STRUCTURE)
+        data.setUInt8(2)
+        data.setUInt8(DataType.ARRAY)
+        data.setUInt8(it.getAttributeCount())
+        for pos in range(it.getAttributeCount()):
+            data.setUInt8(DataType.STRUCTURE)
+            data.setUInt8(3)
+            _GXCommon.setData(None, data, DataType.INT8, pos + 1)
+            _GXCommon.setData(None, data, DataType.ENUM, 1)
+            _GXCommon.setData(None, data, DataType.NONE, None)
+        data.setUInt8(DataType.ARRAY)
+        data.setUInt8(it.getMethodCount())
+        for pos in range(it.getMethodCount()):
+            data.setUInt8(DataType.STRUCTURE)
+            data.setUInt8(2)
+            _GXCommon.setData(None, data, DataType.INT8, pos + 1)
+            _GXCommon.setData(None, data, DataType.ENUM, 1)
+    return data.array()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    data = getAssociationView(count)
+    client = GXDLMSClient(True)
+    start = time.time()
+    objects = client.parseObjects(GXByteBuffer(data))
+    print("parse objects    %8.3f s" % (time.time() - start))
+    start = time.time()
+    for it in objects:
+        it.getAccess(2)
+    print("access rights    %8.3f s" % (time.time() - start))
+    start = time.time()
+    for it in objects:
+        it.description  # pylint: disable=pointless-statement
+    print("descriptions     %8.3f s" % (time.time() - start))
+
+
+if __name__ == "__main__":
+    main()
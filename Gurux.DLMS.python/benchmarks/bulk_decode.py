@@ -0,0 +1,80 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for decoding archived profile generic reads. Every buffer is
+# one raw read from one meter. Buffers are decoded in the current process
+# and with worker processes.
+#
+# Usage: python bulk_decode.py [buffer count] [row count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXDLMSBulkDecoder
+from gurux_dlms.objects import GXDLMSClock, GXDLMSData, GXDLMSProfileGeneric
+from gurux_dlms.objects import GXDLMSRegister
+from hdlc_window import getBuffer
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    pg = GXDLMSProfileGeneric("1.0.99.1.0.255")
+    pg.addCaptureObject(GXDLMSClock(), 2, 0)
+    pg.addCaptureObject(GXDLMSData("0.0.96.10.1.255"), 2, 0)
+    pg.addCaptureObject(GXDLMSRegister("1.0.1.8.0.255"), 2, 0)
+    buffers = [bytes(getBuffer(rows).array())] * count
+    decoder = GXDLMSBulkDecoder(pg)
+    cpus = os.cpu_count() or 1
+    for processes in sorted(set([0, 2, cpus])):
+        start = time.time()
+        total = 0
+        for it in decoder.decode(buffers, processes):
+            if it["error"]:
+                raise ValueError(it["error"])
+            total += it["rows"]
+        elapsed = time.time() - start
+        print(
+            "processes %2d %8.3f s  %8.0f rows/s"
+            % (processes, elapsed, total / elapsed)
+        )
+
+
+if __name__ == "__main__":
+    main()
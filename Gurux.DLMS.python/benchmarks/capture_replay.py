@@ -0,0 +1,93 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for decoding captured replies again. Profile generic reads are
+# written to the capture log and the log is replayed without the meter.
+#
+# Usage: python capture_replay.py [read count] [row count]
+#
+from __future__ import print_function
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXDLMSCaptureLog, GXDLMSClient
+from gurux_dlms.enums import ObjectType
+from gurux_dlms.objects import GXDLMSClock, GXDLMSData, GXDLMSProfileGeneric
+from gurux_dlms.objects import GXDLMSRegister
+from hdlc_window import getBuffer
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    client = GXDLMSClient(True)
+    pg = GXDLMSProfileGeneric("1.0.99.1.0.255")
+    register = GXDLMSRegister("1.0.1.8.0.255")
+    register.scaler = 0.01
+    pg.addCaptureObject(GXDLMSClock(), 2, 0)
+    pg.addCaptureObject(GXDLMSData("0.0.96.10.1.255"), 2, 0)
+    pg.addCaptureObject(register, 2, 0)
+    client.objects.append(pg)
+    client.objects.append(register)
+    data = getBuffer(rows).array()
+    path = os.path.join(tempfile.mkdtemp(), "capture.log")
+    try:
+        start = time.time()
+        with GXDLMSCaptureLog(path) as log:
+            for _ in range(count):
+                log.add(ObjectType.PROFILE_GENERIC, pg.logicalName, 2, None, data)
+        elapsed = time.time() - start
+        print(
+            "write  %8.3f s  %6d bytes/read  %d bytes index"
+            % (elapsed, os.path.getsize(path) // count, os.path.getsize(path + ".idx"))
+        )
+        start = time.time()
+        total = 0
+        for it in GXDLMSCaptureLog(path).replay(client):
+            total += len(it.value)
+        elapsed = time.time() - start
+        print("replay %8.3f s  %8.0f rows/s" % (elapsed, total / elapsed))
+    finally:
+        os.remove(path)
+        os.remove(path + ".idx")
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
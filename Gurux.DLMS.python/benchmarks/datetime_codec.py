@@ -0,0 +1,97 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for COSEM date-time codec. Profile generic like timestamps
+# are parsed eagerly and lazily and encoded back to bytes.
+#
+# Usage: python datetime_codec.py [count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXByteBuffer, GXDLMSSettings, GXDateTime
+from gurux_dlms.GXTimeZone import GXTimeZone
+from gurux_dlms.internal._GXCommon import _GXCommon
+from gurux_dlms.internal._GXDataInfo import _GXDataInfo
+
+
+def decode(settings, data, count):
+    data.position = 0
+    info = _GXDataInfo()
+    start = time.time()
+    ret = [_GXCommon.getDateTime(settings, data, info) for _ in range(count)]
+    return time.time() - start, ret
+
+
+def report(name, count, elapsed):
+    print("%-22s %8.3f s %12.0f values/s" % (name, elapsed, count / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    settings = GXDLMSSettings(False, None)
+    tm = datetime(2024, 1, 1, tzinfo=GXTimeZone.fromOffset(120))
+    step = timedelta(minutes=15)
+    data = GXByteBuffer()
+    for pos in range(count):
+        _GXCommon.setDateTime(settings, data, GXDateTime(tm + pos * step))
+
+    elapsed, values = decode(settings, data, count)
+    report("decode", count, elapsed)
+    settings.lazyDateTime = True
+    elapsed, lazy = decode(settings, data, count)
+    report("decode lazy", count, elapsed)
+    start = time.time()
+    for it in lazy:
+        it.value  # pylint: disable=pointless-statement
+    report("lazy value access", count, time.time() - start)
+    _, lazy = decode(settings, data, count)
+
+    for name, items in (("encode", values), ("encode lazy", lazy)):
+        buff = GXByteBuffer()
+        start = time.time()
+        for it in items:
+            _GXCommon.setDateTime(settings, buff, it)
+        report(name, count, time.time() - start)
+        if buff.array() != data.array():
+            raise ValueError("Encoded bytes differ.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for encoder plans. Write requests of special days table with
+# 50 entries are generated for given amount of meters with and without
+# encoder plan.
+#
+# Usage: python encoder_plan.py [meter count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXDLMSClient, GXDate
+from gurux_dlms.objects import GXDLMSSpecialDay, GXDLMSSpecialDaysTable
+
+
+def getTable():
+    table = GXDLMSSpecialDaysTable()
+    for pos in range(50):
+        it = GXDLMSSpecialDay()
+        it.index = pos
+        it.date = GXDate(datetime(2024, 1 + pos % 12, 1 + pos % 28))
+        it.dayId = pos % 3
+        table.entries.append(it)
+    return table
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    table = getTable()
+    client = GXDLMSClient(True)
+    start = time.time()
+    for _ in range(count):
+        client.write(table, 2)
+    print("write            %8.3f s" % (time.time() - start))
+    start = time.time()
+    plan = client.getEncoderPlan(table, 2)
+    value = [[it.index, it.date, it.dayId] for it in table.entries]
+    client.writeWithPlan(plan, [(table, value)] * count)
+    print("writeWithPlan    %8.3f s" % (time.time() - start))
+
+
+if __name__ == "__main__":
+    main()
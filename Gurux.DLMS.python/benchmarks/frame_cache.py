@@ -0,0 +1,106 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for frame cache. Many meters are polled with the same settings.
+# Every poll cycle opens the connection and asks few frames and data blocks.
+# Clients share one frame cache.
+#
+# Usage: python frame_cache.py [meter count] [cycles]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXDLMSClient, GXDLMSFrameCache
+from gurux_dlms.enums import Authentication, InterfaceType, RequestTypes
+from gurux_dlms.objects import GXDLMSData
+
+
+def poll(clients, cycles):
+    item = GXDLMSData("0.0.42.0.0.255")
+    count = 0
+    for _ in range(cycles):
+        for client in clients:
+            count += 1
+            client.snrmRequest()
+            count += len(client.aarqRequest())
+            client.read(item, 2)
+            for _ in range(4):
+                client.receiverReady(RequestTypes.FRAME)
+                client.receiverReady(RequestTypes.DATABLOCK)
+            client.keepAlive()
+            count += 10
+    return count
+
+
+def main():
+    meters = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cycles = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    for interfaceType in [InterfaceType.HDLC, InterfaceType.WRAPPER]:
+        for cache in [None, GXDLMSFrameCache()]:
+            best = None
+            for _ in range(3):
+                clients = []
+                for _ in range(meters):
+                    client = GXDLMSClient(
+                        True,
+                        16,
+                        1,
+                        Authentication.LOW,
+                        "12345678",
+                        interfaceType,
+                    )
+                    client.frameCache = cache
+                    clients.append(client)
+                start = time.time()
+                count = poll(clients, cycles)
+                elapsed = time.time() - start
+                if best is None or elapsed < best:
+                    best = elapsed
+            print(
+                "%-8s %-9s %8.3f s  %8.1f us/frame"
+                % (
+                    "HDLC" if interfaceType == InterfaceType.HDLC else "WRAPPER",
+                    "cache" if cache else "no cache",
+                    best,
+                    1000000.0 * best / count,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for General Block Transfer streaming. Profile generic buffer is
+# read from a local server that streams GBT blocks over the wrapper. Blocks
+# are lost with given probability. Transfer time is counted from the round
+# trip time, the link speed and the timeouts. Window size one is the same as
+# acknowledging each block.
+#
+# Usage: python gbt_window.py [row count] [loss %] [round trip time in ms]
+#
+from __future__ import print_function
+import os
+import random
+import struct
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXByteBuffer, GXDLMSClient, GXDLMSGbtWindow, GXReplyData
+from gurux_dlms.enums import Command, InterfaceType
+from gurux_dlms.internal._GXCommon import _GXCommon
+from gurux_dlms.objects import GXDLMSProfileGeneric
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from hdlc_window import getBuffer
+
+# Size of the block data.
+BLOCK_SIZE = 200
+# Link speed in bytes per second.
+BYTES_PER_SECOND = 8000.0
+# Time that client waits for the missing block.
+TIMEOUT = 1.0
+
+
+# pylint: disable=useless-object-inheritance
+class LocalServer(object):
+    #
+    # Server streams the GET response in GBT blocks. Window size and the
+    # first block to send are taken from the acknowledge of the client.
+    #
+    def __init__(self, pdu, loss, rtt):
+        self.blocks = [
+            pdu[pos : pos + BLOCK_SIZE] for pos in range(0, len(pdu), BLOCK_SIZE)
+        ]
+        self.loss = loss
+        self.rtt = rtt
+        self.elapsed = 0
+        self.random = random.Random(1)
+
+    def getWindow(self, first, count):
+        self.elapsed += self.rtt
+        frames = []
+        last = min(first + count, len(self.blocks) + 1) - 1
+        for bn in range(first, last + 1):
+            bc = count
+            if bn == len(self.blocks):
+                bc |= 0x80
+            elif bn != last:
+                bc |= 0x40
+            data = GXByteBuffer()
+            data.setUInt8(Command.GENERAL_BLOCK_TRANSFER)
+            data.setUInt8(bc)
+            data.setUInt16(bn)
+            data.setUInt16(0)
+            _GXCommon.setObjectCount(len(self.blocks[bn - 1]), data)
+            data.set(self.blocks[bn - 1])
+            frame = struct.pack(">HHHH", 1, 1, 16, data.size) + data.array()
+            self.elapsed += len(frame) / BYTES_PER_SECOND
+            if self.random.random() >= self.loss:
+                frames.append(frame)
+        return frames
+
+    def handleAck(self, frame):
+        # Block number acknowledge and window size of the client.
+        bc = frame[9]
+        bna = struct.unpack(">H", bytes(frame[12:14]))[0]
+        return self.getWindow(bna + 1, bc & 0x3F)
+
+
+def read(server, window, peek):
+    client = GXDLMSClient(True, 16, 1)
+    client.interfaceType = InterfaceType.WRAPPER
+    reply = GXReplyData()
+    reply.peek = peek
+    reply.gbtWindow = GXDLMSGbtWindow(client.settings, window)
+    client.read(GXDLMSProfileGeneric("1.0.99.1.0.255"), 2)
+    frames = server.getWindow(1, window)
+    while True:
+        for it in frames:
+            client.getData(GXByteBuffer(it), reply)
+        if not reply.isMoreData():
+            break
+        requests = reply.gbtWindow.getRequests()
+        if not requests:
+            server.elapsed += TIMEOUT
+            requests = reply.gbtWindow.timeout()
+        frames = []
+        for it in requests:
+            frames.extend(server.handleAck(it))
+    return reply.value, reply.gbtWindow.requested
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    loss = (float(sys.argv[2]) if len(sys.argv) > 2 else 2) / 100
+    rtt = (int(sys.argv[3]) if len(sys.argv) > 3 else 300) / 1000.0
+    buffer = getBuffer(count)
+    pdu = bytes((Command.GET_RESPONSE, 1, 0xC1, 0)) + buffer.array()
+    print("%d rows, %d bytes, %d%% loss" % (count, len(pdu), 100 * loss))
+    expected = None
+    for window in (1, 8, 32, 63):
+        for peek in (False, True):
+            server = LocalServer(pdu, loss, rtt)
+            value, requested = read(server, window, peek)
+            if expected is None:
+                expected = value
+            elif value != expected:
+                raise ValueError("Received values differ.")
+            print(
+                "window %-2d peek %-5s %8.2f s  %d blocks asked again"
+                % (window, peek, server.elapsed, requested)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for receiving HDLC frames from the serial port. Data is read few
+# bytes at the time and getData is called after every read. Rescan forgets
+# the state of the partial frame before every call, as older versions did.
+#
+# Usage: python hdlc_receive.py [row count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import (
+    GXByteBuffer,
+    GXDLMS,
+    GXDLMSClient,
+    GXDLMSLNParameters,
+    GXDLMSSettings,
+    GXReplyData,
+)
+from gurux_dlms.enums import Command
+from gurux_dlms.objects import GXDLMSProfileGeneric
+from hdlc_window import getBuffer
+
+
+def getStream(maxInfo, rows):
+    client = GXDLMSClient(True, 16, 1)
+    client.hdlcSettings.maxInfoRX = maxInfo
+    meter = GXDLMSSettings(True, None)
+    meter.clientAddress = 16
+    meter.serverAddress = 1
+    meter.maxPduSize = 0xFFFF
+    meter.hdlc.maxInfoTX = maxInfo
+    data = client.read(GXDLMSProfileGeneric("1.0.99.1.0.255"), 2)[0]
+    GXDLMS.getData(meter, GXByteBuffer(data), GXReplyData(), None)
+    p = GXDLMSLNParameters(
+        meter, 0, Command.GET_RESPONSE, 1, None, getBuffer(rows), 0
+    )
+    return b"".join(bytes(it) for it in GXDLMS.getLnMessages(p))
+
+
+def receive(maxInfo, stream, chunk, rescan):
+    client = GXDLMSClient(True, 16, 1)
+    client.hdlcSettings.maxInfoRX = maxInfo
+    reply = GXReplyData()
+    rd = GXByteBuffer()
+    calls = 0
+    start = time.time()
+    for pos in range(0, len(stream), chunk):
+        rd.set(stream[pos : pos + chunk])
+        if rescan:
+            reply.hdlcScan = None
+        calls += 1
+        while client.getData(rd, reply, None):
+            if not reply.isMoreData():
+                return time.time() - start, calls, len(reply.data)
+            client.settings.getReceiverReady()
+            if rd.position == rd.size:
+                rd.clear()
+                break
+            calls += 1
+    return time.time() - start, calls, len(reply.data)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    for maxInfo in [128, 2030]:
+        stream = getStream(maxInfo, rows)
+        for chunk in [1, 16]:
+            for rescan in [True, False]:
+                best = None
+                for _ in range(3):
+                    elapsed, calls, size = receive(maxInfo, stream, chunk, rescan)
+                    if best is None or elapsed < best:
+                        best = elapsed
+                print(
+                    "frame %4d  read %2d  %-11s %7.3f s  %5.2f us/call  %d bytes"
+                    % (
+                        maxInfo,
+                        chunk,
+                        "rescan" if rescan else "incremental",
+                        best,
+                        1000000.0 * best / calls,
+                        size,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for HDLC sliding window. Profile generic buffer is read from a
+# simulated meter over optical and RS-485 links. Transfer time is counted
+# from the link speed and the turnaround time that is waited every time
+# the sending direction changes. Every n:th new frame that meter sends can
+# be lost to show how REJ and RR after the timeout recover from it. Frames
+# that are sent again are not lost.
+#
+# Usage: python hdlc_window.py [row count] [lose every n:th frame]
+#
+from __future__ import print_function
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import (
+    GXByteBuffer,
+    GXDateTime,
+    GXDLMS,
+    GXDLMSClient,
+    GXDLMSLNParameters,
+    GXDLMSSettings,
+    GXHdlcWindow,
+    GXReplyData,
+)
+from gurux_dlms.enums import Command, DataType
+from gurux_dlms.internal._GXCommon import _GXCommon
+from gurux_dlms.objects import GXDLMSProfileGeneric
+
+# Link name, baud rate and turnaround time in seconds.
+LINKS = [("optical", 9600, 0.05), ("RS-485", 19200, 0.03)]
+
+
+# pylint: disable=useless-object-inheritance
+class SimulatedLink(object):
+    def __init__(self, baudRate, turnaround):
+        self.baudRate = baudRate
+        self.turnaround = turnaround
+        self.elapsed = 0
+
+    def transfer(self, frames):
+        # Start bit, eight data bits and stop bit.
+        size = sum(len(it) for it in frames)
+        self.elapsed += self.turnaround + 10.0 * size / self.baudRate
+
+
+def getBuffer(count):
+    data = GXByteBuffer()
+    data.setUInt8(DataType.ARRAY)
+    _GXCommon.setObjectCount(count, data)
+    start = datetime(2024, 1, 1)
+    for pos in range(count):
+        data.setUInt8(DataType.STRUCTURE)
+        data.setUInt8(3)
+        _GXCommon.setData(
+            None, data, DataType.OCTET_STRING, GXDateTime(start + timedelta(minutes=15 * pos))
+        )
+        _GXCommon.setData(None, data, DataType.UINT8, 0)
+        _GXCommon.setData(None, data, DataType.UINT32, 1000 + pos)
+    return data
+
+
+def read(link, window, buffer, lose):
+    # pylint: disable=too-many-locals
+    client = GXDLMSClient(True, 16, 1)
+    client.hdlcSettings.windowSizeRX = window
+    meter = GXDLMSSettings(True, None)
+    meter.clientAddress = 16
+    meter.serverAddress = 1
+    meter.maxPduSize = 0xFFFF
+    meter.hdlc.windowSizeTX = window
+    # Request is sent as usual.
+    pg = GXDLMSProfileGeneric("1.0.99.1.0.255")
+    data = client.read(pg, 2)[0]
+    link.transfer([data])
+    GXDLMS.getData(meter, GXByteBuffer(data), GXReplyData(), None)
+    p = GXDLMSLNParameters(meter, 0, Command.GET_RESPONSE, 1, None, buffer, 0)
+    sender = GXHdlcWindow(meter)
+    frames = sender.send(GXDLMS.getLnMessages(p))
+    receiver = GXHdlcWindow(client.settings)
+    reply = GXReplyData()
+    count = 0
+    again = 0
+    while True:
+        link.transfer(frames)
+        acks = []
+        for pos, it in enumerate(frames):
+            if pos >= again:
+                count += 1
+                if lose and count % lose == 0:
+                    continue
+            acks.extend(receiver.handleFrame(it, reply))
+        if not reply.isMoreData() and reply.value is not None:
+            break
+        if not acks:
+            # Final frame of the window is lost. Client polls the meter
+            # after the timeout.
+            acks = receiver.timeout()
+        link.transfer(acks)
+        frames = []
+        again = sender.retransmitted
+        for it in acks:
+            frames.extend(sender.handleFrame(it))
+        again = sender.retransmitted - again
+    return reply.value, sender.retransmitted
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    lose = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    buffer = getBuffer(count)
+    print("%d rows, %d bytes" % (count, buffer.size))
+    for name, baudRate, turnaround in LINKS:
+        expected = None
+        for window in (1, 4, 7):
+            link = SimulatedLink(baudRate, turnaround)
+            buffer.position = 0
+            value, retransmitted = read(link, window, buffer, lose)
+            if expected is None:
+                expected = value
+            elif value != expected:
+                raise ValueError("Received values differ.")
+            print(
+                "%-8s window %d %8.2f s  %d frames sent again"
+                % (name, window, link.elapsed, retransmitted)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for import time. Each import is made in a new interpreter
+# with "python -X importtime" and total time and count of imported
+# gurux_dlms modules are shown.
+#
+# Usage: python import_time.py [repeat count]
+#
+from __future__ import print_function
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+IMPORTS = [
+    "import gurux_dlms",
+    "from gurux_dlms.enums import ObjectType",
+    "from gurux_dlms import GXByteBuffer",
+    "from gurux_dlms import GXDLMSTranslator",
+    "from gurux_dlms import GXDLMSClient",
+    "from gurux_dlms.objects import GXDLMSRegister",
+]
+
+
+def measure(statement):
+    """Returns import time in microseconds and count of imported modules."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    ).stderr
+    total = 0
+    count = 0
+    for line in output.splitlines():
+        items = line.split("|")
+        if len(items) == 3 and items[1].strip().isdigit():
+            name = items[2].strip()
+            if name.startswith("gurux_dlms"):
+                count += 1
+            # Top level imports are not indented.
+            if items[2].startswith(" ") and not items[2].startswith("  "):
+                total += int(items[1])
+    return total, count
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for it in IMPORTS:
+        results = [measure(it) for _ in range(repeat)]
+        print(
+            "%-45s %8.1f ms %4d modules"
+            % (it, min(r[0] for r in results) / 1000.0, results[0][1])
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for client metrics. Profile generic buffer is received over
+# HDLC in many sessions without metrics and with shared metrics. Collected
+# metrics are shown at the end.
+#
+# Usage: python metrics.py [session count] [row count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXByteBuffer, GXDLMSClient, GXDLMSMetrics, GXReplyData
+from gurux_dlms.objects import GXDLMSProfileGeneric
+from hdlc_receive import getStream
+
+
+def read(sessions, stream, metrics):
+    pg = GXDLMSProfileGeneric("1.0.99.1.0.255")
+    start = time.perf_counter()
+    for _ in range(sessions):
+        client = GXDLMSClient(True, 16, 1)
+        client.hdlcSettings.maxInfoRX = 128
+        client.metrics = metrics
+        client.read(pg, 2)
+        reply = GXReplyData()
+        bb = GXByteBuffer(stream)
+        while client.getData(bb, reply, None) and reply.isMoreData():
+            client.receiverReady(reply)
+    return time.perf_counter() - start
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    stream = getStream(128, rows)
+    metrics = GXDLMSMetrics()
+    for name, value in [("disabled", None), ("enabled", metrics)]:
+        best = None
+        for _ in range(3):
+            metrics.clear()
+            elapsed = read(sessions, stream, value)
+            if best is None or elapsed < best:
+                best = elapsed
+        print("%-9s %8.3f s  %8.1f us/session" % (name, best, 1000000.0 * best / sessions))
+    print(metrics)
+    decode = metrics.getHistogram("decodeTime")
+    print("decodeTime p50 %g s p99 %g s" % (decode.percentile(50), decode.percentile(99)))
+
+
+if __name__ == "__main__":
+    main()
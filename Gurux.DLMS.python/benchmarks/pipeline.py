@@ -0,0 +1,165 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for request pipelining. Registers are read from a simulated
+# meter that replies after given round trip time. Attributes are read one
+# by one and with the request pipeline using different window sizes. Every
+# fourth value is sent with block transfer.
+#
+# Usage: python pipeline.py [attribute count] [round trip time in ms]
+#
+from __future__ import print_function
+import heapq
+import os
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXByteBuffer, GXDLMSClient, GXDLMSRequestPipeline, GXReplyData
+from gurux_dlms.enums import InterfaceType
+from gurux_dlms.objects import GXDLMSData
+
+# Maximum size of the block that meter sends.
+BLOCK_SIZE = 64
+
+
+# pylint: disable=useless-object-inheritance
+class SimulatedMeter(object):
+    #
+    # Meter replies to GET requests after the round trip time. Value of the
+    # attribute is an octet string. Long values are sent with block
+    # transfer.
+    #
+    def __init__(self, rtt):
+        self.rtt = rtt
+        self.replies = []
+        self.blocks = {}
+
+    def send(self, data):
+        # Wrapper header is 8 bytes.
+        pdu = data[8:]
+        invokeId = pdu[2]
+        if pdu[1] == 1:
+            ln = pdu[5:11]
+            value = bytes(ln) * (1 + 19 * (ln[4] % 4 == 3))
+            value = bytes((9, len(value))) + value
+            if len(value) <= BLOCK_SIZE:
+                reply = bytes((0xC4, 1, invokeId, 0)) + value
+            else:
+                self.blocks[invokeId] = value
+                reply = self.__getBlock(invokeId, 1)
+        else:
+            number = struct.unpack(">I", bytes(pdu[3:7]))[0]
+            reply = self.__getBlock(invokeId, number + 1)
+        frame = struct.pack(">HHHH", 1, 1, 16, len(reply)) + reply
+        heapq.heappush(self.replies, (time.time() + self.rtt, frame))
+
+    def __getBlock(self, invokeId, number):
+        value = self.blocks[invokeId]
+        data = value[(number - 1) * BLOCK_SIZE : number * BLOCK_SIZE]
+        last = int(number * BLOCK_SIZE >= len(value))
+        return (
+            bytes((0xC4, 2, invokeId, last))
+            + struct.pack(">I", number)
+            + bytes((0, len(data)))
+            + data
+        )
+
+    def receive(self):
+        due, frame = heapq.heappop(self.replies)
+        delay = due - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        return frame
+
+
+def getClient():
+    client = GXDLMSClient(True, 16, 1)
+    client.interfaceType = InterfaceType.WRAPPER
+    return client
+
+
+def getObjects(count):
+    return [GXDLMSData("0.0.96.%d.%d.255" % (pos // 250, pos % 250)) for pos in range(count)]
+
+
+def readOneByOne(meter, objects):
+    client = getClient()
+    for it in objects:
+        reply = GXReplyData()
+        data = client.read(it, 2)[0]
+        while True:
+            meter.send(data)
+            if client.getData(GXByteBuffer(meter.receive()), reply):
+                if not reply.isMoreData():
+                    break
+                data = client.receiverReady(reply)
+        client.updateValue(it, 2, reply.value)
+
+
+def readPipelined(meter, objects, window):
+    client = getClient()
+    pipeline = GXDLMSRequestPipeline(client, [(it, 2) for it in objects], window)
+    received = GXByteBuffer()
+    requests = pipeline.getRequests()
+    while not pipeline.isDone():
+        for it in requests:
+            meter.send(it)
+        received.set(meter.receive())
+        requests = pipeline.handleReply(received)
+    return pipeline.values
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    rtt = (int(sys.argv[2]) if len(sys.argv) > 2 else 500) / 1000.0
+    meter = SimulatedMeter(rtt)
+    objects = getObjects(count)
+    start = time.time()
+    readOneByOne(meter, objects)
+    print("one by one        %8.3f s" % (time.time() - start))
+    expected = [it.value for it in objects]
+    for window in (4, 8, 16):
+        objects = getObjects(count)
+        start = time.time()
+        values = readPipelined(meter, objects, window)
+        print("window %-2d         %8.3f s" % (window, time.time() - start))
+        if values != expected:
+            raise ValueError("Pipelined values differ.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for memory usage of profile generic reading. Buffer with given
+# amount of rows and ten columns is parsed and added to the profile
+# generic. Peak resident set size is shown at the end.
+#
+# If baseline directory is given, the same benchmark is run in a new
+# interpreter for both gurux_dlms in the baseline directory and this tree,
+# so peak resident set sizes before and after the change can be compared.
+# Baseline can be created e.g. with "git worktree add /tmp/base <commit>".
+#
+# Usage: python profile_memory.py [row count] [baseline directory]
+#
+from __future__ import print_function
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+# Library root is given from the parent process when baseline is compared.
+sys.path.insert(0, os.environ.get("GURUX_DLMS_ROOT", ROOT))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXByteBuffer, GXDLMSClient, GXDLMSSettings, GXDateTime
+from gurux_dlms.enums import DataType
+from gurux_dlms.GXTimeZone import GXTimeZone
+from gurux_dlms.internal._GXCommon import _GXCommon
+from gurux_dlms.internal._GXDataInfo import _GXDataInfo
+from gurux_dlms.objects import (
+    GXDLMSCaptureObject,
+    GXDLMSClock,
+    GXDLMSProfileGeneric,
+    GXDLMSRegister,
+)
+
+COLUMNS = [
+    DataType.UINT32,
+    DataType.INT16,
+    DataType.FLOAT32,
+    DataType.ENUM,
+    DataType.UINT8,
+    DataType.INT32,
+    DataType.UINT16,
+    DataType.INT8,
+    DataType.FLOAT64,
+]
+
+
+def getBuffer(rows):
+    data = GXByteBuffer()
+    data.setUInt8(DataType.ARRAY)
+    _GXCommon.setObjectCount(rows, data)
+    tm = datetime(2024, 1, 1, tzinfo=GXTimeZone(0))
+    for row in range(rows):
+        data.setUInt8(DataType.STRUCTURE)
+        data.setUInt8(1 + len(COLUMNS))
+        _GXCommon.setData(
+            None, data, DataType.DATETIME, GXDateTime(tm + timedelta(minutes=15 * row))
+        )
+        for type_ in COLUMNS:
+            _GXCommon.setData(None, data, type_, row % 100)
+    return data
+
+
+def getMaxRss():
+    """Returns peak resident set size in MB."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return rss / (1024.0 * 1024.0)
+    return rss / 1024.0
+
+
+def compare(rows, baseline):
+    """Runs benchmark for baseline and this tree in new interpreters."""
+    for name, root in (("baseline", baseline), ("current", ROOT)):
+        if not os.path.isdir(os.path.join(root, "gurux_dlms")):
+            # Baseline can be given as the repository root, too.
+            root = os.path.join(root, "Gurux.DLMS.python")
+        env = dict(os.environ)
+        env["GURUX_DLMS_ROOT"] = os.path.abspath(root)
+        print("%s: %s" % (name, os.path.abspath(root)))
+        sys.stdout.flush()
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), str(rows)],
+            env=env,
+            check=True,
+        )
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    if len(sys.argv) > 2:
+        compare(rows, sys.argv[2])
+        return
+    data = getBuffer(rows)
+    pg = GXDLMSProfileGeneric("1.0.99.1.0.255")
+    pg.captureObjects.append((GXDLMSClock(), GXDLMSCaptureObject(2, 0)))
+    for pos in range(len(COLUMNS)):
+        pg.captureObjects.append(
+            (GXDLMSRegister("1.0.%d.8.0.255" % (pos + 1)), GXDLMSCaptureObject(2, 0))
+        )
+    print("buffer            %8.1f MB" % (len(data) / (1024.0 * 1024.0)))
+    start = time.time()
+    value = _GXCommon.getData(GXDLMSSettings(False, None), data, _GXDataInfo())
+    GXDLMSClient().updateValue(pg, 2, value)
+    print(
+        "read %d cells    %8.3f s"
+        % (rows * (1 + len(COLUMNS)), time.time() - start)
+    )
+    print("peak RSS          %8.1f MB" % getMaxRss())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for reading profile generic buffer from GXDLMSServer. Rows are
+# encoded when client asks the next data block. When whole value is asked,
+# buffer is serialized at once as before and kept in long transaction.
+#
+# Usage: python server_stream.py [rows] [max PDU size]
+#
+from __future__ import print_function
+import datetime
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import (
+    GXByteBuffer,
+    GXDateTime,
+    GXDLMSClient,
+    GXDLMSServer,
+    GXReplyData,
+    GXServerReply,
+)
+from gurux_dlms.enums import AccessMode, InterfaceType, SourceDiagnostic
+from gurux_dlms.objects import (
+    GXDLMSAssociationLogicalName,
+    GXDLMSClock,
+    GXDLMSProfileGeneric,
+    GXDLMSRegister,
+)
+
+LN = "1.0.99.1.0.255"
+
+
+class Server(GXDLMSServer):
+    # pylint: disable=unused-argument
+    def __init__(self, rows, wholeValue):
+        GXDLMSServer.__init__(self, True, InterfaceType.WRAPPER)
+        self.wholeValue = wholeValue
+        pg = getProfileGeneric()
+        start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        for pos in range(rows):
+            tm = GXDateTime(start + datetime.timedelta(minutes=15 * pos))
+            pg.buffer.append([tm, pos])
+        self.items.append(GXDLMSAssociationLogicalName())
+        self.items.append(pg)
+        self.initialize()
+
+    def isTarget(self, serverAddress, clientAddress):
+        return True
+
+    def onValidateAuthentication(self, authentication, password):
+        return SourceDiagnostic.NONE
+
+    def onGetAttributeAccess(self, arg):
+        return AccessMode.READ_WRITE
+
+    def onFindObject(self, objectType, sn, ln):
+        return None
+
+    def onPreRead(self, args):
+        for it in args:
+            it.skipMaxPduSize = self.wholeValue
+
+    def onPostRead(self, args):
+        pass
+
+    def onConnected(self, connectionInfo):
+        pass
+
+    def onDisconnected(self, connectionInfo):
+        pass
+
+
+def getProfileGeneric():
+    pg = GXDLMSProfileGeneric(LN)
+    pg.addCaptureObject(GXDLMSClock(), 2, 0)
+    pg.addCaptureObject(GXDLMSRegister("1.0.1.8.0.255"), 2, 0)
+    return pg
+
+
+def read(rows, pduSize, wholeValue, trace):
+    server = Server(rows, wholeValue)
+    client = GXDLMSClient(True)
+    client.interfaceType = InterfaceType.WRAPPER
+    client.maxReceivePDUSize = pduSize
+    stats = {"first": None, "peak": 0, "time": 0}
+
+    def send(data):
+        sr = GXServerReply(data)
+        if trace:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.time()
+        server.handleRequest(sr)
+        elapsed = time.time() - start
+        stats["time"] += elapsed
+        if stats["first"] is None:
+            stats["first"] = elapsed
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1] - before
+            stats["peak"] = max(stats["peak"], peak)
+        return GXByteBuffer(sr.reply)
+
+    reply = GXReplyData()
+    client.getData(send(client.aarqRequest()[0]), reply, None)
+    client.parseAareResponse(reply.data)
+    pg = getProfileGeneric()
+    reply = GXReplyData()
+    stats["time"] = 0
+    stats["first"] = None
+    for data in client.read(pg, 2):
+        client.getData(send(data), reply, None)
+        while reply.isMoreData():
+            client.getData(send(client.receiverReady(reply)), reply, None)
+    client.updateValue(pg, 2, reply.value)
+    if [it[1] for it in pg.buffer] != list(range(rows)):
+        raise ValueError("Invalid rows.")
+    return stats
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    pduSize = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    for wholeValue in [True, False]:
+        #  Memory is traced in own run so it doesn't affect to the timings.
+        stats = read(rows, pduSize, wholeValue, False)
+        tracemalloc.start()
+        stats["peak"] = read(rows, pduSize, wholeValue, True)["peak"]
+        tracemalloc.stop()
+        # First block is not measured if nothing is sent.
+        first = "-" if stats["first"] is None else "%.3f" % stats["first"]
+        print(
+            "%-12s first block %8s s  all blocks %8.3f s  server peak %8d bytes"
+            % (
+                "whole value" if wholeValue else "row by row",
+                first,
+                stats["time"],
+                stats["peak"],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark suite for the hot paths of the library. Each case decodes or
+# encodes synthetic data that is generated once before the measurement.
+# Operations per second is counted from the best of the repeats and the
+# allocation peak from one extra run under tracemalloc.
+#
+# Results can be saved to JSON file and compared later to find
+# regressions. Exit code is one if a case is slower than the baseline
+# more than the allowed tolerance.
+#
+# Usage: python suite.py [-k filter] [-r repeat] [-o results.json]
+#                        [-c baseline.json] [-t tolerance %] [--rows count]
+#
+from __future__ import print_function
+import argparse
+import datetime
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import (
+    AesGcmParameter,
+    GXByteBuffer,
+    GXDateTime,
+    GXDLMSChippering,
+    GXDLMSClient,
+    GXDLMSNotify,
+    GXDLMSSettings,
+    GXDLMSTranslator,
+    GXReplyData,
+    GXStructure,
+    GXTimeZone,
+    GXUInt16,
+    GXUInt32,
+)
+from gurux_dlms.enums import Command, DataType, InterfaceType, Security
+from gurux_dlms.internal._GXCommon import _GXCommon
+from gurux_dlms.internal._GXDataInfo import _GXDataInfo
+from association_view import getAssociationView
+from hdlc_receive import getStream
+from hdlc_window import getBuffer
+
+SYSTEM_TITLE = b"GRX12345"
+BLOCK_CIPHER_KEY = bytearray(range(16))
+AUTHENTICATION_KEY = bytearray(range(16, 32))
+
+
+def profileGeneric(rows):
+    data = getBuffer(rows).array()
+    settings = GXDLMSSettings(False, None)
+
+    def run():
+        _GXCommon.getData(settings, GXByteBuffer(data), _GXDataInfo())
+
+    return run, rows, "rows"
+
+
+def associationView(count):
+    data = getAssociationView(count)
+
+    def run():
+        GXDLMSClient(True).parseObjects(GXByteBuffer(data))
+
+    return run, count, "objects"
+
+
+def hdlcStream(rows):
+    stream = getStream(128, rows)
+
+    def run():
+        client = GXDLMSClient(True, 16, 1)
+        client.hdlcSettings.maxInfoRX = 128
+        reply = GXReplyData()
+        bb = GXByteBuffer(stream)
+        while client.getData(bb, reply, None) and reply.isMoreData():
+            client.settings.getReceiverReady()
+
+    return run, stream.count(b"\x7e\xa8") + 1, "frames"
+
+
+def getParameter(tag):
+    p = AesGcmParameter(tag, SYSTEM_TITLE, BLOCK_CIPHER_KEY, AUTHENTICATION_KEY)
+    p.security = Security.AUTHENTICATION_ENCRYPTION
+    p.invocationCounter = 1
+    return p
+
+
+def getApdus(tag, count):
+    # Get-Response-Normal with one register value.
+    apdus = []
+    for pos in range(count):
+        plain = bytearray([Command.GET_RESPONSE, 1, 0xC1, 0, DataType.UINT32])
+        plain.extend(pos.to_bytes(4, "big"))
+        p = getParameter(tag)
+        p.invocationCounter = pos + 1
+        apdus.append(GXDLMSChippering.encryptAesGcm(p, plain))
+    return apdus
+
+
+def encrypt(tag, count):
+    plain = bytearray([Command.GET_RESPONSE, 1, 0xC1, 0, DataType.UINT32, 0, 0, 0, 1])
+
+    def run():
+        for pos in range(count):
+            p = getParameter(tag)
+            p.invocationCounter = pos + 1
+            GXDLMSChippering.encryptAesGcm(p, plain)
+
+    return run, count, "APDUs"
+
+
+def decrypt(tag, count):
+    apdus = getApdus(tag, count)
+
+    def run():
+        for it in apdus:
+            p = AesGcmParameter(0, SYSTEM_TITLE, BLOCK_CIPHER_KEY, AUTHENTICATION_KEY)
+            GXDLMSChippering.decryptAesGcm(p, GXByteBuffer(it))
+
+    return run, count, "APDUs"
+
+
+def pushNotifications(count):
+    notify = GXDLMSNotify(True, 1, 16, InterfaceType.WRAPPER)
+    now = GXDateTime(datetime.datetime(2024, 1, 1, tzinfo=GXTimeZone(0)))
+    messages = []
+    for pos in range(count):
+        value = GXStructure()
+        value.extend([GXUInt32(pos), now, GXUInt16(pos & 0xFFFF), "push"])
+        bb = GXByteBuffer()
+        _GXCommon.setData(None, bb, DataType.STRUCTURE, value)
+        messages.extend(notify.generateDataNotificationMessages(now, bb))
+
+    def run():
+        receiver = GXDLMSNotify(True, 16, 1, InterfaceType.WRAPPER)
+        for it in messages:
+            reply = GXReplyData()
+            receiver.getData(GXByteBuffer(it), reply)
+
+    return run, len(messages), "messages"
+
+
+def translator(count):
+    settings = GXDLMSSettings(True, None)
+    pdus = []
+    for pos in range(count):
+        bb = GXByteBuffer()
+        bb.setUInt8(Command.GET_RESPONSE)
+        bb.set(bytearray([1, 0xC1, 0]))
+        value = GXStructure()
+        value.extend([GXUInt32(pos), GXUInt16(0), "value"])
+        _GXCommon.setData(settings, bb, DataType.STRUCTURE, value)
+        pdus.append(bb.array())
+    t = GXDLMSTranslator()
+
+    def run():
+        for it in pdus:
+            t.pduToXml(it)
+
+    return run, count, "PDUs"
+
+
+def getCases(rows):
+    return [
+        ("getData profile generic", lambda: profileGeneric(rows)),
+        ("parseObjects association view", lambda: associationView(2000)),
+        ("getData HDLC stream", lambda: hdlcStream(2000)),
+        ("encrypt glo", lambda: encrypt(Command.GLO_GET_RESPONSE, 200)),
+        ("decrypt glo", lambda: decrypt(Command.GLO_GET_RESPONSE, 200)),
+        (
+            "encrypt general-glo-ciphering",
+            lambda: encrypt(Command.GENERAL_GLO_CIPHERING, 200),
+        ),
+        (
+            "decrypt general-glo-ciphering",
+            lambda: decrypt(Command.GENERAL_GLO_CIPHERING, 200),
+        ),
+        ("getData push notification", lambda: pushNotifications(2000)),
+        ("pduToXml translator", lambda: translator(2000)),
+    ]
+
+
+def measure(run, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-k", "--filter", help="Run only cases that contain the text.")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", help="Save results to JSON file.")
+    parser.add_argument("-c", "--compare", help="Compare results to JSON file.")
+    parser.add_argument("-t", "--tolerance", type=float, default=10.0)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    results = {}
+    slower = []
+    for name, create in getCases(args.rows):
+        if args.filter and args.filter not in name:
+            continue
+        run, count, unit = create()
+        best, peak = measure(run, args.repeat)
+        ops = count / best
+        results[name] = {"ops": ops, "unit": unit, "peak": peak}
+        line = "%-32s %10.0f %-10s %8.0f kB peak" % (
+            name,
+            ops,
+            unit + "/s",
+            peak / 1024.0,
+        )
+        if name in baseline:
+            change = 100.0 * (ops - baseline[name]["ops"]) / baseline[name]["ops"]
+            line += " %+7.1f %%" % change
+            if change < -args.tolerance:
+                slower.append(name)
+        print(line)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if slower:
+        print("Slower than baseline: " + ", ".join(slower))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
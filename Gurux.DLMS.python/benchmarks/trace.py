@@ -0,0 +1,88 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for trace formatting. Received data is traced with verbose
+# level when only errors are traced. Eager formatting builds the hex
+# string before the level is checked, tracer checks the level first.
+#
+# Usage: python trace.py [count] [reply size]
+#
+from __future__ import print_function
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXByteBuffer, GXDLMSTracer
+
+ERROR = 1
+VERBOSE = 4
+
+
+def eager(count, data, trace):
+    lines = []
+    start = time.perf_counter()
+    for _ in range(count):
+        line = "RX: " + "\t" + str(data)
+        if trace >= VERBOSE:
+            lines.append(line)
+    return time.perf_counter() - start
+
+
+def lazy(count, data, tracer):
+    start = time.perf_counter()
+    for _ in range(count):
+        tracer.rx(data)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 4096
+    data = GXByteBuffer(bytearray(range(256)) * (size // 256))
+    logging.basicConfig(level=logging.ERROR)
+    tracer = GXDLMSTracer(level=ERROR)
+    for name, func, arg in [("eager", eager, ERROR), ("tracer", lazy, tracer)]:
+        best = None
+        for _ in range(3):
+            elapsed = func(count, data, arg)
+            if best is None or elapsed < best:
+                best = elapsed
+        print("%-7s %8.3f s  %10.3f us/packet" % (name, best, 1000000.0 * best / count))
+
+
+if __name__ == "__main__":
+    main()
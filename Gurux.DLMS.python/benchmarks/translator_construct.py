@@ -0,0 +1,71 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for GXDLMSTranslator construction. Translator tags are built once
+# for each output type and shared. Rebuilding tags shows the cost that each
+# translator paid before.
+#
+# Usage: python translator_construct.py [count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXDLMSTranslator
+from gurux_dlms.enums import TranslatorOutputType
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    for type_ in (TranslatorOutputType.SIMPLE_XML, TranslatorOutputType.STANDARD_XML):
+        start = time.time()
+        for _ in range(count):
+            # pylint: disable=protected-access
+            GXDLMSTranslator._GXDLMSTranslator__createTags(type_, {}, {})
+        rebuild = time.time() - start
+        start = time.time()
+        for _ in range(count):
+            GXDLMSTranslator(type_)
+        shared = time.time() - start
+        print(
+            "%-14s rebuild tags %8.1f us shared tags %8.1f us"
+            % (type_.name, 1e6 * rebuild / count, 1e6 * shared / count)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Throughput benchmark for GXDLMSTranslatorStream.
+# XML output is compared against structured output that skips XML.
+#
+# Usage: python translator_stream.py [frame count] [process count]
+#
+from __future__ import print_function
+import datetime
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXByteBuffer, GXDLMSClient, GXDLMS, GXDLMSSettings, GXDLMSLNParameters
+from gurux_dlms import GXDateTime, GXTimeZone, GXStructure, GXUInt16, GXUInt32
+from gurux_dlms.GXDLMSTranslatorStream import GXDLMSTranslatorStream
+from gurux_dlms.enums import Authentication, Command, DataType, InterfaceType
+from gurux_dlms.internal._GXCommon import _GXCommon
+from gurux_dlms.objects import GXDLMSRegister
+
+
+def createCapture(count):
+    """
+    Create hex trace with GET requests and responses.
+    """
+    client = GXDLMSClient(True, 16, 1, Authentication.NONE, None, InterfaceType.HDLC)
+    settings = GXDLMSSettings(True, None)
+    settings.interfaceType = InterfaceType.HDLC
+    settings.clientAddress = 16
+    settings.serverAddress = 1
+    now = GXDateTime(datetime.datetime(2024, 1, 1, tzinfo=GXTimeZone(0)))
+    lines = []
+    for pos in range(count // 2):
+        item = GXDLMSRegister("1.0.1.8.%d.255" % (pos % 255))
+        for frame in client.read(item, 2):
+            lines.append("TX: 12:00:00\t" + GXByteBuffer.hex(frame))
+        value = GXStructure()
+        value.extend([GXUInt32(pos), now, GXUInt16(0)])
+        bb = GXByteBuffer()
+        _GXCommon.setData(settings, bb, DataType.STRUCTURE, value)
+        p = GXDLMSLNParameters(settings, 0xC1, Command.GET_RESPONSE, 1, None, bb, 0)
+        for frame in GXDLMS.getLnMessages(p):
+            lines.append("RX: 12:00:00\t" + GXByteBuffer.hex(frame))
+    return "\n".join(lines).encode()
+
+
+def measure(name, count, func):
+    start = time.time()
+    total = 0
+    for _ in func():
+        total += 1
+    elapsed = time.time() - start
+    print("%-24s %8d frames %8.2f s %10.0f frames/s" % (name, total, elapsed, count / elapsed))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    capture = createCapture(count)
+    stream = GXDLMSTranslatorStream()
+    measure("split", count, lambda: stream.frames(capture))
+    measure("xml", count, lambda: stream.records(capture))
+    stream.json = True
+    measure("json", count, lambda: stream.records(capture))
+    stream.json = False
+    stream.structured = True
+    measure("structured", count, lambda: stream.records(capture))
+    stream.json = True
+    measure("structured json", count, lambda: stream.records(capture))
+    stream.structured = stream.json = False
+    measure(
+        "xml %d processes" % processes,
+        count,
+        lambda: stream.records(capture, processes, 256),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+#
+# Benchmark for GXDLMSXmlClient compiled message templates.
+# Same XML messages are generated for several meters with and without
+# templates.
+#
+# Usage: python xml_client.py [meter count]
+#
+from __future__ import print_function
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# pylint: disable=wrong-import-position
+from gurux_dlms import GXDLMSXmlClient
+from gurux_dlms.enums import InterfaceType
+
+MESSAGES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "Gurux.DLMS.XmlClient.python",
+    "Messages",
+    "LN",
+)
+
+
+def run(client, files, count, useTemplates):
+    start = time.time()
+    for meter in range(count):
+        client.settings.serverAddress = meter + 1
+        for name in files:
+            if not useTemplates:
+                client.clearTemplates()
+            for it in client.load(name):
+                if it.isRequest() and it.data is not None:
+                    if it.invokeIdIndex != -1:
+                        it.setInvokeId(meter)
+                    client.pduToMessages(it)
+    return time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    files = [os.path.join(MESSAGES, name) for name in sorted(os.listdir(MESSAGES))]
+    client = GXDLMSXmlClient()
+    client.settings.interfaceType = InterfaceType.WRAPPER
+    parsed = run(client, files, count, False)
+    compiled = run(client, files, count, True)
+    print("%-10s %8.2f s %10.0f meters/s" % ("parsed", parsed, count / parsed))
+    print("%-10s %8.2f s %10.0f meters/s" % ("templates", compiled, count / compiled))
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,8 @@
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
 class GXArray(list):
+    __slots__ = ()
+
     def __init__(self, value=None):
         list.__init__(self)
         if value:
@@ -52,6 +52,7 @@ class GXByteBuffer(__base):
     __HEX_ARRAY = "0123456789ABCDEFGH"
     __NIBBLE = 4
     __LOW_BYTE_PART = 0x0F
+    # Buffer grows by half of the capacity so appending is not quadratic.
     __ARRAY_CAPACITY = 10
 
     def __init__(self, value=None):
@@ -220,7 +221,7 @@ class GXByteBuffer(__base):
             self.size += 1
         else:
             if index >= self.capacity:
-                self.capacity = index + self.__ARRAY_CAPACITY
+                self.capacity = index + self.__ARRAY_CAPACITY + self.capacity // 2
             self._data[index] = item
 
     #
@@ -240,7 +241,7 @@ class GXByteBuffer(__base):
             self.size += 2
         else:
             if index + 2 >= self.capacity:
-                self.capacity = index + self.__ARRAY_CAPACITY
+                self.capacity = index + self.__ARRAY_CAPACITY + self.capacity // 2
             self._data[index] = int(((item >> 8) & 0xFF))
             self._data[index + 1] = int((item & 0xFF))
 
@@ -250,7 +251,7 @@ class GXByteBuffer(__base):
             self.size += 4
         else:
             if index + 4 >= self.capacity:
-                self.capacity = index + self.__ARRAY_CAPACITY
+                self.capacity = index + self.__ARRAY_CAPACITY + self.capacity // 2
             self._data[index] = int(((item >> 24) & 0xFF))
             self._data[index + 1] = int(((item >> 16) & 0xFF))
             self._data[index + 2] = int(((item >> 8) & 0xFF))
@@ -262,7 +263,7 @@ class GXByteBuffer(__base):
             self.size += 8
         else:
             if index + 8 >= self.capacity:
-                self.capacity = index + self.__ARRAY_CAPACITY
+                self.capacity = index + self.__ARRAY_CAPACITY + self.capacity // 2
             self._data[self.size] = int(((item >> 56) & 0xFF))
             self._data[self.size + 1] = int(((item >> 48) & 0xFF))
             self._data[self.size + 2] = int(((item >> 40) & 0xFF))
@@ -278,7 +279,7 @@ class GXByteBuffer(__base):
             self.size += 4
         else:
             if index + 4 >= self.capacity:
-                self.capacity = index + self.__ARRAY_CAPACITY
+                self.capacity = index + self.__ARRAY_CAPACITY + self.capacity // 2
             tmp = struct.pack("f", value)
             self._data[self.size] = tmp[3]
             self._data[self.size + 1] = tmp[2]
@@ -291,7 +292,7 @@ class GXByteBuffer(__base):
             self.size += 8
         else:
             if index + 8 >= self.capacity:
-                self.capacity = index + self.__ARRAY_CAPACITY
+                self.capacity = index + self.__ARRAY_CAPACITY + self.capacity // 2
             tmp = struct.pack("d", value)
             # Swap bytes.
             self._data[self.size] = tmp[7]
@@ -490,7 +491,7 @@ class GXByteBuffer(__base):
                 value.position = index + count
             elif value and count != 0:
                 if self.size + count > self.capacity:
-                    self.capacity = self.size + count + self.__ARRAY_CAPACITY
+                    self.capacity = self.size + count + self.__ARRAY_CAPACITY + self.capacity // 2
                 self._data[self.size : self.size + count] = value[index : index + count]
                 self.size += count
 
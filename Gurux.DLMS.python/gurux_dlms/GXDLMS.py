@@ -32,6 +32,7 @@
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
 from __future__ import print_function
+import time
 from .GXByteBuffer import GXByteBuffer
 from .internal._GXCommon import _GXCommon
 from .internal._GXDataInfo import _GXDataInfo
@@ -156,7 +157,7 @@ class GXDLMS:
             )
             p.gbtWindowSize = reply.gbtWindowSize
             p.blockNumberAck = reply.blockNumber
-            p.blockIndex = settings.blockNumber
+            p.blockIndex = settings.blockIndex
             reply = GXDLMS.getLnMessages(p)
         else:
             #  Get next block.
@@ -375,7 +376,7 @@ class GXDLMS:
                 else:
                     pos = len(reply)
                     _GXCommon.setData(
-                        p.settings, reply, DataType.OCTET_STRING, p.getTime()
+                        p.settings, reply, DataType.OCTET_STRING, p.time
                     )
                     if p.command != Command.EVENT_NOTIFICATION:
                         reply.move(pos + 1, pos, len(reply) - pos - 1)
@@ -660,10 +661,28 @@ class GXDLMS:
         s.security = cipher.security
         s.securitySuite = cipher.securitySuite
         s.invocationCounter = cipher.invocationCounter
-        tmp = GXCiphering.encrypt(s, data)
+        tmp = GXDLMS.__encrypt(p.settings, s, data)
         cipher.invocationCounter = cipher.invocationCounter + 1
         return tmp
 
+    @classmethod
+    def __encrypt(cls, settings, p, data):
+        if not settings.metrics:
+            return GXCiphering.encrypt(p, data)
+        start = time.perf_counter()
+        ret = GXCiphering.encrypt(p, data)
+        settings.metrics.observe("cipherTime", time.perf_counter() - start)
+        return ret
+
+    @classmethod
+    def __decrypt(cls, settings, p, data):
+        if not settings.metrics:
+            return GXCiphering.decrypt(settings.cipher, p, data)
+        start = time.perf_counter()
+        ret = GXCiphering.decrypt(settings.cipher, p, data)
+        settings.metrics.observe("cipherTime", time.perf_counter() - start)
+        return ret
+
     @classmethod
     def getLnMessages(cls, p):
         reply = GXByteBuffer()
@@ -850,7 +869,7 @@ class GXDLMS:
             )
             s.security = cipher.security
             s.invocationCounter = cipher.invocationCounter
-            tmp = GXCiphering.encrypt(s, reply.array())
+            tmp = GXDLMS.__encrypt(p.settings, s, reply.array())
             assert not tmp
             reply.size = 0
             if p.settings.interfaceType in (
@@ -922,6 +941,9 @@ class GXDLMS:
             else:
                 data.move(data.position, 0, len(data) - data.position)
                 data.position = 0
+        if settings.metrics:
+            settings.metrics.increment("framesSent")
+            settings.metrics.increment("bytesSent", len(bb))
         return bb.array()
 
     @classmethod
@@ -951,23 +973,20 @@ class GXDLMS:
             frameSize -= 3
         if not data:
             len1 = 0
-            bb.setUInt8(0xA0)
         elif len(data) - data.position <= frameSize:
             len1 = len(data) - data.position
-            bb.setUInt8(
-                0xA0
-                | (((len(secondaryAddress) + len(primaryAddress) + len1) >> 8) & 0x7)
-            )
         else:
             len1 = frameSize
-            bb.setUInt8(
-                0xA8
-                | (((len(secondaryAddress) + len(primaryAddress) + len1) >> 8) & 0x7)
-            )
         if len1 == 0:
-            bb.setUInt8(5 + len(secondaryAddress) + len(primaryAddress) + len1)
+            frameLen = 5 + len(secondaryAddress) + len(primaryAddress)
+        else:
+            frameLen = 7 + len(secondaryAddress) + len(primaryAddress) + len1
+        #  High bits of the frame length are in the frame format field.
+        if data and len1 != len(data) - data.position:
+            bb.setUInt8(0xA8 | ((frameLen >> 8) & 0x7))
         else:
-            bb.setUInt8(7 + len(secondaryAddress) + len(primaryAddress) + len1)
+            bb.setUInt8(0xA0 | ((frameLen >> 8) & 0x7))
+        bb.setUInt8(frameLen & 0xFF)
         bb.set(primaryAddress)
         bb.set(secondaryAddress)
         if frame_ == 0:
@@ -988,6 +1007,9 @@ class GXDLMS:
                 else:
                     data.move(data.position, 0, len(data) - data.position)
                     data.position = 0
+        if settings.metrics:
+            settings.metrics.increment("framesSent")
+            settings.metrics.increment("bytesSent", len(bb))
         return bb.array()
 
     @classmethod
@@ -1106,6 +1128,34 @@ class GXDLMS:
         frameLen = 0
         crc = 0
         crcRead = 0
+        # Scanner state is [buffer, frame start, frame format, frame length,
+        # FCS position, running FCS].
+        scan = data.hdlcScan
+        if (
+            scan
+            and scan[0] is reply
+            and reply.position <= scan[1]
+            and scan[4] <= len(reply)
+            and reply[scan[1]] == _GXCommon.HDLC_FRAME_START_END
+            and reply[scan[1] + 1] == scan[2]
+            and reply[scan[1] + 2] == scan[3] & 0xFF
+        ):
+            end = scan[1] + scan[3] - 1
+            #  Frame is still incomplete. Count FCS only for new bytes.
+            if len(reply) <= end + 2:
+                if scan[4] < end:
+                    pos = min(len(reply), end)
+                    scan[5] = _GXFCS16.updateFCS16(
+                        scan[5], reply, scan[4], pos - scan[4]
+                    )
+                    scan[4] = pos
+                data.complete = False
+                if notify:
+                    notify.complete = False
+                return 0
+        else:
+            scan = None
+        data.hdlcScan = None
         if reply.size - reply.position < 9:
             data.complete = False
             if notify:
@@ -1138,6 +1188,14 @@ class GXDLMS:
             data.complete = False
             if notify:
                 notify.complete = False
+            data.hdlcScan = [
+                reply,
+                packetStartID,
+                frame_,
+                frameLen,
+                packetStartID + 3,
+                _GXFCS16.updateFCS16(0xFFFF, reply, packetStartID + 1, 2),
+            ]
             reply.position = packetStartID
             return 0
         eopPos = frameLen + packetStartID + 1
@@ -1169,12 +1227,14 @@ class GXDLMS:
         # HDLC control fields
         cf = reply.getUInt8()
         if data.xml is None and not settings.checkFrame(cf, data.xml):
+            if settings.metrics:
+                settings.metrics.increment("retransmissions")
             reply.position = eopPos + 1
             return GXDLMS.getHdlcData(server, settings, reply, data, notify)
         if not isNotify and notify and cf in (0x13, 0x3):
             isNotify = True
-            notify.clientAddress = addresses[1]
-            notify.serverAddress = addresses[0]
+            notify.targetAddress = addresses[1]
+            notify.sourceAddress = addresses[0]
         if (frame_ & 0x8) != 0:
             if isNotify:
                 notify.moreData = notify.moreData | RequestTypes.FRAME
@@ -1190,13 +1250,23 @@ class GXDLMS:
         )
         crcRead = reply.getUInt16()
         if crc != crcRead:
+            if settings.metrics:
+                settings.metrics.increment("crcErrors")
             if len(reply) - reply.position > 8:
                 return GXDLMS.getHdlcData(server, settings, reply, data, notify)
             raise Exception("Wrong CRC.")
         if reply.position != packetStartID + frameLen + 1:
-            crc = _GXFCS16.countFCS16(reply, packetStartID + 1, frameLen - 2)
+            if scan and scan[1] == packetStartID:
+                end = packetStartID + frameLen - 1
+                crc = _GXFCS16.finalFCS16(
+                    _GXFCS16.updateFCS16(scan[5], reply, scan[4], end - scan[4])
+                )
+            else:
+                crc = _GXFCS16.countFCS16(reply, packetStartID + 1, frameLen - 2)
             crcRead = reply.getUInt16(packetStartID + frameLen - 1)
             if crc != crcRead:
+                if settings.metrics:
+                    settings.metrics.increment("crcErrors")
                 raise Exception("Wrong CRC.")
             if isNotify:
                 notify.packetLength = eopPos - 2
@@ -1334,15 +1404,8 @@ class GXDLMS:
                     target = notify
                     isData = False
                 value = buff.getUInt16()
+                # Buffer can hold several frames when requests are pipelined.
                 compleate = not (len(buff) - buff.position) < value
-                if compleate and (len(buff) - buff.position) != value:
-                    print(
-                        "Data length is "
-                        + str(value)
-                        + "and there are "
-                        + str(len(buff) - buff.position)
-                        + " bytes."
-                    )
                 target.complete = compleate
                 if not compleate:
                     buff.position = pos
@@ -2527,7 +2590,10 @@ class GXDLMS:
         gbtWindowSize = int(bc & 0x3F)
         bn = data.data.getUInt16()
         bna = data.data.getUInt16()
-
+        if data.gbtWindow and not data.xml:
+            # Blocks are received in any order.
+            data.gbtWindow.handleBlock(settings, data, index, bc, bn, bna)
+            return
         if not data.xml:
             # Remove existing data when first block is received.
             if bn == 1:
@@ -2868,7 +2934,7 @@ class GXDLMS:
                     settings.cipher.blockCipherKey,
                     settings.cipher.authenticationKey,
                 )
-            tmp = GXCiphering.decrypt(settings.cipher, p, data.data)
+            tmp = GXDLMS.__decrypt(settings, p, data.data)
             if data.isComplete and (data.moreData & RequestTypes.FRAME) == 0:
                 # pylint: disable=W0212
                 settings._onPduEventHandler(data.moreData == 0, tmp)
@@ -2911,7 +2977,7 @@ class GXDLMS:
                         settings.cipher.blockCipherKey,
                         settings.cipher.authenticationKey,
                     )
-                data.data.set(GXCiphering.decrypt(settings.cipher, p, bb))
+                data.data.set(GXDLMS.__decrypt(settings, p, bb))
                 # pylint: disable=W0212
                 settings._onPduEventHandler(data.moreData == 0, data.data.array())
                 data.cipheredCommand = data.command
@@ -2932,7 +2998,7 @@ class GXDLMS:
                 settings.cipher.blockCipherKey,
                 settings.cipher.authenticationKey,
             )
-            tmp = GXCiphering.decrypt(settings.cipher, p, data.data)
+            tmp = GXDLMS.__decrypt(settings, p, data.data)
             # pylint: disable=W0212
             settings._onPduEventHandler(data.moreData == 0, tmp)
             data.data.clear()
@@ -3075,6 +3141,10 @@ class GXDLMS:
             GXDLMS.getDataFromFrame(
                 reply, target, GXDLMS.useHdlc(settings.interfaceType)
             )
+        metrics = settings.metrics
+        if metrics:
+            metrics.increment("framesReceived")
+            metrics.increment("bytesReceived", reply.position - index)
         # If keepalive or get next frame request.
         if data.xml or (
             (frame_ not in (0x13, 0x3) or data.isMoreData()) and (frame_ & 0x1) != 0
@@ -3088,7 +3158,12 @@ class GXDLMS:
         if frame_ == 0x13 and not target.isMoreData():
             target.data.position = 0
 
-        GXDLMS.getPdu(settings, target)
+        if metrics:
+            start = time.perf_counter()
+            GXDLMS.getPdu(settings, target)
+            metrics.observe("decodeTime", time.perf_counter() - start)
+        else:
+            GXDLMS.getPdu(settings, target)
         if notify and not isNotify:
             # Check command to make sure it's not notify message.
             if data.command in (
@@ -3122,7 +3197,6 @@ class GXDLMS:
         offset = len(data)
         cnt = info.packetLength - reply.position
         if cnt != 0:
-            data.capacity = offset + cnt
             data.set(reply, reply.position, cnt)
             if hdlc:
                 reply.position = reply.position + 3
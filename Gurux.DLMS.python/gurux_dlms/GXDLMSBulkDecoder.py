@@ -0,0 +1,196 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from .GXByteBuffer import GXByteBuffer
+from .GXDLMSExporter import GXDLMSExporter
+from .GXDLMSSettings import GXDLMSSettings
+from .GetCommandType import GetCommandType
+from .enums import Command, DataType
+from .internal._GXCommon import _GXCommon
+
+# Column types that are used in the worker process.
+_WORKER_TYPES = None
+
+
+def _initWorker(types):
+    # pylint: disable=global-statement
+    global _WORKER_TYPES
+    _WORKER_TYPES = types
+
+
+def _decodeBuffer(data):
+    return GXDLMSBulkDecoder.decodeColumns(data, _WORKER_TYPES)
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSBulkDecoder(object):
+    #
+    # This class is used to decode many profile generic buffers at once.
+    #
+    # Buffers can be read from several meters or loaded from the archived
+    # raw reads. Each buffer is decoded independently, so buffers can be
+    # decoded in worker processes. Only raw bytes are sent to the worker
+    # and the decoded rows are returned as columns. Integer and float
+    # columns are returned as arrays, so they are fast to send back.
+    #
+    # Buffer is the received value of the profile generic buffer attribute
+    # or a complete Get-Response-Normal APDU. Block transfer must be
+    # completed before decoding.
+    #
+
+    #
+    # Constructor.
+    #
+    # @param pg
+    #            Profile generic. Capture objects are used to name the
+    #            columns and to convert octet strings to date-times. Columns
+    #            are numbered if not given.
+    #
+    def __init__(self, pg=None):
+        self.columns = None
+        self.types = None
+        if pg is not None:
+            if not pg.captureObjects:
+                raise ValueError("Read capture objects first.")
+            self.columns = []
+            self.types = []
+            for k, v in pg.captureObjects:
+                name = k.logicalName + ":" + str(v.attributeIndex)
+                if v.dataIndex:
+                    name += ":" + str(v.dataIndex)
+                self.columns.append(name)
+                self.types.append(k.getUIDataType(v.attributeIndex))
+
+    #
+    # Decode buffers.
+    #
+    # @param buffers
+    #            Buffers as bytes, bytearray or GXByteBuffer.
+    # @param processes
+    #            Amount of worker processes. Zero uses current process.
+    # @param chunksize
+    #            Amount of buffers sent to the worker at once.
+    # Generator of results in the same order as buffers. Result is a
+    # dictionary with column names and values. Error is returned in the
+    # result and decoding continues with the next buffer.
+    #
+    def decode(self, buffers, processes=0, chunksize=1):
+        buffers = (self.__toBytes(it) for it in buffers)
+        if not processes:
+            for it in buffers:
+                yield self.__toResult(self.decodeColumns(it, self.types))
+            return
+        with ProcessPoolExecutor(processes, None, _initWorker, (self.types,)) as pool:
+            for it in pool.map(_decodeBuffer, buffers, chunksize=chunksize):
+                yield self.__toResult(it)
+
+    def __toResult(self, columns):
+        if isinstance(columns, str):
+            return {"error": columns, "rows": 0, "columns": {}}
+        if self.columns and len(self.columns) == len(columns):
+            names = self.columns
+        else:
+            names = [str(pos) for pos in range(len(columns))]
+        rows = len(columns[0]) if columns else 0
+        return {"error": None, "rows": rows, "columns": dict(zip(names, columns))}
+
+    @classmethod
+    def __toBytes(cls, data):
+        if isinstance(data, GXByteBuffer):
+            return bytes(data.array())
+        return bytes(data)
+
+    #
+    # Decode one buffer to columns.
+    #
+    # @param data
+    #            Buffer as bytes.
+    # @param types
+    #            UI data types of the columns or None.
+    # List of columns or error message.
+    #
+    @classmethod
+    def decodeColumns(cls, data, types=None):
+        # pylint: disable=broad-except
+        settings = GXDLMSSettings(False, None)
+        try:
+            bb = GXByteBuffer(data)
+            cls.__skipApduHeader(bb)
+            columns = None
+            for row in GXDLMSExporter.getRows(bb, settings):
+                if columns is None:
+                    columns = [[] for _ in row]
+                for pos, value in enumerate(row):
+                    if (
+                        types
+                        and pos < len(types)
+                        and types[pos] != DataType.NONE
+                        and isinstance(value, bytearray)
+                    ):
+                        value = _GXCommon.changeType(settings, value, types[pos])
+                    columns[pos].append(value)
+        except Exception as ex:
+            return str(ex)
+        if columns is None:
+            return []
+        return [cls.__compact(it) for it in columns]
+
+    #
+    # Move position to the data if the buffer is Get-Response-Normal APDU.
+    #
+    @classmethod
+    def __skipApduHeader(cls, bb):
+        if len(bb) < 4 or bb.getUInt8(0) != Command.GET_RESPONSE:
+            return
+        if bb.getUInt8(1) != GetCommandType.NORMAL:
+            raise ValueError("Only Get-Response-Normal is supported.")
+        if bb.getUInt8(3) != 0:
+            raise ValueError("Data access error " + str(bb.getUInt8(4)) + ".")
+        bb.position = 4
+
+    #
+    # Integer and float columns are stored to arrays. Values in the
+    # arrays are plain numbers without the DLMS data type.
+    #
+    @classmethod
+    def __compact(cls, values):
+        if all(isinstance(it, int) and not isinstance(it, bool) for it in values):
+            try:
+                return array("q", values)
+            except OverflowError:
+                return values
+        if all(isinstance(it, float) for it in values):
+            return array("d", values)
+        return values
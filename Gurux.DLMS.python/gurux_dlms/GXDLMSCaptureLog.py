@@ -0,0 +1,270 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import os
+import struct
+import time
+from .GXByteBuffer import GXByteBuffer
+from .GXDLMSCaptureRecord import GXDLMSCaptureRecord
+from .enums import ObjectType
+from .internal._GXCommon import _GXCommon
+from .internal._GXDataInfo import _GXDataInfo
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSCaptureLog(object):
+    #
+    # This class is used to save received replies and decode them later.
+    #
+    # Client writes the received data of each read to the log when
+    # GXDLMSClient.captureLog is set. Data is saved after it's deciphered
+    # and data blocks are combined, so the log can be decoded again without
+    # the meter or the keys.
+    #
+    # Log is two append-only files. The data file has parameters and data
+    # of the replies. The index file has a fixed size entry for each reply
+    # and it's used to find the replies without reading the data file.
+    #
+
+    # Offset, time, object type, short name, logical name, attribute index,
+    # selector, parameters size and data size.
+    __INDEX = struct.Struct(">QdHH6sBBHI")
+
+    #
+    # Constructor.
+    #
+    # @param path
+    #            Data file name. Index file name is data file name with
+    #            .idx extension.
+    #
+    def __init__(self, path):
+        self.path = path
+        self.__data = None
+        self.__index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.close()
+
+    #
+    # Close the log files.
+    #
+    def close(self):
+        if self.__data:
+            self.__data.close()
+            self.__index.close()
+            self.__data = None
+            self.__index = None
+
+    #
+    # Write buffered records to the log files.
+    #
+    def flush(self):
+        if self.__data:
+            self.__data.flush()
+            self.__index.flush()
+
+    #
+    # Add reply to the log.
+    #
+    # @param objectType
+    #            Object type of the read object.
+    # @param name
+    #            Logical name or short name of the read object.
+    # @param attributeIndex
+    #            Attribute index.
+    # @param access
+    #            Selector and encoded access parameters or None.
+    # @param data
+    #            Received data.
+    #
+    # pylint: disable=too-many-arguments
+    def add(self, objectType, name, attributeIndex, access, data):
+        if self.__data is None:
+            self.__data = open(self.path, "ab")
+            self.__index = open(self.path + ".idx", "ab")
+        self.__data.seek(0, os.SEEK_END)
+        offset = self.__data.tell()
+        if isinstance(name, str):
+            ln = bytes(_GXCommon.logicalNameToBytes(name))
+            sn = 0
+        else:
+            ln = bytes(6)
+            sn = name
+        if access:
+            selector = access[0]
+            parameters = bytes(access[1:])
+        else:
+            selector = 0
+            parameters = b""
+        if isinstance(data, GXByteBuffer):
+            data = data.array()
+        self.__data.write(parameters)
+        self.__data.write(data)
+        self.__index.write(
+            self.__INDEX.pack(
+                offset,
+                time.time(),
+                int(objectType),
+                sn,
+                ln,
+                attributeIndex,
+                selector,
+                len(parameters),
+                len(data),
+            )
+        )
+
+    #
+    # Read records from the log.
+    #
+    # @param objectType
+    #            Only records of this object type are read if given.
+    # @param name
+    #            Only records of this logical or short name are read if
+    #            given.
+    # Generator of GXDLMSCaptureRecord in the order they are added.
+    #
+    def records(self, objectType=ObjectType.NONE, name=None):
+        self.flush()
+        size = self.__INDEX.size
+        with open(self.path + ".idx", "rb") as index:
+            with open(self.path, "rb") as data:
+                while True:
+                    entry = index.read(size)
+                    # Last entry is not complete if writing was interrupted.
+                    if len(entry) != size:
+                        break
+                    (
+                        offset,
+                        time_,
+                        ot,
+                        sn,
+                        ln,
+                        attributeIndex,
+                        selector,
+                        parametersSize,
+                        dataSize,
+                    ) = self.__INDEX.unpack(entry)
+                    if objectType not in (ObjectType.NONE, ot):
+                        continue
+                    ln = _GXCommon.toLogicalName(bytearray(ln))
+                    if name is not None and name not in (ln, sn):
+                        continue
+                    data.seek(offset)
+                    record = GXDLMSCaptureRecord()
+                    record.time = time_
+                    record.objectType = ObjectType(ot)
+                    record.logicalName = ln
+                    record.shortName = sn
+                    record.attributeIndex = attributeIndex
+                    record.selector = selector
+                    record.parameters = data.read(parametersSize)
+                    record.data = data.read(dataSize)
+                    yield record
+
+    #
+    # Decode the records again and update the objects. Meter is not
+    # needed. Records of the objects that are not in the collection are
+    # decoded, but not saved.
+    #
+    # @param client
+    #            Client that is used to update the values. Object list of
+    #            the client is used if objects are not given.
+    # @param objects
+    #            Objects that are updated.
+    # @param objectType
+    #            Only records of this object type are replayed if given.
+    # @param name
+    #            Only records of this logical or short name are replayed if
+    #            given.
+    # Generator of GXDLMSCaptureRecord where target and value are set.
+    #
+    # pylint: disable=too-many-arguments
+    def replay(self, client, objects=None, objectType=ObjectType.NONE, name=None):
+        if objects is None:
+            objects = client.objects
+        for record in self.records(objectType, name):
+            info = _GXDataInfo()
+            value = _GXCommon.getData(client.settings, GXByteBuffer(record.data), info)
+            if record.shortName:
+                target = objects.findBySN(record.shortName)
+            else:
+                target = objects.findByLN(record.objectType, record.logicalName)
+            if target is not None:
+                columns = None
+                if (
+                    record.objectType == ObjectType.PROFILE_GENERIC
+                    and record.attributeIndex == 2
+                ):
+                    # Rows are not added to the rows of the earlier read.
+                    target.buffer = []
+                    if record.selector:
+                        columns = self.__getColumns(client, target, record)
+                value = client.updateValue(target, record.attributeIndex, value, columns)
+            record.target = target
+            record.value = value
+            yield record
+
+    #
+    # Get the columns that are read with selective access. None is
+    # returned if all the columns are read.
+    #
+    @classmethod
+    def __getColumns(cls, client, pg, record):
+        info = _GXDataInfo()
+        parameters = _GXCommon.getData(
+            client.settings, GXByteBuffer(record.parameters), info
+        )
+        if record.selector == 2:
+            if len(parameters) < 4 or parameters[3] == 0:
+                return None
+            start = parameters[2] - 1
+            return pg.captureObjects[start : start + parameters[3]]
+        if len(parameters) < 4 or not parameters[3]:
+            return None
+        columns = []
+        for it in parameters[3]:
+            ln = _GXCommon.toLogicalName(it[1])
+            for k, v in pg.captureObjects:
+                if (
+                    k.objectType == it[0]
+                    and k.logicalName == ln
+                    and v.attributeIndex == it[2]
+                    and v.dataIndex == it[3]
+                ):
+                    columns.append((k, v))
+                    break
+        return columns
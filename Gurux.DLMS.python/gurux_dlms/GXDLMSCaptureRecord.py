@@ -0,0 +1,77 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from .enums import ObjectType
+
+
+# pylint: disable=useless-object-inheritance,too-few-public-methods,too-many-instance-attributes
+class GXDLMSCaptureRecord(object):
+    #
+    # One captured reply in the capture log.
+    #
+    __slots__ = (
+        "time",
+        "objectType",
+        "logicalName",
+        "shortName",
+        "attributeIndex",
+        "selector",
+        "parameters",
+        "data",
+        "target",
+        "value",
+    )
+
+    def __init__(self):
+        # Time when the reply was received as POSIX time stamp.
+        self.time = 0
+        # Object type of the read object.
+        self.objectType = ObjectType.NONE
+        # Logical name of the read object.
+        self.logicalName = None
+        # Short name of the read object. Zero if logical name referencing is
+        # used.
+        self.shortName = 0
+        # Read attribute index.
+        self.attributeIndex = 0
+        # Selector of the selective access. Zero if selective access is not
+        # used.
+        self.selector = 0
+        # Encoded access parameters.
+        self.parameters = None
+        # Received data. Data is deciphered and data blocks are combined.
+        self.data = None
+        # Replay sets the object that was updated.
+        self.target = None
+        # Replay sets the decoded value.
+        self.value = None
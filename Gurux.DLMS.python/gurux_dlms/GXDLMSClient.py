@@ -32,6 +32,8 @@
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
 from __future__ import print_function
+import time
+from datetime import datetime
 from .GXDLMSSettings import GXDLMSSettings
 from .enums import (
     Authentication,
@@ -39,6 +41,7 @@ from .enums import (
     SourceDiagnostic,
     DataType,
     Conformance,
+    Security,
 )
 from .ConnectionState import ConnectionState
 from .GXByteBuffer import GXByteBuffer
@@ -60,6 +63,7 @@ from .GXDLMSSNParameters import GXDLMSSNParameters
 from .VariableAccessSpecification import VariableAccessSpecification
 from .GXSecure import GXSecure
 from .GXDLMSConverter import GXDLMSConverter
+from .GXDLMSEncoderPlan import GXDLMSEncoderPlan
 from .GXDLMSLNCommandHandler import GXDLMSLNCommandHandler
 from .GXDLMSSNCommandHandler import GXDLMSSNCommandHandler
 from .enums.AccessServiceCommandType import AccessServiceCommandType
@@ -68,10 +72,6 @@ from .GXDLMSTranslatorStructure import GXDLMSTranslatorStructure
 from .enums.RequestTypes import RequestTypes
 from .SerialnumberCounter import SerialNumberCounter
 from ._GXObjectFactory import _GXObjectFactory
-from .enums.AccessMode import AccessMode
-from .enums.MethodAccessMode import MethodAccessMode
-from .enums.AccessMode3 import AccessMode3
-from .enums.MethodAccessMode3 import MethodAccessMode3
 from .internal._GXLocalizer import _GXLocalizer
 from .ecdsa.GXEcdsa import GXEcdsa
 
@@ -124,6 +124,19 @@ class GXDLMSClient(object):
         # If protected release is used release is including a ciphered xDLMS
         # Initiate request.
         self.useProtectedRelease = False
+        # Frame cache. SNRM, AARQ, receiver ready, keep alive and next data
+        # block requests are not generated again when cache is set. Same
+        # cache can be shared between the clients.
+        self.frameCache = None
+        # Capture log. Received data of the read requests is saved to the
+        # log when it's set. See GXDLMSCaptureLog.
+        self.captureLog = None
+        # Requests that are waiting for the reply to capture. Key is invoke
+        # ID or None with short name referencing.
+        self.__captureRequests = {}
+        # Start time and received replies of the operation whose reply is
+        # not received yet. This is used only with metrics.
+        self.__operation = None
 
         # Initialize challenge that is restored after the connection is closed.
         self.initializeChallenge = None
@@ -222,7 +235,9 @@ class GXDLMSClient(object):
     #
     # GBT window size.
     #
-    gbtWndowSize = property(getGbtWindowSize, setGbtWindowSize)
+    gbtWindowSize = property(getGbtWindowSize, setGbtWindowSize)
+    # Misspelled name is kept for compatibility.
+    gbtWndowSize = gbtWindowSize
 
     def getMaxReceivePDUSize(self):
         return self.settings.maxPduSize
@@ -320,6 +335,16 @@ class GXDLMSClient(object):
     dateTimeSkips = property(getDateTimeSkips, setDateTimeSkips)
     """Skipped date time fields. This value can be used if meter can't handle deviation or status."""
 
+    def getLazyDateTime(self):
+        return self.settings.lazyDateTime
+
+    def setLazyDateTime(self, value):
+        self.settings.lazyDateTime = value
+
+    lazyDateTime = property(getLazyDateTime, setLazyDateTime)
+    """Received date-time values are kept as bytes and parsed only when they are accessed.
+    This makes reading of large profile generic buffers faster."""
+
     def getStandard(self):
         return self.settings.standard
 
@@ -461,6 +486,18 @@ class GXDLMSClient(object):
     #
     gateway = property(getGateway, setGateway)
 
+    def getMetrics(self):
+        return self.settings.metrics
+
+    def setMetrics(self, value):
+        self.settings.metrics = value
+
+    #
+    # Metrics. Counters and histograms are not collected when metrics is
+    # None. See GXDLMSMetrics.
+    #
+    metrics = property(getMetrics, setMetrics)
+
     def getProtocolVersion(self):
         return self.settings.protocolVersion
 
@@ -501,6 +538,11 @@ class GXDLMSClient(object):
         #  SNRM request is not used in network connections.
         if self.interfaceType == InterfaceType.WRAPPER:
             return None
+        if self.frameCache is not None:
+            return self.frameCache.getSnrm(self.settings, self.__getSnrmRequest)
+        return self.__getSnrmRequest()
+
+    def __getSnrmRequest(self):
         data = GXByteBuffer(25)
         data.setUInt8(0x81)
         #  FromatID
@@ -559,7 +601,6 @@ class GXDLMSClient(object):
         self.initializePduSize = self.maxReceivePDUSize
         self.initializeChallenge = self.settings.getStoCChallenge()
         self.settings.connected = self.settings.connected & ~ConnectionState.DLMS
-        buff = GXByteBuffer(20)
         self.settings.resetBlockIndex()
         GXDLMS.checkInit(self.settings)
         self.settings.setStoCChallenge(None)
@@ -573,6 +614,12 @@ class GXDLMSClient(object):
                 self.settings.ctoSChallenge = GXSecure.generateChallenge()
         else:
             self.settings.setCtoSChallenge(None)
+        if self.__canCacheFrames() and self.authentication <= Authentication.LOW:
+            return self.frameCache.getAarq(self.settings, self.__getAarqRequest)
+        return self.__getAarqRequest()
+
+    def __getAarqRequest(self):
+        buff = GXByteBuffer(20)
         _GXAPDU.generateAarq(self.settings, self.settings.cipher, None, buff)
         reply = None
         if self.settings.getUseLogicalNameReferencing():
@@ -583,6 +630,18 @@ class GXDLMSClient(object):
             reply = GXDLMS.getSnMessages(p)
         return reply
 
+    #
+    # Frames are cached only when they are not ciphered.
+    #
+    def __canCacheFrames(self):
+        cipher = self.settings.cipher
+        return (
+            self.frameCache is not None
+            and (cipher is None or cipher.security == Security.NONE)
+            and self.interfaceType
+            in (InterfaceType.HDLC, InterfaceType.HDLC_WITH_MODE_E, InterfaceType.WRAPPER)
+        )
+
     #
     # Parses the AARE response.  Parse method will update the following
     #      data:
@@ -832,14 +891,10 @@ class GXDLMSClient(object):
         return reply
 
     @classmethod
-    def __createDLMSObject(
-        cls, classID, version, baseName, ln, accessRights, lnVersion
-    ):
+    def __createDLMSObject(cls, classID, version, baseName, ln):
         type_ = classID
         obj = cls.createObject(type_)
-        GXDLMSClient.__updateObjectData(
-            obj, type_, version, baseName, ln, accessRights, lnVersion
-        )
+        GXDLMSClient.__updateObjectData(obj, type_, version, baseName, ln)
         return obj
 
     def parseSNObjects(self, buff, onlyKnownObjects, ignoreInactiveObjects):
@@ -864,7 +919,7 @@ class GXDLMSClient(object):
             classID = objects[1]
             baseName = int(objects[0]) & 0xFFFF
             comp = GXDLMSClient.__createDLMSObject(
-                classID, objects[2], baseName, objects[3], None, 2
+                classID, objects[2], baseName, objects[3]
             )
             if not onlyKnownObjects or type(comp) != GXDLMSObject:
                 if not ignoreInactiveObjects or comp.logicalName != "0.0.127.0.0.0":
@@ -875,33 +930,8 @@ class GXDLMSClient(object):
         return items
 
     @classmethod
-    def __updateObjectData(
-        cls, obj, objectType, version, baseName, logicalName, accessRights, lnVersion
-    ):
+    def __updateObjectData(cls, obj, objectType, version, baseName, logicalName):
         obj.objectType = objectType
-        if accessRights:
-            for attributeAccess in accessRights[0]:
-                id_ = attributeAccess[0]
-                if id_ > 0:
-                    mode = attributeAccess[1]
-                    if lnVersion < 3:
-                        obj.setAccess(id_, AccessMode(mode))
-                    else:
-                        obj.setAccess3(id_, AccessMode3(mode))
-            for methodAccess in accessRights[1]:
-                id_ = methodAccess[0]
-                tmp = 0
-                if isinstance(methodAccess[1], bool):
-                    if bool((methodAccess)[1]):
-                        tmp = 1
-                    else:
-                        tmp = 0
-                else:
-                    tmp = methodAccess[1]
-                if lnVersion < 3:
-                    obj.setMethodAccess(id_, MethodAccessMode(tmp))
-                else:
-                    obj.setMethodAccess3(id_, MethodAccessMode3(tmp))
         if baseName is not None:
             obj.shortName = int(baseName)
         if version is not None:
@@ -917,13 +947,14 @@ class GXDLMSClient(object):
         else:
             objects = self.parseSNObjects(data, onlyKnownObjects, ignoreInactiveObjects)
         self.settings.objects = objects
-
+        # OBIS code information is updated when it's accessed the first time.
         c = GXDLMSConverter(self.standard)
-        c.updateOBISCodeInformation(objects)
+        for it in objects:
+            it._setConverter(c)
         return objects
 
     def parseLNObjects(self, buff, onlyKnownObjects, ignoreInactiveObjects):
-        # pylint: disable=unidiomatic-typecheck
+        # pylint: disable=unidiomatic-typecheck,protected-access
         size = buff.getInt8()
         if size != 0x01:
             raise Exception("Invalid response.")
@@ -931,54 +962,42 @@ class GXDLMSClient(object):
         info = _GXDataInfo()
         cnt = _GXCommon.getObjectCount(buff)
         lnVersion = 2
+        # Access rights are parsed when they are needed. LN Version is not
+        # known before all objects are read, because some meters don't add
+        # LN Association the first object.
+        accessRights = []
         objPos = 0
-        # Find LN Version because some meters don't add LN Association the first object.
-        pos = buff.position
         while objPos != cnt:
             if buff.position == len(buff):
                 break
-            info.type_ = DataType.NONE
-            info.index = 0
-            info.count = 0
-            objects = _GXCommon.getData(self.settings, buff, info)
-            if len(objects) != 4:
+            buff.getUInt8()
+            if _GXCommon.getObjectCount(buff) != 4:
                 raise Exception("Invalid structure format.")
-            ot = objects[0]
-            # Get LN association version.
-            if (
-                ot == int(ObjectType.ASSOCIATION_LOGICAL_NAME)
-                and _GXCommon.toLogicalName(objects[2]) == "0.0.40.0.0.255"
-            ):
-                lnVersion = int(objects[1])
-                break
-
-        objPos = 0
-        buff.position = pos
-        while objPos != cnt:
-            if buff.position == len(buff):
-                break
-            info.type_ = DataType.NONE
-            info.index = 0
-            info.count = 0
-            objects = _GXCommon.getData(self.settings, buff, info)
-            if len(objects) != 4:
-                raise Exception("Invalid structure format.")
-            classID = objects[0]
+            info.clear()
+            classID = _GXCommon.getData(self.settings, buff, info)
+            info.clear()
+            version = _GXCommon.getData(self.settings, buff, info)
+            info.clear()
+            ln = _GXCommon.getData(self.settings, buff, info)
+            pos = buff.position
+            _GXCommon.skipData(buff)
             if classID > 0:
-                comp = GXDLMSClient.__createDLMSObject(
-                    classID, objects[1], 0, objects[2], objects[3], lnVersion
-                )
+                comp = GXDLMSClient.__createDLMSObject(classID, version, 0, ln)
+                # Get LN association version.
+                if (
+                    classID == ObjectType.ASSOCIATION_LOGICAL_NAME
+                    and comp.logicalName == "0.0.40.0.0.255"
+                ):
+                    lnVersion = int(version)
                 if not onlyKnownObjects or type(comp) != GXDLMSObject:
                     if not ignoreInactiveObjects or comp.logicalName != "0.0.127.0.0.0":
                         items.append(comp)
+                        accessRights.append((comp, pos, buff.position))
                 else:
-                    print(
-                        "Unknown object : "
-                        + str(classID)
-                        + " "
-                        + _GXCommon.toLogicalName(objects[2])
-                    )
+                    print("Unknown object : " + str(classID) + " " + comp.logicalName)
             objPos += 1
+        for comp, pos, end in accessRights:
+            comp._setAccessRights(buff.subArray(pos, end - pos), lnVersion)
         return items
 
     def updateValue(self, target, attributeIndex, value, parameters=None):
@@ -992,6 +1011,7 @@ class GXDLMSClient(object):
         e = ValueEventArgs(self.settings, target, attributeIndex, 0, parameters)
         e.value = value
         target.setValue(self.settings, e)
+        target.setLastReadTime(attributeIndex, datetime.now())
         return target.getValues()[attributeIndex - 1]
 
     @classmethod
@@ -1003,10 +1023,12 @@ class GXDLMSClient(object):
 
     def updateValues(self, list_, values):
         pos = 0
+        now = datetime.now()
         for k, v in list_:
             e = ValueEventArgs(self.settings, k, v, 0, None)
             e.value = values[pos]
             k.setValue(self.settings, e)
+            k.setLastReadTime(v, now)
             pos += 1
 
     @classmethod
@@ -1033,20 +1055,24 @@ class GXDLMSClient(object):
         if not name or methodIndex < 1:
             raise ValueError("Invalid parameter")
         self.settings.resetBlockIndex()
+        self.__startOperation()
         if self.autoIncreaseInvokeID:
             self.settings.setInvokeID(int(((self.settings.invokeId + 1) & 0xF)))
         index = methodIndex
         type_ = dataType
         if type_ == DataType.NONE:
             raise Exception("Invalid parameter. In python value type must give.")
-        reply = None
         data = GXByteBuffer()
-        attributeDescriptor = GXByteBuffer()
         _GXCommon.setData(self.settings, data, type_, value)
+        return self.__methodData(name, data, objectType, index, type_)
+
+    def __methodData(self, name, data, objectType, index, type_):
+        reply = None
+        attributeDescriptor = GXByteBuffer()
         if self.useLogicalNameReferencing:
             attributeDescriptor.setUInt16(objectType)
             attributeDescriptor.set(_GXCommon.logicalNameToBytes(str(name)))
-            attributeDescriptor.setUInt8(int(methodIndex))
+            attributeDescriptor.setUInt8(int(index))
             if type_ == DataType.NONE:
                 attributeDescriptor.setUInt8(0)
             else:
@@ -1103,15 +1129,19 @@ class GXDLMSClient(object):
         if index < 1:
             raise Exception("Invalid parameter")
         self.settings.resetBlockIndex()
+        self.__startOperation()
         if self.autoIncreaseInvokeID:
             self.settings.setInvokeID(int(((self.settings.invokeId + 1) & 0xF)))
         type_ = dataType
         if value is not None and type_ == DataType.NONE:
             raise Exception("Invalid parameter. In python value type must give.")
-        reply = None
         data = GXByteBuffer()
-        attributeDescriptor = GXByteBuffer()
         _GXCommon.setData(self.settings, data, type_, value)
+        return self.__writeData(name, data, objectType, index)
+
+    def __writeData(self, name, data, objectType, index):
+        reply = None
+        attributeDescriptor = GXByteBuffer()
         if self.useLogicalNameReferencing:
             attributeDescriptor.setUInt16(objectType)
             attributeDescriptor.set(_GXCommon.logicalNameToBytes(str(name)))
@@ -1146,12 +1176,50 @@ class GXDLMSClient(object):
             reply = GXDLMS.getSnMessages(p)
         return reply
 
+    #
+    # Compile encoder plan for the attribute. Plan can be used to generate
+    # write requests for several objects or meters with writeWithPlan.
+    #
+    # @param item
+    #            COSEM object.
+    # @param index
+    #            Attribute index.
+    #
+    def getEncoderPlan(self, item, index):
+        return GXDLMSEncoderPlan.compile(self.settings, item, index)
+
+    #
+    # Generate write requests using the encoder plan.
+    #
+    # @param plan
+    #            Encoder plan.
+    # @param list_
+    #            Collection of (COSEM object, value) pairs. Value is given
+    #            in plan schema.
+    # Write requests of each object.
+    #
+    def writeWithPlan(self, plan, list_):
+        if plan.index < 1:
+            raise ValueError("Invalid parameter")
+        messages = []
+        for item, value in list_:
+            self.settings.resetBlockIndex()
+            if self.autoIncreaseInvokeID:
+                self.settings.setInvokeID(int(((self.settings.invokeId + 1) & 0xF)))
+            messages.append(
+                self.__writeData(
+                    item.name, plan.encode(value), item.objectType, plan.index
+                )
+            )
+        return messages
+
     def writeList(self, list_):
         if not list_:
             raise ValueError("Invalid parameter.")
         value = None
         reply = None
         self.settings.resetBlockIndex()
+        self.__startOperation()
         data = GXByteBuffer()
         bb = GXByteBuffer()
         if self.useLogicalNameReferencing:
@@ -1205,8 +1273,20 @@ class GXDLMSClient(object):
         attributeDescriptor = GXByteBuffer()
         reply = None
         self.settings.resetBlockIndex()
+        self.__startOperation()
         if self.autoIncreaseInvokeID:
             self.settings.setInvokeID(int(((self.settings.invokeId + 1) & 0xF)))
+        if self.captureLog is not None:
+            if self.useLogicalNameReferencing:
+                key = self.settings.invokeId & 0xF
+            else:
+                key = None
+            self.__captureRequests[key] = (
+                objectType,
+                name,
+                attributeOrdinal,
+                data.array() if data else None,
+            )
         if self.useLogicalNameReferencing:
             attributeDescriptor.setUInt16(int(objectType))
             attributeDescriptor.set(_GXCommon.logicalNameToBytes(str(name)))
@@ -1259,6 +1339,7 @@ class GXDLMSClient(object):
         messages = []
         data = GXByteBuffer()
         self.settings.resetBlockIndex()
+        self.__startOperation()
         if self.useLogicalNameReferencing:
             p = GXDLMSLNParameters(
                 self.settings,
@@ -1306,6 +1387,11 @@ class GXDLMSClient(object):
     def keepAlive(self):
         if self.interfaceType == InterfaceType.WRAPPER:
             return None
+        if self.__canCacheFrames():
+            return self.frameCache.getReceiverReady(self.settings, self.__getKeepAlive)
+        return self.__getKeepAlive()
+
+    def __getKeepAlive(self):
         return GXDLMS.getHdlcFrame(
             self.settings, self.settings.getReceiverReady(), None
         )
@@ -1425,6 +1511,24 @@ class GXDLMSClient(object):
         return _GXObjectFactory.createObject(type_)
 
     def receiverReady(self, type_):
+        if self.__canCacheFrames():
+            if isinstance(type_, RequestTypes):
+                moreData = type_
+            else:
+                moreData = type_.moreData
+            if (moreData & RequestTypes.FRAME) != 0:
+                if self.interfaceType == InterfaceType.WRAPPER:
+                    return GXDLMS.receiverReady(self.settings, type_)
+                return self.frameCache.getReceiverReady(
+                    self.settings, lambda: GXDLMS.receiverReady(self.settings, type_)
+                )
+            if (
+                moreData == RequestTypes.DATABLOCK
+                and self.settings.getUseLogicalNameReferencing()
+            ):
+                return self.frameCache.getNextDataBlock(
+                    self.settings, lambda: GXDLMS.receiverReady(self.settings, type_)
+                )
         return GXDLMS.receiverReady(self.settings, type_)
 
     def getData(self, reply, data, notify=None):
@@ -1506,8 +1610,43 @@ class GXDLMSClient(object):
                     data.data = data2
             finally:
                 data.data.position = pos
+        if (
+            ret
+            and self.__captureRequests
+            and data.moreData == RequestTypes.NONE
+            and data.command in (Command.GET_RESPONSE, Command.READ_RESPONSE)
+        ):
+            # Replies of pipelined requests are matched by invoke ID.
+            if data.command == Command.GET_RESPONSE:
+                key = data.invokeId & 0xF
+            else:
+                key = None
+            request = self.__captureRequests.pop(key, None)
+            if request and self.captureLog is not None:
+                self.captureLog.add(*request, data=data.data)
+        if ret and self.__operation:
+            self.__operation[1] += 1
+            if data.moreData == RequestTypes.NONE:
+                metrics = self.settings.metrics
+                if metrics:
+                    metrics.observe("roundTrips", self.__operation[1])
+                    metrics.observe(
+                        "operationTime", time.perf_counter() - self.__operation[0]
+                    )
+                self.__operation = None
         return ret
 
+    #
+    # Start counting round trips and time of the new operation.
+    #
+    def __startOperation(self):
+        metrics = self.settings.metrics
+        if metrics:
+            metrics.increment("operations")
+            self.__operation = [time.perf_counter(), 0]
+        else:
+            self.__operation = None
+
     @classmethod
     def getServerAddressFromSerialNumber(
         cls, serialNumber, logicalAddress=1, formula=None
@@ -1544,6 +1683,8 @@ class GXDLMSClient(object):
         raise ValueError("Invalid logical or physical address.")
 
     def accessRequest(self, time, list_):
+        # pylint: disable=redefined-outer-name
+        self.__startOperation()
         bb = GXByteBuffer()
         _GXCommon.setObjectCount(len(list_), bb)
         for it in list_:
@@ -1625,9 +1766,7 @@ class GXDLMSClient(object):
                         classID, _GXCommon.toLogicalName(tmp[1])
                     )
                     if comp is None:
-                        comp = GXDLMSClient.__createDLMSObject(
-                            classID, 0, 0, tmp[1], None, 2
-                        )
+                        comp = GXDLMSClient.__createDLMSObject(classID, 0, 0, tmp[1])
                         self.settings.objects.append(comp)
                         c.updateOBISCodeInformation(comp)
                     if comp.__class__ != GXDLMSObject.__class__:
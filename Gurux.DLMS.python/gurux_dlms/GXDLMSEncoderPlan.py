@@ -0,0 +1,272 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import struct
+from .GXByteBuffer import GXByteBuffer
+from .ValueEventArgs import ValueEventArgs
+from .enums import DataType
+from .internal._GXCommon import _GXCommon
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSEncoderPlan(object):
+    #
+    # Encoder plan encodes values of the same attribute again and again
+    # without resolving data types for each value.
+    #
+    # Plan is compiled once from the data types of the attribute. Scalar
+    # values are encoded with a serializer that is selected when the plan
+    # is compiled. Arrays and structures are encoded by the schema that is
+    # resolved from the encoded attribute value, so values are given as
+    # nested lists in the same order as they are in the DLMS structure.
+    #
+    # Schema is a data type for the scalar values, (DataType.STRUCTURE,
+    # [schema of each field]) for the structures and (DataType.ARRAY,
+    # schema of the element) for the arrays.
+    #
+    # Encoded value can be used also as method parameter:
+    # client.method(item, index, plan.encode(value), DataType.ARRAY)
+    #
+
+    # Serializers of fixed size values. Value is masked the same way as
+    # GXByteBuffer does.
+    __FIXED = {
+        DataType.BOOLEAN: (">BB", None),
+        DataType.INT8: (">BB", 0xFF),
+        DataType.UINT8: (">BB", 0xFF),
+        DataType.ENUM: (">BB", 0xFF),
+        DataType.INT16: (">BH", 0xFFFF),
+        DataType.UINT16: (">BH", 0xFFFF),
+        DataType.INT32: (">BI", 0xFFFFFFFF),
+        DataType.UINT32: (">BI", 0xFFFFFFFF),
+        DataType.INT64: (">BQ", 0xFFFFFFFFFFFFFFFF),
+        DataType.UINT64: (">BQ", 0xFFFFFFFFFFFFFFFF),
+        DataType.FLOAT32: (">Bf", None),
+        DataType.FLOAT64: (">Bd", None),
+    }
+
+    #
+    # Constructor.
+    #
+    # @param schema
+    #            Schema of the value.
+    # @param settings
+    #            DLMS settings. Settings are needed for date-time values.
+    #
+    def __init__(self, schema, settings=None):
+        self.schema = schema
+        self.settings = settings
+        # Attribute index of the compiled attribute.
+        self.index = 0
+        # Size of the last encoded value. Buffer is allocated with this
+        # size.
+        self.size = 0
+        self.__encode = self.__compile(schema)
+
+    #
+    # Compile encoder plan for the attribute.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param target
+    #            COSEM object.
+    # @param index
+    #            Attribute index.
+    #
+    @classmethod
+    def compile(cls, settings, target, index):
+        e = ValueEventArgs(settings, target, index, 0, None)
+        value = target.getValue(settings, e)
+        type_ = target.getDataType(index)
+        if type_ in (DataType.ARRAY, DataType.STRUCTURE) and isinstance(
+            value, (GXByteBuffer, bytearray, bytes)
+        ):
+            schema = cls.getSchema(value)
+        elif type_ == DataType.NONE:
+            if value is None:
+                raise ValueError(
+                    "Invalid parameter. In python value type must give."
+                )
+            schema = _GXCommon.getDLMSDataType(value)
+        else:
+            schema = type_
+        ret = GXDLMSEncoderPlan(schema, settings)
+        ret.index = index
+        return ret
+
+    #
+    # Resolve schema from the encoded value.
+    #
+    # @param value
+    #            Encoded value.
+    #
+    @classmethod
+    def getSchema(cls, value):
+        if not isinstance(value, GXByteBuffer):
+            value = GXByteBuffer(value)
+        else:
+            value = GXByteBuffer(value.subArray(value.position, value.available()))
+        return cls.__getSchema(value)
+
+    @classmethod
+    def __getSchema(cls, data):
+        type_ = data.getUInt8()
+        if type_ == DataType.STRUCTURE:
+            count = _GXCommon.getObjectCount(data)
+            return (type_, [cls.__getSchema(data) for _ in range(count)])
+        if type_ == DataType.ARRAY:
+            count = _GXCommon.getObjectCount(data)
+            if count == 0:
+                return (type_, None)
+            element = cls.__getSchema(data)
+            for _ in range(count - 1):
+                _GXCommon.skipData(data)
+            return (type_, element)
+        data.position = data.position - 1
+        _GXCommon.skipData(data)
+        return DataType(type_)
+
+    # Serializers append the value to the bytearray. Encoded bytes are
+    # copied to the byte buffer once when the whole value is encoded.
+    def __compile(self, schema):
+        if isinstance(schema, tuple):
+            if schema[0] == DataType.STRUCTURE:
+                fields = [self.__compile(it) for it in schema[1]]
+                return self.__compileStructure(fields)
+            if schema[1] is None:
+                return self.__compileArray(self.__unknown)
+            return self.__compileArray(self.__compile(schema[1]))
+        fixed = self.__FIXED.get(schema)
+        if fixed:
+            pack = struct.Struct(fixed[0]).pack
+            type_ = int(schema)
+            mask = fixed[1]
+            if mask is None:
+                if schema == DataType.BOOLEAN:
+
+                    def encodeBoolean(out, value):
+                        out += pack(type_, bool(value))
+
+                    return encodeBoolean
+
+                def encodeFloat(out, value):
+                    out += pack(type_, value)
+
+                return encodeFloat
+
+            def encodeInteger(out, value):
+                out += pack(type_, value & mask)
+
+            return encodeInteger
+        settings = self.settings
+        getObjectCount = self.__getObjectCount
+        setData = self.__setData
+        if schema == DataType.OCTET_STRING:
+
+            def encodeOctetString(out, value):
+                if isinstance(value, (bytes, bytearray)):
+                    out.append(DataType.OCTET_STRING)
+                    out += getObjectCount(len(value))
+                    out += value
+                else:
+                    setData(settings, out, schema, value)
+
+            return encodeOctetString
+        return lambda out, value: setData(settings, out, schema, value)
+
+    @classmethod
+    def __getObjectCount(cls, count):
+        # Same as _GXCommon.setObjectCount.
+        if count < 0x80:
+            return bytes((count,))
+        if count < 0x100:
+            return bytes((0x81, count))
+        if count < 0x10000:
+            return struct.pack(">BH", 0x82, count)
+        return struct.pack(">BI", 0x84, count)
+
+    @classmethod
+    def __setData(cls, settings, out, type_, value):
+        buff = GXByteBuffer()
+        _GXCommon.setData(settings, buff, type_, value)
+        out += buff.array()
+
+    @classmethod
+    def __compileStructure(cls, fields):
+        count = len(fields)
+        header = bytes((DataType.STRUCTURE,)) + cls.__getObjectCount(count)
+
+        def encode(out, value):
+            if len(value) != count:
+                raise ValueError("Invalid structure. Expected %d items." % count)
+            out += header
+            for field, it in zip(fields, value):
+                field(out, it)
+
+        return encode
+
+    @classmethod
+    def __compileArray(cls, element):
+        def encode(out, value):
+            out.append(DataType.ARRAY)
+            out += cls.__getObjectCount(len(value))
+            for it in value:
+                element(out, it)
+
+        return encode
+
+    def __unknown(self, out, value):
+        # Element type of the empty array is resolved from the value.
+        if isinstance(value, (list, tuple)):
+            raise ValueError("Array element type is unknown. Give schema.")
+        type_ = _GXCommon.getDLMSDataType(value)
+        self.__setData(self.settings, out, type_, value)
+
+    #
+    # Encode value.
+    #
+    # @param value
+    #            Value in plan schema.
+    # @param buff
+    #            Buffer where value is encoded. New buffer is allocated if
+    #            not given.
+    # Buffer where value is encoded.
+    #
+    def encode(self, value, buff=None):
+        if buff is None:
+            buff = GXByteBuffer(self.size)
+        out = bytearray()
+        self.__encode(out, value)
+        self.size = len(out)
+        buff.set(out)
+        return buff
@@ -0,0 +1,439 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import csv
+import json
+from .GXBitString import GXBitString
+from .GXByteBuffer import GXByteBuffer
+from .GXDateTime import GXDateTime
+from .GXDLMSConverter import GXDLMSConverter
+from .GXDLMSSettings import GXDLMSSettings
+from ._GXTranslatorDecoder import _GXTranslatorDecoder
+from .enums import DataType, ObjectType
+from .enums.ExportFormat import ExportFormat
+from .internal._GXCommon import _GXCommon
+from .internal._GXDataInfo import _GXDataInfo
+from .objects.GXDLMSDemandRegister import GXDLMSDemandRegister
+from .objects.GXDLMSObject import GXDLMSObject
+from .objects.GXDLMSRegister import GXDLMSRegister
+from .objects.IGXDLMSBase import IGXDLMSBase
+
+
+# pylint: disable=useless-object-inheritance,too-many-instance-attributes
+class GXDLMSExporter(object):
+    #
+    # This class is used to write read values to CSV, JSON Lines or Parquet
+    # file.
+    #
+    # Rows are written when they are added, so the whole collection is
+    # never kept in memory. Parquet rows are written in row groups. Profile
+    # generic buffer can be written straight from the received data and
+    # rows are decoded one at the time. One exporter writes one table, so
+    # use own exporter for each profile generic.
+    #
+
+    # Parquet types of DLMS data types. Other types are written as text.
+    __ARROW_TYPES = {
+        DataType.BOOLEAN: "bool_",
+        DataType.INT8: "int8",
+        DataType.INT16: "int16",
+        DataType.INT32: "int32",
+        DataType.INT64: "int64",
+        DataType.UINT8: "uint8",
+        DataType.UINT16: "uint16",
+        DataType.UINT32: "uint32",
+        DataType.UINT64: "uint64",
+        DataType.ENUM: "uint8",
+        DataType.FLOAT32: "float32",
+        DataType.FLOAT64: "float64",
+    }
+
+    __INTEGER_TYPES = (
+        DataType.INT8,
+        DataType.INT16,
+        DataType.INT32,
+        DataType.INT64,
+        DataType.UINT8,
+        DataType.UINT16,
+        DataType.UINT32,
+        DataType.UINT64,
+    )
+
+    #
+    # Constructor.
+    #
+    # @param output
+    #            File name or file object. Parquet file object must be binary.
+    # @param format_
+    #            File format.
+    #
+    def __init__(self, output, format_=ExportFormat.CSV):
+        self.format = format_
+        # Amount of rows in one Parquet row group.
+        self.rowGroupSize = 10000
+        self.__columns = None
+        self.__rows = []
+        self.__writer = None
+        self.__schema = None
+        self.__types = None
+        # Parquet columns that had only None values in the first row group.
+        self.__untyped = set()
+        if isinstance(output, str):
+            if format_ == ExportFormat.PARQUET:
+                self.__file = output
+            elif format_ == ExportFormat.CSV:
+                self.__file = open(output, "w", newline="")
+            else:
+                self.__file = open(output, "w")
+            self.__close = format_ != ExportFormat.PARQUET
+        else:
+            self.__file = output
+            self.__close = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.close()
+
+    #
+    # Write buffered rows and close the file.
+    #
+    def close(self):
+        self.flush()
+        if self.format == ExportFormat.PARQUET and self.__writer:
+            self.__writer.close()
+            self.__writer = None
+        if self.__close:
+            self.__file.close()
+            self.__close = False
+
+    #
+    # Column names.
+    #
+    def getColumns(self):
+        return self.__columns
+
+    columns = property(getColumns)
+
+    #
+    # Write column names. Column names are written only once.
+    #
+    # @param columns
+    #            Column names.
+    # @param types
+    #            DLMS data types of the columns. Parquet column types are
+    #            resolved from the first row group if types are not given or
+    #            type is DataType.NONE.
+    #
+    def writeHeader(self, columns, types=None):
+        columns = list(columns)
+        if self.__columns is not None:
+            if self.__columns != columns:
+                raise ValueError("Exporter is already used with other columns.")
+            return
+        self.__columns = columns
+        if types is not None:
+            self.__types = list(types)
+        if self.format == ExportFormat.CSV:
+            self.__writer = csv.writer(self.__file)
+            self.__writer.writerow(columns)
+
+    #
+    # Write one row.
+    #
+    # @param row
+    #            Row values in the same order as columns.
+    #
+    def writeRow(self, row):
+        if self.__columns is None:
+            raise ValueError("Write header first.")
+        if self.format == ExportFormat.CSV:
+            self.__writer.writerow([self.__toText(it) for it in row])
+        elif self.format == ExportFormat.JSON_LINES:
+            values = self.__toJson(list(row))
+            self.__file.write(json.dumps(dict(zip(self.__columns, values))))
+            self.__file.write("\n")
+        else:
+            self.__rows.append([self.__toValue(it) for it in row])
+            if len(self.__rows) >= self.rowGroupSize:
+                self.flush()
+
+    #
+    # Write attribute values of the objects. Profile generic buffers are
+    # not written. Use writeProfileGeneric. Unknown objects are skipped.
+    #
+    # @param objects
+    #            COSEM objects.
+    #
+    def writeObjects(self, objects):
+        self.writeHeader(
+            ("logicalName", "objectType", "description", "index", "value")
+        )
+        for it in objects:
+            if not isinstance(it, IGXDLMSBase):
+                continue
+            values = it.getValues()
+            for index in range(1, len(values) + 1):
+                if index == 2 and it.objectType == ObjectType.PROFILE_GENERIC:
+                    continue
+                self.writeRow(
+                    (
+                        it.logicalName,
+                        GXDLMSConverter.objectTypeToString(it.objectType),
+                        it.description,
+                        index,
+                        values[index - 1],
+                    )
+                )
+
+    #
+    # Write profile generic buffer. Column names are logical name and
+    # attribute index of the capture objects.
+    #
+    # @param pg
+    #            Profile generic.
+    # @param data
+    #            Received buffer. Buffer of the profile generic is used if
+    #            not given.
+    # @param settings
+    #            DLMS settings.
+    #
+    def writeProfileGeneric(self, pg, data=None, settings=None):
+        if not pg.captureObjects:
+            raise ValueError("Read capture objects first.")
+        columns = []
+        types = []
+        for k, v in pg.captureObjects:
+            name = k.logicalName + ":" + str(v.attributeIndex)
+            if v.dataIndex:
+                name += ":" + str(v.dataIndex)
+            columns.append(name)
+            types.append(k.getUIDataType(v.attributeIndex))
+        self.writeHeader(columns, self.__getColumnTypes(pg, types))
+        if settings is None:
+            settings = GXDLMSSettings(False, None)
+        if data is None:
+            rows = pg.buffer
+            # Values of the profile generic buffer are already scaled.
+            scalers = [1] * len(types)
+        else:
+            rows = self.getRows(data, settings)
+            scalers = [self.__getScaler(k, v) for k, v in pg.captureObjects]
+        for row in rows:
+            # Row of the profile generic buffer is not modified.
+            row = list(row)
+            for pos, type_ in enumerate(types):
+                value = row[pos]
+                if type_ != DataType.NONE and isinstance(value, bytearray):
+                    row[pos] = _GXCommon.changeType(settings, value, type_)
+                elif (
+                    scalers[pos] != 1
+                    and value
+                    and isinstance(value, (int, float))
+                    and not isinstance(value, bool)
+                ):
+                    # Scale received values as the profile generic does.
+                    row[pos] = value * scalers[pos]
+            self.writeRow(row)
+
+    #
+    # Get column types of the capture objects. Values that are scaled with
+    # the scaler of the register are written as floats.
+    #
+    @classmethod
+    def __getColumnTypes(cls, pg, uiTypes):
+        ret = []
+        for (k, v), type_ in zip(pg.captureObjects, uiTypes):
+            if type_ == DataType.NONE:
+                type_ = k.getDataType(v.attributeIndex)
+            if cls.__getScaler(k, v) != 1 and (
+                type_ == DataType.NONE or type_ in cls.__INTEGER_TYPES
+            ):
+                type_ = DataType.FLOAT64
+            ret.append(type_)
+        return ret
+
+    #
+    # Get scaler that the profile generic uses for the capture object.
+    # One is returned if the values are not scaled.
+    #
+    @classmethod
+    def __getScaler(cls, target, co):
+        if (
+            isinstance(target, GXDLMSRegister)
+            and co.attributeIndex == 2
+            or isinstance(target, GXDLMSDemandRegister)
+            and co.attributeIndex in (2, 3)
+        ):
+            return target.scaler
+        return 1
+
+    #
+    # Decode profile generic rows one at the time.
+    #
+    # @param data
+    #            Received buffer as bytes or GXByteBuffer.
+    # @param settings
+    #            DLMS settings.
+    # Generator of rows.
+    #
+    @classmethod
+    def getRows(cls, data, settings=None):
+        if not isinstance(data, GXByteBuffer):
+            data = GXByteBuffer(data)
+        if data.getUInt8() != DataType.ARRAY:
+            raise ValueError("Invalid profile generic buffer.")
+        count = _GXCommon.getObjectCount(data)
+        for _ in range(count):
+            info = _GXDataInfo()
+            row = _GXCommon.getData(settings, data, info)
+            if not info.complete:
+                raise ValueError("Not enough data.")
+            yield row
+
+    #
+    # Write buffered Parquet rows as one row group. Column types are
+    # resolved when the first row group is written. ValueError is raised
+    # if a value of the later row group doesn't fit to the column type.
+    #
+    def flush(self):
+        if not self.__rows:
+            return
+        # pylint: disable=import-outside-toplevel
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            # pylint: disable=raise-missing-from
+            raise ValueError("pyarrow is required for Parquet export.")
+        columns = list(zip(*self.__rows))
+        self.__rows = []
+        if self.__schema is None:
+            fields = []
+            for pos, it in enumerate(columns):
+                type_ = self.__getArrowType(pyarrow, pos, it)
+                fields.append(pyarrow.field(self.__columns[pos], type_))
+            self.__schema = pyarrow.schema(fields)
+            self.__writer = pyarrow.parquet.ParquetWriter(
+                self.__file, self.__schema
+            )
+        arrays = [self.__toArray(pyarrow, pos, it) for pos, it in enumerate(columns)]
+        table = pyarrow.Table.from_arrays(arrays, schema=self.__schema)
+        self.__writer.write_table(table)
+
+    #
+    # Get Arrow type of the column.
+    #
+    def __getArrowType(self, pyarrow, pos, values):
+        if self.__types and self.__types[pos] != DataType.NONE:
+            name = self.__ARROW_TYPES.get(self.__types[pos], "string")
+            return getattr(pyarrow, name)()
+        try:
+            type_ = pyarrow.array(values).type
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            # Mixed values are written as text.
+            return pyarrow.string()
+        if type_ == pyarrow.null():
+            self.__untyped.add(pos)
+            return pyarrow.string()
+        return type_
+
+    #
+    # Convert column values to Arrow array. Values are never truncated.
+    #
+    def __toArray(self, pyarrow, pos, values):
+        type_ = self.__schema.field(pos).type
+        if type_ == pyarrow.string():
+            if pos in self.__untyped:
+                if any(it is not None and not isinstance(it, str) for it in values):
+                    raise ValueError(
+                        "Type of column %s is unknown. Give column types in "
+                        "writeHeader." % self.__columns[pos]
+                    )
+            values = [self.__toText(it) if it is not None else None for it in values]
+            return pyarrow.array(values, type=type_)
+        try:
+            return pyarrow.array(values).cast(type_, safe=True)
+        except (
+            pyarrow.ArrowInvalid,
+            pyarrow.ArrowTypeError,
+            pyarrow.ArrowNotImplementedError,
+        ):
+            # pylint: disable=raise-missing-from
+            raise ValueError(
+                "Value of column %s can't be written as %s."
+                % (self.__columns[pos], type_)
+            )
+
+    #
+    # Convert value to type that can be serialized to JSON. COSEM objects
+    # are written with logical name and other objects as dictionaries.
+    #
+    @classmethod
+    def __toJson(cls, value):
+        if isinstance(value, GXDLMSObject):
+            return value.logicalName
+        if isinstance(value, (list, tuple)):
+            return [cls.__toJson(it) for it in value]
+        if isinstance(value, GXBitString):
+            return str(value)
+        if value is None or isinstance(
+            value, (bool, int, float, str, bytes, bytearray, dict, GXDateTime)
+        ):
+            return _GXTranslatorDecoder.toJson(value)
+        names = list(getattr(value, "__dict__", ()))
+        for it in type(value).__mro__:
+            names.extend(getattr(it, "__slots__", ()))
+            names.extend(k for k, v in vars(it).items() if isinstance(v, property))
+        ret = {}
+        for it in names:
+            if not it.startswith("_") and it not in ret:
+                ret[it] = cls.__toJson(getattr(value, it, None))
+        if not ret:
+            return str(value)
+        return ret
+
+    @classmethod
+    def __toValue(cls, value):
+        value = cls.__toJson(value)
+        if isinstance(value, (list, dict)):
+            return json.dumps(value)
+        return value
+
+    @classmethod
+    def __toText(cls, value):
+        value = cls.__toValue(value)
+        if value is None:
+            return ""
+        return str(value)
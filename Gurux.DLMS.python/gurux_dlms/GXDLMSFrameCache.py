@@ -0,0 +1,232 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import struct
+from .GXDLMS import GXDLMS
+from ._GXFCS16 import _GXFCS16
+from .enums import InterfaceType
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSFrameCache(object):
+    #
+    # Client uses this class to keep the frames of the messages that are sent
+    # again and again with the same settings: SNRM, AARQ, receiver ready,
+    # keep alive and next data block request.
+    #
+    # Frame is generated only the first time. After that only the HDLC
+    # control byte, invoke ID and block number are patched to the copy of
+    # the frame and HCS and FCS are counted again. Same cache can be shared
+    # between the clients when meters are read with the same settings.
+    #
+
+    #
+    # Constructor.
+    #
+    def __init__(self):
+        # Frame templates. Key is message type and the settings that are used
+        # to generate the message. Value is (frames, patched frames), where
+        # patched frames are saved by HDLC control bytes.
+        self.__items = {}
+
+    #
+    # Amount of cached messages.
+    #
+    def __len__(self):
+        return len(self.__items)
+
+    #
+    # Remove all cached messages.
+    #
+    def clear(self):
+        self.__items.clear()
+
+    #
+    # Get SNRM request.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param build
+    #            Function that generates the frame if it is not cached.
+    #
+    def getSnrm(self, settings, build):
+        hdlc = settings.hdlc
+        key = (
+            "snrm",
+            self.__getFrameKey(settings),
+            hdlc.maxInfoRX,
+            hdlc.windowSizeTX,
+            hdlc.windowSizeRX,
+        )
+        return self.__get(settings, key, lambda: [build()], None)[0]
+
+    #
+    # Get AARQ request. AARQ is cached only when it is not ciphered and
+    # challenge is not used.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param build
+    #            Function that generates the frames if they are not cached.
+    #
+    def getAarq(self, settings, build):
+        gateway = None
+        if settings.gateway and settings.gateway.physicalDeviceAddress:
+            gateway = (
+                settings.gateway.networkId,
+                bytes(settings.gateway.physicalDeviceAddress),
+            )
+        key = (
+            "aarq",
+            self.__getFrameKey(settings),
+            settings.getUseLogicalNameReferencing(),
+            settings.authentication,
+            bytes(settings.password) if settings.password else None,
+            settings.protocolVersion,
+            settings.userId,
+            settings.qualityOfService,
+            settings.dlmsVersion,
+            int(settings.proposedConformance),
+            settings.maxPduSize,
+            gateway,
+        )
+        return self.__get(
+            settings, key, build, lambda index: settings.getNextSend(index == 0)
+        )
+
+    #
+    # Get receiver ready or keep alive frame.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param build
+    #            Function that generates the frame if it is not cached.
+    #
+    def getReceiverReady(self, settings, build):
+        key = ("rr", self.__getFrameKey(settings))
+        return self.__get(
+            settings,
+            key,
+            lambda: [build()],
+            lambda index: settings.getReceiverReady(),
+        )[0]
+
+    #
+    # Get next data block request. Invoke ID and block number are patched
+    # to the frame.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param build
+    #            Function that generates the frame if it is not cached.
+    #
+    def getNextDataBlock(self, settings, build):
+        key = ("next", self.__getFrameKey(settings), settings.command)
+        template = self.__items.get(key)
+        if template is None:
+            frame = build()
+            self.__items[key] = ([bytes(frame)], None)
+            return frame
+        frame = bytearray(template[0][0])
+        wrapper = settings.interfaceType == InterfaceType.WRAPPER
+        end = len(frame) if wrapper else len(frame) - 3
+        frame[end - 5] = GXDLMS.getInvokeIDPriority(settings)
+        frame[end - 4 : end] = struct.pack(">I", settings.blockIndex)
+        settings.increaseBlockIndex()
+        if not wrapper:
+            self.__setControl(frame, settings.getNextSend(True))
+        self.__count(settings, [frame])
+        return frame
+
+    @classmethod
+    def __getFrameKey(cls, settings):
+        return (
+            settings.interfaceType,
+            settings.clientAddress,
+            settings.serverAddress,
+            settings.serverAddressSize,
+            settings.hdlc.maxInfoTX,
+        )
+
+    def __get(self, settings, key, build, control):
+        template = self.__items.get(key)
+        if template is None:
+            frames = build()
+            self.__items[key] = ([bytes(it) for it in frames], {})
+            return frames
+        frames, patched = template
+        self.__count(settings, frames)
+        if control is None or key[1][0] == InterfaceType.WRAPPER:
+            return [bytearray(it) for it in frames]
+        controls = tuple(control(pos) for pos in range(len(frames)))
+        ret = patched.get(controls)
+        if ret is None:
+            ret = []
+            for frame, value in zip(frames, controls):
+                frame = bytearray(frame)
+                self.__setControl(frame, value)
+                ret.append(bytes(frame))
+            patched[controls] = ret
+        return [bytearray(it) for it in ret]
+
+    #
+    # Frames from the cache are not generated, so they are counted here.
+    #
+    @classmethod
+    def __count(cls, settings, frames):
+        if settings.metrics:
+            settings.metrics.increment("framesSent", len(frames))
+            settings.metrics.increment("bytesSent", sum(len(it) for it in frames))
+
+    #
+    # Update HDLC control byte and count HCS and FCS again.
+    #
+    @classmethod
+    def __setControl(cls, frame, value):
+        #  Skip frame start, format and length and both addresses.
+        pos = 3
+        while not frame[pos] & 1:
+            pos += 1
+        pos += 1
+        while not frame[pos] & 1:
+            pos += 1
+        pos += 1
+        frame[pos] = value
+        pos += 1
+        frame[pos : pos + 2] = struct.pack(">H", _GXFCS16.countFCS16(frame, 1, pos - 1))
+        #  If frame has information field.
+        if len(frame) != pos + 3:
+            end = len(frame) - 3
+            frame[end : end + 2] = struct.pack(
+                ">H", _GXFCS16.countFCS16(frame, 1, end - 1)
+            )
@@ -0,0 +1,231 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from .GXDLMS import GXDLMS
+from .GXDLMSLNParameters import GXDLMSLNParameters
+from .GetCommandType import GetCommandType
+from .enums import Command, RequestTypes
+from .internal._GXCommon import _GXCommon
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSGbtWindow(object):
+    #
+    # Client uses this class to receive General Block Transfer blocks that
+    # server streams without waiting acknowledge for each block.
+    #
+    # Blocks are accepted in any order. Received block numbers are kept in
+    # a bitmap and blocks are added to the reply as soon as all previous
+    # blocks are received. When the last block of the window is received
+    # only the missing blocks are asked again. If peek is set for the reply,
+    # rows of the GET response are parsed while blocks are received.
+    #
+    # Window is set for the reply before the request is sent:
+    #
+    # reply.gbtWindow = GXDLMSGbtWindow(client.settings)
+    # while reply.isMoreData() or not reply.isComplete():
+    #     client.getData(media.receive(), reply)
+    #     for it in reply.gbtWindow.getRequests():
+    #         media.send(it)
+    #
+
+    #
+    # Constructor.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param windowSize
+    #            How many blocks server can send without acknowledge.
+    #            GBT window size of the settings is used if not given.
+    #
+    def __init__(self, settings, windowSize=0):
+        self.settings = settings
+        self.windowSize = windowSize or settings.gbtWindowSize
+        # Amount of blocks that are asked again.
+        self.requested = 0
+        self.__blockNumber = 1
+        self.__reset()
+
+    def __reset(self):
+        # Received blocks. Bit is set when block is received.
+        self.__received = bytearray()
+        # Blocks that are received before the previous blocks.
+        self.__blocks = {}
+        # Number of the next block that is added to the reply.
+        self.__next = 1
+        # Number of the last block or zero if it's not received yet.
+        self.__last = 0
+        self.__highest = 0
+        self.__acknowledge = False
+        self.__peek = False
+
+    #
+    # Is block received.
+    #
+    # @param blockNumber
+    #            Block number.
+    #
+    def isReceived(self, blockNumber):
+        index = blockNumber >> 3
+        return (
+            index < len(self.__received)
+            and (self.__received[index] & (1 << (blockNumber & 7))) != 0
+        )
+
+    #
+    # Returns numbers of the blocks that are missing before the highest
+    # received block.
+    #
+    def getMissing(self):
+        return [
+            it for it in range(self.__next, self.__highest) if not self.isReceived(it)
+        ]
+
+    #
+    # Reserved for internal use.
+    #
+    # pylint: disable=too-many-arguments
+    def handleBlock(self, settings, data, index, bc, bn, bna):
+        len_ = _GXCommon.getObjectCount(data.data)
+        if len_ > data.data.size - data.data.position:
+            data.complete = False
+            return
+        block = data.data.subArray(data.data.position, len_)
+        # Only the data of the blocks that are in order is kept.
+        data.data.size = index
+        data.data.position = index
+        data.blockNumber = bn
+        data.blockNumberAck = bna
+        data.streaming = (bc & 0x40) != 0
+        data.gbtWindowSize = bc & 0x3F
+        data.command = Command.NONE
+        if (bc & 0x80) != 0:
+            self.__last = bn
+        if (bc & 0xC0) == 0 or (bc & 0x80) != 0:
+            # Last block of the window.
+            self.__acknowledge = True
+        added = False
+        if not self.isReceived(bn):
+            pos = bn >> 3
+            if pos >= len(self.__received):
+                self.__received.extend(bytearray(1 + pos - len(self.__received)))
+            self.__received[pos] |= 1 << (bn & 7)
+            self.__highest = max(self.__highest, bn)
+            if bn == self.__next:
+                data.data.set(block)
+                self.__next += 1
+                while self.__next in self.__blocks:
+                    data.data.set(self.__blocks.pop(self.__next))
+                    self.__next += 1
+                added = True
+            else:
+                self.__blocks[bn] = block
+        if self.__last != 0 and self.__next > self.__last:
+            data.moreData = RequestTypes(data.moreData & ~RequestTypes.GBT)
+            if self.__peek:
+                self.__getRows(settings, data)
+            elif data.data.size != 0:
+                data.data.position = 0
+                GXDLMS.getPdu(settings, data)
+            self.__reset()
+        else:
+            data.moreData = RequestTypes(data.moreData | RequestTypes.GBT)
+            if added and data.peek:
+                self.__getRows(settings, data)
+
+    def __getRows(self, settings, data):
+        # Rows are parsed before all blocks are received only from the
+        # normal GET response.
+        if not self.__peek:
+            if (
+                data.data.size < 4
+                or data.data.getUInt8(0) != Command.GET_RESPONSE
+                or data.data.getUInt8(1) != GetCommandType.NORMAL
+                or data.data.getUInt8(3) != 0
+            ):
+                return
+            self.__peek = True
+            data.invokeId = data.data.getUInt8(2)
+            data.readPosition = 4
+        data.command = Command.GET_RESPONSE
+        GXDLMS.getValueFromData(settings, data)
+        if data.isMoreData():
+            data.command = Command.NONE
+
+    #
+    # Returns acknowledge when the last block of the window is received.
+    # Acknowledge asks the missing blocks or the next window.
+    #
+    def getRequests(self):
+        if not self.__acknowledge:
+            return []
+        self.__acknowledge = False
+        return self.__getRequest()
+
+    #
+    # Returns acknowledge that asks the missing blocks again when the
+    # reply is not received in given time.
+    #
+    def timeout(self):
+        self.__acknowledge = False
+        return self.__getRequest(True)
+
+    def __getRequest(self, timeout=False):
+        if not self.__received:
+            return []
+        # Ask blocks from the first missing block until the next received
+        # block.
+        count = 0
+        while count != self.windowSize and (
+            self.__last == 0 or self.__next + count <= self.__last
+        ):
+            if self.isReceived(self.__next + count):
+                break
+            count += 1
+        if timeout:
+            requested = count
+        else:
+            requested = min(count, max(0, self.__highest - self.__next + 1))
+        self.requested += requested
+        if requested and self.settings.metrics:
+            self.settings.metrics.increment("retransmissions", requested)
+        if self.__next + count > self.__highest and self.__last == 0:
+            count = self.windowSize
+        p = GXDLMSLNParameters(
+            self.settings, 0, Command.GENERAL_BLOCK_TRANSFER, 0, None, None, 0xFF
+        )
+        p.gbtWindowSize = count
+        p.blockNumberAck = self.__next - 1
+        p.blockIndex = self.__blockNumber
+        self.__blockNumber += 1
+        return GXDLMS.getLnMessages(p)
@@ -0,0 +1,120 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import math
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSHistogram(object):
+    #
+    # Histogram of the observed values. Values are counted to buckets whose
+    # upper bounds are powers of two, so the histogram size stays small
+    # however many values are added.
+    #
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        # Amount of values.
+        self.count = 0
+        # Sum of the values.
+        self.total = 0
+        # Smallest value.
+        self.min = None
+        # Largest value.
+        self.max = None
+        # Amount of values in each bucket. Key is the exponent of the upper
+        # bound of the bucket.
+        self.buckets = {}
+
+    #
+    # Add value to the histogram.
+    #
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        exp = math.frexp(value)[1]
+        self.buckets[exp] = self.buckets.get(exp, 0) + 1
+
+    #
+    # Add values of other histogram to this histogram.
+    #
+    def merge(self, other):
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        for k, v in other.buckets.items():
+            self.buckets[k] = self.buckets.get(k, 0) + v
+
+    #
+    # Average of the values.
+    #
+    def getMean(self):
+        if not self.count:
+            return 0
+        return self.total / self.count
+
+    mean = property(getMean)
+
+    #
+    # Get upper bound of the bucket where given percent of the values are.
+    #
+    # @param percent
+    #            Percent from 0 to 100.
+    #
+    def percentile(self, percent):
+        if not self.count:
+            return 0
+        limit = self.count * percent / 100.0
+        count = 0
+        for exp in sorted(self.buckets):
+            count += self.buckets[exp]
+            if count >= limit:
+                return min(math.ldexp(1, exp), self.max)
+        return self.max
+
+    def __str__(self):
+        return "count %d mean %g min %g max %g" % (
+            self.count,
+            self.mean,
+            self.min or 0,
+            self.max or 0,
+        )
@@ -0,0 +1,237 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import mmap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .GXReplyData import GXReplyData
+from .internal._GXCommon import _GXCommon
+from .objects.GXDLMSImageTransfer import GXDLMSImageTransfer
+from .objects.enums import ImageTransferStatus
+
+
+# pylint: disable=useless-object-inheritance,too-many-instance-attributes
+class GXDLMSImageTransferEngine(object):
+    #
+    # Client uses this class to transfer the same firmware image to several
+    # meters.
+    #
+    # Image file is memory-mapped and each block request is generated when
+    # it is sent, so the image is never copied for the whole transfer. If
+    # the meter has already received part of the image, only the blocks
+    # that are not transferred are sent.
+    #
+    # Meters are accessed with reader objects. Reader must have a client
+    # attribute (GXDLMSClient) and a readDataBlock(data, reply) method that
+    # sends the data to the meter and receives the reply. GXDLMSReader of
+    # the client example can be used as it is.
+    #
+
+    #
+    # Constructor.
+    #
+    # @param image
+    #            Image file name or image as bytes.
+    # @param identifier
+    #            Image identifier.
+    #
+    def __init__(self, image, identifier):
+        if isinstance(identifier, str):
+            identifier = _GXCommon.getBytes(identifier)
+        self.identifier = identifier
+        # Maximum amount of meters that are updated at the same time.
+        self.workers = 4
+        # How many times blocks that the meter has not received are resent.
+        self.retryCount = 3
+        # Is image verified after the transfer.
+        self.verify = True
+        # Is image activated after the transfer.
+        self.activate = False
+        # Progress callback. Called with (reader, sent blocks, block count).
+        self.onProgress = None
+        # Amount of sent image blocks.
+        self.blocksSent = 0
+        # Time used to transfer the image in seconds.
+        self.elapsed = 0
+        self.__lock = threading.Lock()
+        self.__file = None
+        self.__image = None
+        if isinstance(image, (bytes, bytearray)):
+            self.__image = image
+        else:
+            self.__file = open(image, "rb")
+            self.__image = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, tb):
+        self.close()
+
+    #
+    # Close the image file.
+    #
+    def close(self):
+        if self.__file:
+            self.__image.close()
+            self.__file.close()
+            self.__file = None
+        self.__image = None
+
+    #
+    # Image size in bytes.
+    #
+    def getImageSize(self):
+        return len(self.__image)
+
+    imageSize = property(getImageSize)
+
+    #
+    # Amount of sent image blocks in second.
+    #
+    def getBlocksPerSecond(self):
+        if self.elapsed == 0:
+            return 0
+        return self.blocksSent / self.elapsed
+
+    blocksPerSecond = property(getBlocksPerSecond)
+
+    @classmethod
+    def __send(cls, reader, messages):
+        reply = GXReplyData()
+        for it in messages:
+            reply.clear()
+            reader.readDataBlock(it, reply)
+        return reply
+
+    @classmethod
+    def __read(cls, reader, target, index):
+        reply = cls.__send(reader, reader.client.read(target, index))
+        reader.client.updateValue(target, index, reply.value)
+
+    def __isStarted(self, target):
+        if target.imageTransferStatus != ImageTransferStatus.IMAGE_TRANSFER_INITIATED:
+            return False
+        for it in target.imageActivateInfo:
+            if (
+                bytes(it.identification) == bytes(self.identifier)
+                and it.size == len(self.__image)
+            ):
+                return True
+        return False
+
+    #
+    # Transfer the image to one meter.
+    #
+    # @param reader
+    #            Reader that is used to communicate with the meter.
+    # @param target
+    #            Image transfer object. Default object is used if not given.
+    # Amount of sent image blocks.
+    #
+    def transfer(self, reader, target=None):
+        # pylint: disable=too-many-branches
+        if target is None:
+            target = GXDLMSImageTransfer()
+        client = reader.client
+        start = time.time()
+        for index in (2, 5, 6, 7):
+            self.__read(reader, target, index)
+        if not target.imageTransferEnabled:
+            target.imageTransferEnabled = True
+            self.__send(reader, client.write(target, 5))
+        size = len(self.__image)
+        count = target.getImageBlockCount(size)
+        if self.__isStarted(target):
+            self.__read(reader, target, 3)
+            self.__read(reader, target, 4)
+            blocks = target.getNotTransferredBlocks(size)
+        else:
+            self.__send(reader, target.imageTransferInitiate(client, self.identifier, size))
+            blocks = list(range(count))
+        sent = 0
+        retry = 0
+        while blocks:
+            done = count - len(blocks)
+            for pos, index in enumerate(blocks):
+                self.__send(reader, target.imageBlock(client, index, self.__image))
+                sent += 1
+                if self.onProgress:
+                    self.onProgress(reader, done + pos + 1, count)
+            self.__read(reader, target, 3)
+            self.__read(reader, target, 4)
+            blocks = target.getNotTransferredBlocks(size)
+            if blocks:
+                retry += 1
+                if retry > self.retryCount:
+                    raise ValueError(
+                        "Image transfer failed. %d blocks are not transferred." % len(blocks)
+                    )
+        if self.verify:
+            self.__send(reader, target.imageVerify(client))
+        if self.activate:
+            self.__send(reader, target.imageActivate(client))
+        with self.__lock:
+            self.blocksSent += sent
+            self.elapsed += time.time() - start
+        return sent
+
+    #
+    # Transfer the image to several meters at the same time.
+    #
+    # @param readers
+    #            Readers that are used to communicate with the meters.
+    # @param ln
+    #            Logical name of the image transfer object.
+    # Occurred exceptions. None is returned for the meter if the transfer
+    # succeeded.
+    #
+    def transferAll(self, readers, ln="0.0.44.0.0.255"):
+        def run(reader):
+            try:
+                self.transfer(reader, GXDLMSImageTransfer(ln))
+            except Exception as ex:  # pylint: disable=broad-except
+                return ex
+            return None
+
+        elapsed = self.elapsed
+        start = time.time()
+        pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            ret = list(pool.map(run, readers))
+        finally:
+            pool.shutdown()
+        # Meters are updated in parallel so wall clock time is used.
+        self.elapsed = elapsed + time.time() - start
+        return ret
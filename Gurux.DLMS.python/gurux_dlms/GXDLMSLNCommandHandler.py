@@ -241,8 +241,11 @@ class GXDLMSLNCommandHandler:
                 xml.appendEndTag(TranslatorTags.ACCESS_PARAMETERS)
                 xml.appendEndTag(TranslatorTags.ACCESS_SELECTION)
             return
+        rawParameters = None
         if selection != 0:
+            pos = data.position
             parameters = _GXCommon.getData(settings, data, info)
+            rawParameters = data.subArray(pos, data.position - pos)
         ot = ObjectType(ci)
         obj = settings.objects.findByLN(ot, _GXCommon.toLogicalName(ln))
         if obj is None:
@@ -278,18 +281,38 @@ class GXDLMSLNCommandHandler:
                             rowsize += _GXCommon.getDataTypeSize(dt)
                     if rowsize != 0:
                         e.rowToPdu = int(settings.maxPduSize / rowsize)
-                server.notifyRead()
-                value = None
-                if e.handled:
-                    value = e.value
-                else:
-                    settings.setCount(e.rowEndIndex - e.rowBeginIndex)
-                    value = obj.getValue(settings, e)
-                server.onPostRead()
-                if e.byteArray:
-                    bb.set(value)
+                server.onPreRead([e])
+                cached = None
+                #  Application can handle the value or deny the access.
+                if e.error == ErrorCode.OK and not e.handled:
+                    cached = server.responseCache.get(
+                        obj, attributeIndex, selector, rawParameters
+                    )
+                if cached is not None:
+                    server.onPostRead([e])
+                    bb.set(cached)
                 else:
-                    GXDLMS.appendData(settings, obj, attributeIndex, bb, value)
+                    value = None
+                    if e.handled:
+                        value = e.value
+                    else:
+                        settings.setCount(e.rowEndIndex - e.rowBeginIndex)
+                        value = obj.getValue(settings, e)
+                    server.onPostRead([e])
+                    if e.byteArray:
+                        bb.set(value)
+                    else:
+                        GXDLMS.appendData(settings, obj, attributeIndex, bb, value)
+                    #  Only complete values that application has not handled
+                    #  are cached.
+                    if (
+                        e.error == ErrorCode.OK
+                        and not e.handled
+                        and settings.count == settings.index
+                    ):
+                        server.responseCache.add(
+                            obj, attributeIndex, selector, rawParameters, bb.array()
+                        )
                 status = e.error
         GXDLMS.getLNPdu(
             GXDLMSLNParameters(
@@ -298,7 +321,7 @@ class GXDLMSLNCommandHandler:
             replyData,
         )
         if settings.count != settings.index or len(bb) != bb.position:
-            server.setTransaction(GXDLMSLongTransaction(e, Command.GET_REQUEST, bb))
+            server.setTransaction(GXDLMSLongTransaction([e], Command.GET_REQUEST, bb))
 
     #
     # Handle get request next data block command.
@@ -344,7 +367,7 @@ class GXDLMSLNCommandHandler:
             ErrorCode.OK,
         )
         p.streaming = streaming
-        p.gbtWindowSize = settings.gbtWndowSize
+        p.gbtWindowSize = settings.gbtWindowSize
         #  If transaction is not in progress.
         if server.getTransaction() is None:
             p.status = int(ErrorCode.NO_LONG_GET_OR_READ_IN_PROGRESS)
@@ -354,7 +377,7 @@ class GXDLMSLNCommandHandler:
             if moreData:
                 #  If there is multiple blocks on the buffer.
                 #  This might happen when Max PDU size is very small.
-                if len(bb) < settings.getMaxPduSize():
+                if len(bb) < settings.maxPduSize:
                     value = None
                     for arg in server.transaction.targets:
                         arg.invokeId = p.invokeId
@@ -366,7 +389,7 @@ class GXDLMSLNCommandHandler:
                         p.invokeId = arg.invokeId
                         #  Add data.
                         if arg.byteArray:
-                            bb.set(int(value))
+                            bb.set(value)
                         else:
                             GXDLMS.appendData(
                                 settings, arg.target, arg.index, bb, value
@@ -408,10 +431,13 @@ class GXDLMSLNCommandHandler:
             selection = data.getUInt8()
             selector = 0
             parameters = None
+            rawParameters = None
             if selection != 0:
                 selector = data.getUInt8()
                 i = _GXDataInfo()
+                start = data.position
                 parameters = _GXCommon.getData(settings, data, i)
+                rawParameters = data.subArray(start, data.position - start)
             if xml:
                 xml.appendStartTag(TranslatorTags.ATTRIBUTE_DESCRIPTOR_WITH_SELECTION)
                 xml.appendStartTag(TranslatorTags.ATTRIBUTE_DESCRIPTOR)
@@ -437,6 +463,7 @@ class GXDLMSLNCommandHandler:
                     obj = server.onFindObject(ci, 0, _GXCommon.toLogicalName(ln))
                 arg = ValueEventArgs(server, obj, attributeIndex, selector, parameters)
                 arg.invokeId = invokeID
+                arg.rawParameters = rawParameters
                 if obj is None:
                     arg.error = ErrorCode.UNDEFINED_OBJECT
                     list_.append(arg)
@@ -457,17 +484,44 @@ class GXDLMSLNCommandHandler:
         p = GXDLMSLNParameters(
             settings, invokeID, Command.GET_RESPONSE, 3, None, bb, 0xFF
         )
+        cache = server.responseCache
         for it in list_:
             try:
-                if it.handled:
-                    value = it.value
-                else:
-                    value = it.target.getValue(settings, it)
-                bb.setUInt8(it.error)
-                if it.byteArray:
-                    bb.set(value)
+                cached = None
+                if it.error == ErrorCode.OK and not it.handled:
+                    cached = cache.get(
+                        it.target, it.index, it.selector, it.rawParameters
+                    )
+                if cached is not None:
+                    bb.setUInt8(it.error)
+                    bb.set(cached)
                 else:
-                    GXDLMS.appendData(settings, it.target, it.index, bb, value)
+                    if it.handled:
+                        value = it.value
+                    else:
+                        #  Values of the list are not split to several blocks.
+                        it.skipMaxPduSize = True
+                        settings.setIndex(0)
+                        settings.setCount(0)
+                        value = it.target.getValue(settings, it)
+                    bb.setUInt8(it.error)
+                    start = len(bb)
+                    if it.byteArray:
+                        bb.set(value)
+                    else:
+                        GXDLMS.appendData(settings, it.target, it.index, bb, value)
+                    if (
+                        it.error == ErrorCode.OK
+                        and not it.handled
+                        and settings.index == settings.count
+                    ):
+                        cache.add(
+                            it.target,
+                            it.index,
+                            it.selector,
+                            it.rawParameters,
+                            bb.subArray(start, len(bb) - start),
+                        )
                 p.invokeId = it.invokeId
             except Exception:
                 bb.setUInt8(ErrorCode.HARDWARE_FAULT)
@@ -560,7 +614,7 @@ class GXDLMSLNCommandHandler:
                         if dt not in (DataType.NONE, DataType.OCTET_STRING):
                             value = _GXCommon.changeType(settings, value, dt)
                     e.value = value
-                    list_ = list(e)
+                    list_ = [e]
                     if p.isMultipleBlocks():
                         server.setTransaction(
                             GXDLMSLongTransaction(list_, Command.GET_REQUEST, data)
@@ -570,6 +624,7 @@ class GXDLMSLNCommandHandler:
                         p.status = e.error
                     elif not e.handled and not p.multipleBlocks:
                         obj.setValue(settings, e)
+                    server.responseCache.remove(obj, index)
                     server.onPostWrite(list_)
                     p.invokeId = e.invokeId
                 except Exception:
@@ -625,6 +680,10 @@ class GXDLMSLNCommandHandler:
                         server.transaction.targets[0].target.setValue(
                             settings, server.transaction.targets[0]
                         )
+                    server.responseCache.remove(
+                        server.transaction.targets[0].target,
+                        server.transaction.targets[0].index,
+                    )
                     server.onPostWrite(server.transaction.targets)
                 except Exception:
                     p.setStatus(ErrorCode.HARDWARE_FAULT)
@@ -783,12 +842,14 @@ class GXDLMSLNCommandHandler:
             if server.onGetMethodAccess(e) == MethodAccessMode.NO_ACCESS:
                 error = ErrorCode.READ_WRITE_DENIED
             else:
-                server.onPreAction(list(e))
+                server.onPreAction([e])
                 if e.handled:
                     actionReply = int(e.value)
                 else:
                     actionReply = obj.invoke(settings, e)
-                server.onPostAction(list(e))
+                #  Method might change any attribute of the object.
+                server.responseCache.remove(obj)
+                server.onPostAction([e])
                 if actionReply and e.error == ErrorCode.OK:
                     bb.setUInt8(1)
                     bb.setUInt8(0)
@@ -852,7 +913,7 @@ class GXDLMSLNCommandHandler:
                 elif len_ == 5:
                     dt = DataType.DATE
                 info = _GXDataInfo()
-                info.type = dt
+                info.type_ = dt
                 _GXCommon.getData(settings, GXByteBuffer(tmp), info)
         cnt = _GXCommon.getObjectCount(data)
         if xml:
@@ -57,3 +57,13 @@ class GXDLMSLongTransaction:
         self.data = GXByteBuffer()
         if forData:
             self.data.set(forData)
+
+    #
+    # Keep only the part of the data that is not sent yet.
+    #
+    # @param value
+    #            Data.
+    #
+    def setData(self, value):
+        self.data.clear()
+        self.data.set(value)
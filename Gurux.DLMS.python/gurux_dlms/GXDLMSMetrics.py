@@ -0,0 +1,143 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from .GXDLMSHistogram import GXDLMSHistogram
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSMetrics(object):
+    #
+    # Counters and histograms of the client.
+    #
+    # Metrics are collected when GXDLMSClient.metrics is set. Nothing is
+    # counted when it's None. Same metrics can be shared between the
+    # clients to see the totals of all the sessions, or each client can
+    # have own metrics that are merged later.
+    #
+    # Counters:
+    #   framesSent, bytesSent, framesReceived, bytesReceived: Frames and
+    #       bytes of all interface types.
+    #   retransmissions: Frames and GBT blocks that are sent again and
+    #       HDLC frames that the meter sent again.
+    #   crcErrors: Received HDLC frames where CRC is wrong.
+    #   operations: Reads, writes and method calls.
+    #
+    # Histograms:
+    #   decodeTime: Time in seconds to parse the received PDU. This
+    #       includes decrypting.
+    #   cipherTime: Time in seconds to encrypt or decrypt the PDU.
+    #   roundTrips: Amount of requests that one operation needed.
+    #   operationTime: Time in seconds from the request of the operation
+    #       until the whole reply is received.
+    #
+
+    #
+    # Constructor.
+    #
+    # @param callback
+    #            Function that is called with name and value of every
+    #            counter increment and observed value. Use it to forward the
+    #            values to other metrics system.
+    #
+    def __init__(self, callback=None):
+        self.counters = {}
+        self.histograms = {}
+        self.callback = callback
+
+    #
+    # Increase counter.
+    #
+    # @param name
+    #            Counter name.
+    # @param value
+    #            Amount to add.
+    #
+    def increment(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+        if self.callback:
+            self.callback(name, value)
+
+    #
+    # Add value to the histogram.
+    #
+    # @param name
+    #            Histogram name.
+    # @param value
+    #            Observed value.
+    #
+    def observe(self, name, value):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = GXDLMSHistogram()
+        histogram.add(value)
+        if self.callback:
+            self.callback(name, value)
+
+    #
+    # Get counter value. Zero is returned for unknown counter.
+    #
+    def getCounter(self, name):
+        return self.counters.get(name, 0)
+
+    #
+    # Get histogram or None if there are no values.
+    #
+    def getHistogram(self, name):
+        return self.histograms.get(name)
+
+    #
+    # Add counters and histograms of other metrics to these metrics.
+    #
+    def merge(self, other):
+        for k, v in other.counters.items():
+            self.counters[k] = self.counters.get(k, 0) + v
+        for k, v in other.histograms.items():
+            histogram = self.histograms.get(k)
+            if histogram is None:
+                histogram = self.histograms[k] = GXDLMSHistogram()
+            histogram.merge(v)
+
+    #
+    # Remove all counters and histograms.
+    #
+    def clear(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+    def __str__(self):
+        lines = []
+        for k in sorted(self.counters):
+            lines.append("%s: %d" % (k, self.counters[k]))
+        for k in sorted(self.histograms):
+            lines.append("%s: %s" % (k, self.histograms[k]))
+        return "\n".join(lines)
@@ -0,0 +1,200 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from datetime import datetime
+from .enums import Conformance, ObjectType
+from .enums.ReadPolicy import ReadPolicy
+from .objects.IGXDLMSBase import IGXDLMSBase
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSReadPlanner(object):
+    #
+    # Client uses this class to decide what attributes are read on each
+    # collection cycle.
+    #
+    # Attributes that are not due are left out so that after the first full
+    # read only volatile attributes are read. By default objects decide
+    # themselves what is read (see getAttributeIndexToRead). Read policy can
+    # be set for a single COSEM object or for all objects of the given type.
+    # Read times are updated by GXDLMSClient.updateValue and updateValues.
+    #
+
+    #
+    # Constructor.
+    #
+    # @param client
+    #            DLMS client. Client is used to check is reading with list
+    #            supported.
+    #
+    def __init__(self, client=None):
+        self.client = client
+        # Maximum amount of attributes in one batch. Zero if not limited.
+        self.maxCount = 0
+        # Read policies. Key is (COSEM object or object type, attribute index)
+        # and value is (policy, interval in seconds).
+        self.__policies = {}
+        # Profile generic buffer is read with readRowsByEntry or
+        # readRowsByRange.
+        self.setPolicy(ObjectType.PROFILE_GENERIC, 2, ReadPolicy.NEVER)
+
+    #
+    # Set read policy.
+    #
+    # @param target
+    #            COSEM object or object type.
+    # @param index
+    #            Attribute index.
+    # @param policy
+    #            Read policy.
+    # @param interval
+    #            Read interval in seconds. Used with ReadPolicy.INTERVAL.
+    #
+    def setPolicy(self, target, index, policy, interval=0):
+        if policy == ReadPolicy.INTERVAL and interval <= 0:
+            raise ValueError("Invalid interval.")
+        self.__policies[(target, index)] = (policy, interval)
+
+    #
+    # Get read policy.
+    #
+    # @param target
+    #            COSEM object.
+    # @param index
+    #            Attribute index.
+    # Read policy and interval or None if object decides itself what is
+    # read.
+    #
+    def getPolicy(self, target, index):
+        ret = self.__policies.get((target, index))
+        if ret is None:
+            ret = self.__policies.get((target.objectType, index))
+        return ret
+
+    #
+    # Remove read policy.
+    #
+    # @param target
+    #            COSEM object or object type.
+    # @param index
+    #            Attribute index.
+    #
+    def removePolicy(self, target, index):
+        self.__policies.pop((target, index), None)
+
+    #
+    # Is attribute read on this collection cycle.
+    #
+    # @param target
+    #            COSEM object.
+    # @param index
+    #            Attribute index.
+    # @param now
+    #            Current time.
+    #
+    def isDue(self, target, index, now=None):
+        policy = self.getPolicy(target, index)
+        if policy is None:
+            return index in target.getAttributeIndexToRead(False)
+        if now is None:
+            now = datetime.now()
+        return self.__isDue(target, index, policy, now)
+
+    @classmethod
+    def __isDue(cls, target, index, policy, now):
+        policy, interval = policy
+        if policy == ReadPolicy.NEVER:
+            return False
+        if policy == ReadPolicy.ALWAYS:
+            return True
+        tm = target.getLastReadTime(index)
+        if tm is None:
+            return True
+        if policy == ReadPolicy.DAILY:
+            return tm.date() != now.date()
+        if policy == ReadPolicy.INTERVAL:
+            return (now - tm).total_seconds() >= interval
+        return False
+
+    #
+    # Returns attributes that are read on this collection cycle.
+    #
+    # @param objects
+    #            COSEM objects.
+    # @param now
+    #            Current time.
+    # Collection of (COSEM object, attribute index) pairs to read.
+    #
+    def getItems(self, objects, now=None):
+        if now is None:
+            now = datetime.now()
+        items = []
+        for target in objects:
+            if not isinstance(target, IGXDLMSBase):
+                continue
+            needed = None
+            for index in target.getAttributeIndexToRead(True):
+                policy = self.getPolicy(target, index)
+                if policy is None:
+                    if needed is None:
+                        needed = target.getAttributeIndexToRead(False)
+                    due = index in needed
+                else:
+                    due = self.__isDue(target, index, policy, now)
+                if due and target.canRead(index):
+                    items.append((target, index))
+        return items
+
+    #
+    # Returns attributes that are read on this collection cycle split to
+    # batches. Each batch can be read with GXDLMSClient.readList. If the
+    # meter doesn't support reading with list each batch has one attribute.
+    #
+    # @param objects
+    #            COSEM objects.
+    # @param now
+    #            Current time.
+    # Collection of batches.
+    #
+    def plan(self, objects, now=None):
+        items = self.getItems(objects, now)
+        count = self.maxCount
+        if (
+            self.client
+            and self.client.negotiatedConformance & Conformance.MULTIPLE_REFERENCES
+            == 0
+        ):
+            count = 1
+        if count <= 0:
+            count = len(items)
+        return [items[pos : pos + count] for pos in range(0, len(items), count)]
@@ -0,0 +1,197 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from .GXReplyData import GXReplyData
+from .enums import InterfaceType, RequestTypes
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSRequestPipeline(object):
+    #
+    # Client uses this class to read several attributes so that there are
+    # several GET requests waiting for the reply at the same time.
+    #
+    # Each request gets own invoke ID and replies are matched to the
+    # requests by the invoke ID, so the round trip time is paid once for
+    # each window and not for each attribute. Pipeline is used with the
+    # wrapper (TCP/IP) and PDU interfaces and Logical Name referencing.
+    #
+    # Replies that are sent with block transfer are continued one at the
+    # time when all other requests are replied.
+    #
+    # Pipeline doesn't send or receive data:
+    #
+    # while not pipeline.isDone():
+    #     for it in pipeline.getRequests():
+    #         media.send(it)
+    #     received.set(media.receive())
+    #     pipeline.handleReply(received)
+    #
+
+    # Maximum window size. Invoke ID has four bits.
+    MAX_WINDOW_SIZE = 16
+
+    #
+    # Constructor.
+    #
+    # @param client
+    #            DLMS client.
+    # @param list_
+    #            Collection of (COSEM object, attribute index) pairs.
+    # @param window
+    #            How many requests are sent before the reply is received.
+    #
+    def __init__(self, client, list_, window=4):
+        if client.interfaceType not in (InterfaceType.WRAPPER, InterfaceType.PDU):
+            raise ValueError("Pipelining is supported only with WRAPPER and PDU.")
+        if not client.useLogicalNameReferencing:
+            raise ValueError("Pipelining is supported only with Logical Name.")
+        if window < 1 or window > GXDLMSRequestPipeline.MAX_WINDOW_SIZE:
+            raise ValueError("Invalid window size.")
+        self.client = client
+        self.window = window
+        # Errors of the attributes that are failed to read. Key is (COSEM
+        # object, attribute index) and value is the error code.
+        self.errors = {}
+        # Read values in the same order as attributes are given.
+        self.values = [None] * len(list_)
+        self.__items = list(list_)
+        self.__next = 0
+        # Requests without reply. Key is invoke ID and value is [position,
+        # reply data, block index].
+        self.__outstanding = {}
+        # Invoke IDs of the replies that are continued with block transfer.
+        self.__blocks = []
+        # Invoke ID of the reply which blocks are read.
+        self.__current = None
+        self.__invokeId = client.settings.invokeId
+
+    #
+    # Are all attributes read.
+    #
+    def isDone(self):
+        return self.__next == len(self.__items) and not self.__outstanding
+
+    #
+    # Amount of requests waiting for the reply.
+    #
+    def getOutstanding(self):
+        return len(self.__outstanding)
+
+    #
+    # Returns requests that can be sent now. Pipeline is filled until window
+    # size is reached.
+    #
+    def getRequests(self):
+        messages = []
+        if self.__current is not None:
+            return messages
+        settings = self.client.settings
+        while self.__next != len(self.__items) and len(self.__outstanding) < self.window:
+            target, index = self.__items[self.__next]
+            # Invoke ID of the reply with block transfer is reserved until
+            # all blocks are read.
+            invokeId = (settings.invokeId + 1) & 0xF
+            while invokeId in self.__outstanding:
+                invokeId = (invokeId + 1) & 0xF
+            if self.client.autoIncreaseInvokeID:
+                # Client increases invoke ID when request is generated.
+                settings.setInvokeID((invokeId - 1) & 0xF)
+            else:
+                settings.setInvokeID(invokeId)
+            for it in self.client.read(target, index):
+                messages.append(it)
+            self.__outstanding[invokeId] = [self.__next, None, 1]
+            self.__next += 1
+        if not self.__outstanding:
+            self.__restore()
+        elif len(self.__blocks) == len(self.__outstanding):
+            # Only replies with block transfer are left. Read them one by one.
+            self.__current = self.__blocks.pop(0)
+            messages.append(self.__getNextBlock(self.__current))
+        return messages
+
+    def __getNextBlock(self, invokeId):
+        settings = self.client.settings
+        it = self.__outstanding[invokeId]
+        settings.setInvokeID(invokeId)
+        settings.blockIndex = it[2]
+        return self.client.receiverReady(it[1])
+
+    def __restore(self):
+        if not self.client.autoIncreaseInvokeID:
+            self.client.settings.setInvokeID(self.__invokeId)
+
+    #
+    # Handle received data. All complete replies are handled and removed
+    # from the buffer.
+    #
+    # @param data
+    #            Received data.
+    # Requests that can be sent now.
+    #
+    def handleReply(self, data):
+        settings = self.client.settings
+        while data.available() != 0 and self.__outstanding:
+            if self.__current is None:
+                reply = GXReplyData()
+                settings.resetBlockIndex()
+            else:
+                reply = self.__outstanding[self.__current][1]
+                settings.blockIndex = self.__outstanding[self.__current][2]
+            if not self.client.getData(data, reply):
+                break
+            it = self.__outstanding.get(reply.invokeId & 0xF)
+            if it is None:
+                raise ValueError("Unknown invoke ID %d." % reply.invokeId)
+            it[1] = reply
+            it[2] = settings.blockIndex
+            if (reply.moreData & RequestTypes.DATABLOCK) != 0:
+                if self.__current is None:
+                    self.__blocks.append(reply.invokeId & 0xF)
+                else:
+                    data.trim()
+                    return [self.__getNextBlock(self.__current)]
+            else:
+                self.__current = None
+                self.__update(reply.invokeId & 0xF, reply)
+            data.trim()
+        return self.getRequests()
+
+    def __update(self, invokeId, reply):
+        pos = self.__outstanding.pop(invokeId)[0]
+        target, index = self.__items[pos]
+        if reply.error != 0:
+            self.errors[(target, index)] = reply.error
+        else:
+            self.values[pos] = self.client.updateValue(target, index, reply.value)
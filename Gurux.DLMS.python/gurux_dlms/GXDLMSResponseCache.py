@@ -0,0 +1,158 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSResponseCache(object):
+    #
+    # Server uses this class to keep encoded attribute values so that static
+    # attributes are not re-encoded on every GET.
+    #
+    # Cache is disabled by default. Only logical names and attributes that
+    # are marked as static with GXDLMSObject.setStatic are cached. Values are
+    # invalidated when the attribute is written or a method of the object is
+    # invoked. Application must call remove if it changes a static value by
+    # itself. onPreRead and onPostRead are called also when the value is
+    # taken from the cache and the cache is not used if onPreRead handles the
+    # value or sets an error. Cache is used only with Logical Name
+    # referencing.
+    #
+
+    #
+    # Constructor.
+    #
+    def __init__(self):
+        # Is cache used.
+        self.enabled = False
+        # Encoded values. Key is COSEM object and value is a dictionary
+        # where key is (attribute index, selector, parameters).
+        self.__items = {}
+
+    #
+    # Amount of cached attribute values.
+    #
+    def __len__(self):
+        count = 0
+        for v in self.__items.values():
+            count += len(v)
+        return count
+
+    #
+    # Can attribute value be cached.
+    #
+    # @param target
+    #            COSEM object.
+    # @param index
+    #            Attribute index.
+    #
+    def canCache(self, target, index):
+        if not self.enabled or target is None:
+            return False
+        if index == 1:
+            return True
+        att = target.attributes.find(index)
+        return att is not None and att.static
+
+    #
+    # Get encoded attribute value.
+    #
+    # @param target
+    #            COSEM object.
+    # @param index
+    #            Attribute index.
+    # @param selector
+    #            Access selector.
+    # @param parameters
+    #            Encoded access selection parameters.
+    # Encoded value or None if value is not cached.
+    #
+    def get(self, target, index, selector=0, parameters=None):
+        if not self.enabled:
+            return None
+        values = self.__items.get(target)
+        if values is None:
+            return None
+        return values.get((index, selector, self.__toKey(parameters)))
+
+    #
+    # Add encoded attribute value to the cache.
+    #
+    # @param target
+    #            COSEM object.
+    # @param index
+    #            Attribute index.
+    # @param selector
+    #            Access selector.
+    # @param parameters
+    #            Encoded access selection parameters.
+    # @param value
+    #            Encoded value.
+    #
+    def add(self, target, index, selector, parameters, value):
+        # pylint: disable=too-many-arguments
+        if self.canCache(target, index):
+            values = self.__items.get(target)
+            if values is None:
+                values = {}
+                self.__items[target] = values
+            values[(index, selector, self.__toKey(parameters))] = bytes(value)
+
+    #
+    # Remove cached values of the object.
+    #
+    # @param target
+    #            COSEM object.
+    # @param index
+    #            Attribute index. All attributes are removed if zero.
+    #
+    def remove(self, target, index=0):
+        values = self.__items.get(target)
+        if values is not None:
+            if index == 0:
+                del self.__items[target]
+            else:
+                for key in [k for k in values if k[0] == index]:
+                    del values[key]
+
+    #
+    # Remove all cached values.
+    #
+    def clear(self):
+        self.__items.clear()
+
+    @classmethod
+    def __toKey(cls, parameters):
+        if parameters is None:
+            return None
+        return bytes(parameters)
@@ -424,7 +424,7 @@ class GXDLMSSNCommandHandler:
         if len_ != 0:
             tmp = bytearray(len_)
             data.get(tmp)
-            reply.t = _GXCommon.changeType(settings, tmp, DataType.DATETIME)
+            reply.time = _GXCommon.changeType(settings, tmp, DataType.DATETIME)
         type_ = 0
         ot = TranslatorOutputType.SIMPLE_XML
         if reply.xml:
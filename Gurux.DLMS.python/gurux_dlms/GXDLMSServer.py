@@ -72,6 +72,7 @@ from .enums.Initiate import Initiate
 from .enums.Security import Security
 from .GXDLMSLNCommandHandler import GXDLMSLNCommandHandler
 from .GXHdlcSettings import GXHdlcSettings
+from .GXDLMSResponseCache import GXDLMSResponseCache
 
 # pylint:disable=too-many-public-methods,too-many-instance-attributes,useless-object-inheritance
 class GXDLMSServer(object):
@@ -99,6 +100,8 @@ class GXDLMSServer(object):
         self.settings.interfaceType = interfaceType
         self.hdlc = None
         self.wrapper = None
+        # Encoded attribute values of static attributes.
+        self.responseCache = GXDLMSResponseCache()
         self.reset()
 
     def getItems(self):
@@ -116,6 +119,27 @@ class GXDLMSServer(object):
     #GBT Window size.
     gbtWindowSize = property(getGbtWindowSize, setGbtWindowSize)
 
+    def getTransaction(self):
+        return self.transaction
+
+    def setTransaction(self, value):
+        self.transaction = value
+
+    def getUseResponseCache(self):
+        return self.responseCache.enabled
+
+    def setUseResponseCache(self, value):
+        self.responseCache.enabled = value
+        if not value:
+            self.responseCache.clear()
+
+    #
+    # Are encoded attribute values cached. Only logical names and attributes
+    # that are marked with GXDLMSObject.setStatic are cached. Cached values
+    # are invalidated when attribute is written or object method is invoked.
+    #
+    useResponseCache = property(getUseResponseCache, setUseResponseCache)
+
     def getPushClientAddress(self):
         return self.settings.pushClientAddress
 
@@ -496,12 +520,12 @@ class GXDLMSServer(object):
             it.start = self
             if isinstance(it, (GXDLMSAssociationShortName,)) and not self.useLogicalNameReferencing:
                 if len(it.objectList) == 0:
-                    it.objectList.append(self.items)
+                    it.objectList.extend(self.items)
                 associationObject = it
             elif isinstance(it, (GXDLMSAssociationLogicalName,)) and self.useLogicalNameReferencing:
                 ln = it
                 if len(ln.objectList) == 0:
-                    ln.objectList.append(self.items)
+                    ln.objectList.extend(self.items)
                 associationObject = it
                 ln.xDLMSContextInfo.maxReceivePduSize = self.settings.maxServerPDUSize
                 ln.xDLMSContextInfo.maxSendPduSize = self.settings.maxServerPDUSize
@@ -515,11 +539,11 @@ class GXDLMSServer(object):
                 it.xDLMSContextInfo.maxReceivePduSize = self.settings.maxServerPDUSize
                 it.xDLMSContextInfo.maxSendPduSize = self.settings.maxServerPDUSize
                 self.items.append(it)
-                it.objectList.append(self.items)
+                it.objectList.extend(self.items)
             else:
                 it2 = GXDLMSAssociationShortName()
                 self.items.append(it2)
-                it2.objectList.append(self.items)
+                it2.objectList.extend(self.items)
         if not self.useLogicalNameReferencing:
             self.updateShortNames(False)
 
@@ -737,13 +761,13 @@ class GXDLMSServer(object):
                 except Exception:
                     self.dataReceived = datetime.datetime.now()
                     self.receivedData.size = 0
-                    sr.setReply(GXDLMS.getHdlcFrame(self.settings, Command.UNACCEPTABLE_FRAME, self.replyData))
+                    sr.reply = GXDLMS.getHdlcFrame(self.settings, Command.UNACCEPTABLE_FRAME, self.replyData)
                     return
                 if not self.info.complete:
                     return
                 self.receivedData.clear()
                 if self.info.command == Command.DISCONNECT_REQUEST and (self.settings.connected == ConnectionState.NONE):
-                    sr.setReply(GXDLMS.getHdlcFrame(self.settings, Command.DISCONNECT_MODE, self.replyData))
+                    sr.reply = GXDLMS.getHdlcFrame(self.settings, Command.DISCONNECT_MODE, self.replyData)
                     self.info.clear()
                     return
                 if first or self.info.command == Command.SNRM or (self.settings.interfaceType == InterfaceType.WRAPPER and self.info.command == Command.AARQ):
@@ -752,13 +776,13 @@ class GXDLMSServer(object):
                         return
                 if (self.info.moreData & RequestTypes.FRAME) == RequestTypes.FRAME:
                     self.dataReceived = datetime.datetime.now()
-                    sr.setReply(GXDLMS.getHdlcFrame(self.settings, self.settings.getReceiverReady(), self.replyData))
+                    sr.reply = GXDLMS.getHdlcFrame(self.settings, self.settings.getReceiverReady(), self.replyData)
                     return
                 if self.info.command == Command.NONE:
                     if self.transaction:
                         self.info.command = self.transaction.command
                     elif not self.replyData:
-                        sr.setReply(GXDLMS.getHdlcFrame(self.settings, self.settings.getReceiverReady(), self.replyData))
+                        sr.reply = GXDLMS.getHdlcFrame(self.settings, self.settings.getReceiverReady(), self.replyData)
                         return
                 if self.hdlc and self.hdlc.inactivityTimeout != 0:
                     if self.info.command != Command.SNRM:
@@ -777,22 +801,22 @@ class GXDLMSServer(object):
             else:
                 self.info.command = Command.GENERAL_BLOCK_TRANSFER
             try:
-                sr.setReply(self.handleCommand(self.info.command, self.info.data, sr))
+                sr.reply = self.handleCommand(self.info.command, self.info.data, sr)
             except Exception:
-                self.receivedData.size(0)
-                sr.setReply(GXDLMS.getHdlcFrame(self.settings, Command.UNACCEPTABLE_FRAME, self.replyData))
+                self.receivedData.size = 0
+                sr.reply = GXDLMS.getHdlcFrame(self.settings, Command.UNACCEPTABLE_FRAME, self.replyData)
             self.dataReceived = datetime.datetime.now()
             self.info.clear()
         except Exception as e:
             if isinstance(e, (GXDLMSConfirmedServiceError,)):
-                sr.setReply(self.reportConfirmedServiceError(e))
+                sr.reply = self.reportConfirmedServiceError(e)
                 self.transaction = None
                 self.settings.setCount(0)
                 self.settings.setIndex(0)
                 self.info.clear()
                 self.receivedData.clear()
             elif self.info.command != Command.NONE:
-                sr.setReply(self.reportError(self.info.command, ErrorCode.HARDWARE_FAULT))
+                sr.reply = self.reportError(self.info.command, ErrorCode.HARDWARE_FAULT)
                 self.transaction = None
                 self.settings.setCount(0)
                 self.settings.setIndex(0)
@@ -858,23 +882,23 @@ class GXDLMSServer(object):
         elif cmd == Command.READ_REQUEST:
             GXDLMSSNCommandHandler.handleReadRequest(self.settings, self, data, self.replyData, None)
         elif cmd == Command.METHOD_REQUEST:
-            GXDLMSLNCommandHandler.handleMethodRequest(self.settings, self, data, sr.getConnectionInfo(), self.replyData, None)
+            GXDLMSLNCommandHandler.handleMethodRequest(self.settings, self, data, sr.connectionInfo, self.replyData, None)
         elif cmd == Command.SNRM:
             self.handleSnrmRequest(data)
             frame_ = int(Command.UA)
         elif cmd == Command.AARQ:
-            self.handleAarqRequest(data, sr.getConnectionInfo())
+            self.handleAarqRequest(data, sr.connectionInfo)
             if (self.settings.connected & ConnectionState.DLMS) != 0:
-                self.onConnected(sr.getConnectionInfo())
+                self.onConnected(sr.connectionInfo)
         elif cmd == Command.RELEASE_REQUEST:
             self.handleReleaseRequest(data)
             if (self.settings.connected & ConnectionState.DLMS) != 0:
                 self.settings.connected = self.settings.connected & ~ConnectionState.DLMS
-                self.onDisconnected(sr.getConnectionInfo())
+                self.onDisconnected(sr.connectionInfo)
         elif cmd == Command.DISCONNECT_REQUEST:
             self.generateDisconnectRequest()
             if (self.settings.connected & ConnectionState.DLMS) != 0:
-                self.onDisconnected(sr.getConnectionInfo())
+                self.onDisconnected(sr.connectionInfo)
             self.settings.connected = ConnectionState.HDLC
             frame_ = Command.UA
         elif cmd == Command.GENERAL_BLOCK_TRANSFER:
@@ -897,12 +921,12 @@ class GXDLMSServer(object):
             if self.transaction.command == Command.GET_REQUEST:
                 if sr.count == 0:
                     self.settings.setBlockNumberAck(self.settings.blockNumberAck + 1)
-                    sr.setCount(self.settings.gbtWindowSize)
+                    sr.count = self.settings.gbtWindowSize
                 GXDLMSLNCommandHandler.getRequestNextDataBlock(self.settings, 0, self, data, self.replyData, None, True)
                 if sr.count != 0:
-                    sr.setCount(sr.getCount() - 1)
+                    sr.count -= 1
                 if not self.transaction:
-                    sr.setCount(0)
+                    sr.count = 0
             else:
                 bc = data.getUInt8()
                 blockNumber = data.getUInt16()
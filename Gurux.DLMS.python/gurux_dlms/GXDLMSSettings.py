@@ -142,6 +142,8 @@ class GXDLMSSettings:
         self.isServer = isServer
         self.objects = GXDLMSObjectCollection()
         self.hdlc = GXHdlcSettings()
+        # Metrics. Counters and histograms are updated when this is set.
+        self.metrics = None
         self.gateway = None
         self.proposedConformance = GXDLMSSettings.getInitialConformance(
             self.__useLogicalNameReferencing
@@ -156,9 +158,10 @@ class GXDLMSSettings:
         self.useUtc2NormalTime = False
         self.increaseInvocationCounterForGMacAuthentication = False
         self.dateTimeSkips = DateTimeSkips.NONE
+        # Are received date-time values parsed only when they are accessed.
+        self.lazyDateTime = False
         self.standard = Standard.DLMS
         self.negotiatedConformance = Conformance.NONE
-        self.invokeID = 0
         self.command = 0
         self.commandType = 0
         self.useCustomChallenge = False
@@ -266,16 +269,6 @@ class GXDLMSSettings:
             if frame_ == (expected & ~0x10) and self.hdlc.windowSizeRX != 1:
                 self.receiverFrame = frame_
                 return True
-            # If Final bit is not set for the previous message.
-            if (self.receiverFrame & 0x10) == 0 and self.hdlc.windowSizeRX != 1:
-                expected = 0x10 | self.increaseSendSequence(self.receiverFrame)
-                if frame_ == expected:
-                    self.receiverFrame = frame_
-                    return True
-                # If the final bit is not set.
-                if frame_ == (expected & ~0x10):
-                    ReceiverFrame = frame_
-                    return True
         else:
             expected = self.increaseSendSequence(self.receiverFrame) & 0xFF
             #  If answer for RR.
@@ -285,21 +278,19 @@ class GXDLMSSettings:
             if frame_ == (expected & ~0x10):
                 self.receiverFrame = frame_
                 return True
-            if self.hdlc.windowSizeRX != 1:
-                # If HDLC window size is bigger than one.
-                expected = self.increaseReceiverSequence(
-                    self.increaseSendSequence(ReceiverFrame)
-                )
-                if frame_ == expected:
-                    ReceiverFrame = frame_
-                    return True
+        if self.hdlc.windowSizeRX != 1:
+            # Next frame of the same window. Final bit is set only for the
+            # last frame of the window.
+            if (frame_ & 0xEE) == (self.increaseSendSequence(self.receiverFrame) & 0xEE):
+                self.receiverFrame = frame_
+                return True
 
         # If try to find data from bytestream and not real communicating.
         if xml and (
             (not self.isServer and self.receiverFrame == 0xE)
             or (self.isServer and self.receiverFrame == 0xEE)
         ):
-            ReceiverFrame = frame_
+            self.receiverFrame = frame_
             return True
         print("Invalid HDLC Frame: " + hex(frame_) + " Expected: " + hex(expected))
         return False
@@ -430,7 +421,7 @@ class GXDLMSSettings:
     # Invoke ID.
     #
     def getInvokeID(self):
-        return self.invokeID
+        return self.invokeId
 
     #
     # @param value
@@ -446,7 +437,7 @@ class GXDLMSSettings:
             self.serviceClass = ServiceClass.CONFIRMED
         else:
             self.serviceClass = ServiceClass.UN_CONFIRMED
-        self.invokeID = int((value & 0xF))
+        self.invokeId = int((value & 0xF))
 
     #
     # @param value
@@ -455,7 +446,10 @@ class GXDLMSSettings:
     def setInvokeID(self, value):
         if value > 0xF:
             raise ValueError("Invalid InvokeID")
-        self.invokeID = int(value)
+        self.invokeId = int(value)
+
+    # Invoke ID is sent in invokeId. invokeID is kept for compatibility.
+    invokeID = property(getInvokeID, setInvokeID)
 
     #
     # Invoke ID.
@@ -0,0 +1,161 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import logging
+from .GXByteBuffer import GXByteBuffer
+
+# Library doesn't print anything if application hasn't configured logging.
+logging.getLogger("gurux_dlms").addHandler(logging.NullHandler())
+
+
+# pylint: disable=useless-object-inheritance
+class _GXHex(object):
+    #
+    # Hex string of the data is generated only when the trace is written.
+    #
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        if isinstance(self.data, GXByteBuffer):
+            return str(self.data)
+        return GXByteBuffer.hex(self.data)
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSTracer(object):
+    #
+    # Writes traces using Python logging.
+    #
+    # Messages are formatted only when the level is enabled in the logger,
+    # so hex dump of the sent or received data costs nothing if verbose
+    # trace is not used. Trace levels are the same as in
+    # gurux_common.enums.TraceLevel: OFF = 0, ERROR = 1, WARNING = 2,
+    # INFO = 3 and VERBOSE = 4. VERBOSE is written as logging.DEBUG.
+    #
+    OFF = 0
+    ERROR = 1
+    WARNING = 2
+    INFO = 3
+    VERBOSE = 4
+
+    __LEVELS = {
+        ERROR: logging.ERROR,
+        WARNING: logging.WARNING,
+        INFO: logging.INFO,
+        VERBOSE: logging.DEBUG,
+    }
+
+    #
+    # Constructor.
+    #
+    # @param logger
+    #            Logger where traces are written. gurux_dlms logger is used
+    #            as default.
+    # @param level
+    #            Trace level. Logger level is not changed if level is None.
+    #
+    def __init__(self, logger=None, level=None):
+        if logger is None:
+            logger = logging.getLogger("gurux_dlms")
+        self.logger = logger
+        if level is not None:
+            self.setLevel(level)
+
+    #
+    # Convert trace level to logging level.
+    #
+    @classmethod
+    def getLoggingLevel(cls, level):
+        return cls.__LEVELS.get(int(level), logging.CRITICAL + 1)
+
+    #
+    # Set trace level of the logger.
+    #
+    # @param level
+    #            Trace level.
+    #
+    def setLevel(self, level):
+        self.logger.setLevel(self.getLoggingLevel(level))
+
+    #
+    # Is trace level written.
+    #
+    # @param level
+    #            Trace level.
+    #
+    def isEnabled(self, level):
+        return self.logger.isEnabledFor(self.getLoggingLevel(level))
+
+    #
+    # Write trace.
+    #
+    # @param level
+    #            Trace level.
+    # @param msg
+    #            Message with the format of logging.
+    # @param args
+    #            Message arguments. They are formatted only if the level is
+    #            enabled.
+    #
+    def trace(self, level, msg, *args):
+        level = self.getLoggingLevel(level)
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, msg, *args)
+
+    #
+    # Write sent data as hex string with verbose level.
+    #
+    def tx(self, data):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("TX:\t%s", _GXHex(data))
+
+    #
+    # Write received data as hex string with verbose level.
+    #
+    def rx(self, data):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("RX:\t%s", _GXHex(data))
+
+    #
+    # Get object that is converted to hex string only when it's formatted
+    # with %s. Use it as an argument of the trace message.
+    #
+    # @param data
+    #            Byte array or GXByteBuffer.
+    #
+    @classmethod
+    def hex(cls, data):
+        return _GXHex(data)
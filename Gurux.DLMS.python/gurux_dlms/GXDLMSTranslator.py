@@ -33,6 +33,10 @@
 # ---------------------------------------------------------------------------
 from __future__ import print_function
 import xml.etree.cElementTree as ET
+try:
+    from types import MappingProxyType
+except ImportError:
+    MappingProxyType = dict
 from .internal._GXCommon import _GXCommon
 from .GXByteBuffer import GXByteBuffer
 from .ActionRequestType import ActionRequestType
@@ -82,6 +86,7 @@ from .GXDLMSException import GXDLMSException
 from .enums.Standard import Standard
 from .GXDLMSTranslatorMessage import GXDLMSTranslatorMessage
 from .plc.enums import PlcSourceAddress, PlcDestinationAddress
+from ._GXTranslatorDecoder import _GXTranslatorDecoder
 
 
 # pylint:disable=bad-option-value,too-many-instance-attributes,too-many-function-args,too-many-public-methods,too-many-public-methods,too-many-function-args,too-many-instance-attributes,old-style-class,raise-missing-from
@@ -90,13 +95,17 @@ class GXDLMSTranslator:
     This class is used to translate DLMS frame or PDU to xml.
     """
 
+    # Tags by output type.
+    __TAGS = dict()
+
     def __init__(self, type_=TranslatorOutputType.SIMPLE_XML):
         """
         Constructor.
         type_: Translator output type.
         """
-        self.tags = dict()
-        self.tagsByName = dict()
+        # Tags by ID and by name. Tags are shared between translators.
+        self.tags = None
+        self.tagsByName = None
         # Are numeric values shows as hex.
         self.hex = True
         # Is string serialized as hex.  {@link messageToXml} {@link PduOnly}
@@ -170,8 +179,21 @@ class GXDLMSTranslator:
         self.outputType = type_
         # Is only complete PDU parsed and shown.
         self.completePdu = False
-        self.__getTags(self.outputType, self.tags, self.tagsByName)
+        self.tags, self.tagsByName = self.__getTags(self.outputType)
         self.standard = Standard.DLMS
+        # Settings and segmented PDU for messageToDict.
+        self.__recordSettings = None
+        self.__recordFrames = bytearray()
+
+    def __getstate__(self):
+        # Shared tags are not serialized.
+        state = self.__dict__.copy()
+        state["tags"] = state["tagsByName"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.tags, self.tagsByName = self.__getTags(self.outputType)
 
     #
     # Find next frame from the string.  Position of data is set to the begin of
@@ -334,17 +356,26 @@ class GXDLMSTranslator:
         return data.position != len(data)
 
     #
-    # Get all tags.
+    # Get all tags. Tags are created only once for each output type and
+    # shared between all translators.
     #
     # @param type
     #            Output type.
-    # @param list
-    #            List of tags by ID.
-    # @param tagsByName
-    #            List of tags by name.
+    # Read-only tags by ID and tags by name.
     #
     @classmethod
-    def __getTags(cls, type_, list_, tagsByName):
+    def __getTags(cls, type_):
+        ret = GXDLMSTranslator.__TAGS.get(type_)
+        if ret is None:
+            list_ = dict()
+            tagsByName = dict()
+            cls.__createTags(type_, list_, tagsByName)
+            ret = (MappingProxyType(list_), MappingProxyType(tagsByName))
+            GXDLMSTranslator.__TAGS[type_] = ret
+        return ret
+
+    @classmethod
+    def __createTags(cls, type_, list_, tagsByName):
         if type_ == TranslatorOutputType.SIMPLE_XML:
             TranslatorSimpleTags.getGeneralTags(list_)
             TranslatorSimpleTags.getSnTags(list_)
@@ -429,6 +460,7 @@ class GXDLMSTranslator:
     def clear(self):
         self.multipleFrames = False
         self.pduFrames.clear()
+        del self.__recordFrames[:]
 
     @classmethod
     def checkFrame(cls, frame_, xml):
@@ -879,6 +911,45 @@ class GXDLMSTranslator:
             print(ex)
         raise ValueError("Invalid DLMS framing.")
 
+    def messageToDict(self, msg):
+        """
+        Convert HDLC or wrapper frame to dictionary. XML is not generated.
+        Dictionary contains command, invoke ID, attribute descriptors, values
+        and security header. Ciphered content is not decrypted.
+        msg : Translator message data.
+        Returns dictionary or None if frame is part of segmented PDU.
+        """
+        if not isinstance(msg, (GXDLMSTranslatorMessage)):
+            data = msg
+        else:
+            data = msg.message
+        if isinstance(data, GXByteBuffer):
+            data = data.subArray(data.position, data.available())
+        elif not isinstance(data, bytearray):
+            data = GXByteBuffer(data).array()
+        interfaceType = None
+        if isinstance(msg, (GXDLMSTranslatorMessage)):
+            interfaceType = msg.interfaceType
+        return _GXTranslatorDecoder.decodeFrame(
+            self.__getRecordSettings(), data, interfaceType, self.__recordFrames
+        )
+
+    def pduToDict(self, pdu):
+        """
+        Convert PDU to dictionary. XML is not generated.
+        pdu : PDU as bytes, hex string or GXByteBuffer.
+        Returns dictionary.
+        """
+        if not isinstance(pdu, GXByteBuffer):
+            pdu = GXByteBuffer(pdu)
+        return _GXTranslatorDecoder.decodePdu(self.__getRecordSettings(), pdu)
+
+    def __getRecordSettings(self):
+        if self.__recordSettings is None:
+            self.__recordSettings = GXDLMSSettings(True, None)
+            self.__recordSettings.standard = self.standard
+        return self.__recordSettings
+
     #
     # Convert PDU in hex string to XML.
     #
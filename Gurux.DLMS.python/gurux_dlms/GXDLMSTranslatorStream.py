@@ -0,0 +1,326 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import io
+import json
+import multiprocessing
+from .GXByteBuffer import GXByteBuffer
+from .GXDLMSTranslator import GXDLMSTranslator
+from .GXDLMSTranslatorMessage import GXDLMSTranslatorMessage
+from .enums.InterfaceType import InterfaceType
+from ._GXTranslatorDecoder import _GXTranslatorDecoder
+
+# Translator that is used in the worker process.
+_WORKER_TRANSLATOR = None
+
+
+def _initWorker(translator):
+    # pylint: disable=global-statement
+    global _WORKER_TRANSLATOR
+    _WORKER_TRANSLATOR = translator
+
+
+def _translateFrame(args):
+    stream, frame = args
+    return stream.toRecord(_WORKER_TRANSLATOR, frame)
+
+
+# pylint: disable=useless-object-inheritance
+class GXDLMSTranslatorStream(object):
+    #
+    # This class is used to translate captured DLMS traffic frame by frame.
+    # Frames are split from the capture with a single pass scanner and
+    # translated lazily, so large capture files are never kept in memory.
+    #
+
+    # Amount of bytes read from binary capture at once.
+    __CHUNK_SIZE = 0x10000
+
+    #
+    # Constructor.
+    #
+    # @param translator
+    #            Translator that is used to convert frames. New
+    #            translator is created if not given.
+    #
+    def __init__(self, translator=None):
+        if translator is None:
+            translator = GXDLMSTranslator()
+        # Used translator.
+        self.translator = translator
+        # Used interface type. Interface type is resolved from the data if None.
+        self.interfaceType = None
+        # Are records returned as JSON lines instead of XML.
+        self.json = False
+        # Are frames decoded to dictionaries without generating XML.
+        self.structured = False
+        # Is capture text file with hex traces. If False, capture is binary.
+        self.hexTrace = True
+
+    def __getstate__(self):
+        # Translator is given for the worker process separately.
+        state = self.__dict__.copy()
+        state["translator"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    #
+    # Read capture data in chunks.
+    #
+    # @param source
+    #            File name, file object or bytes.
+    # @return Generator of bytearray chunks.
+    #
+    def readCapture(self, source):
+        if isinstance(source, (bytes, bytearray)):
+            if self.hexTrace:
+                source = io.StringIO(source.decode("ascii", "ignore"))
+            else:
+                yield bytearray(source)
+                return
+        elif isinstance(source, GXByteBuffer):
+            yield source.array()
+            return
+        if isinstance(source, str):
+            with open(source, "r" if self.hexTrace else "rb") as f:
+                for chunk in self.__read(f):
+                    yield chunk
+        else:
+            for chunk in self.__read(source):
+                yield chunk
+
+    def __read(self, f):
+        if self.hexTrace:
+            for line in f:
+                chunk = self.__hexLine(line)
+                if chunk:
+                    yield chunk
+        else:
+            while True:
+                chunk = f.read(self.__CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield bytearray(chunk)
+
+    #
+    # Get bytes from the trace line. Trace line can start with direction
+    # and time stamp separated with tab.
+    #
+    @classmethod
+    def __hexLine(cls, line):
+        if isinstance(line, bytes):
+            line = line.decode("ascii", "ignore")
+        pos = line.rfind("\t")
+        if pos != -1:
+            line = line[pos + 1 :]
+        try:
+            return bytearray.fromhex(line.strip())
+        except ValueError:
+            return None
+
+    #
+    # Find next frame from the data.
+    #
+    # @return Tuple (start, end). End is -1 if frame is not complete and
+    #         start is -1 if frame start is not found.
+    #
+    def __findFrame(self, data, pos):
+        # pylint: disable=too-many-boolean-expressions
+        hdlc = self.interfaceType in (
+            None,
+            InterfaceType.HDLC,
+            InterfaceType.HDLC_WITH_MODE_E,
+        )
+        wrapper = self.interfaceType in (None, InterfaceType.WRAPPER)
+        end = len(data)
+        while pos < end:
+            ch = data[pos]
+            if hdlc and ch == 0x7E:
+                if pos + 3 > end:
+                    return (pos, -1)
+                if data[pos + 1] & 0xF0 == 0xA0:
+                    last = pos + 2 + (((data[pos + 1] & 0x7) << 8) | data[pos + 2])
+                    if last > end:
+                        return (pos, -1)
+                    if data[last - 1] == 0x7E:
+                        return (pos, last)
+            elif wrapper and ch == 0:
+                if pos + 8 > end:
+                    return (pos, -1)
+                if data[pos + 1] == 1:
+                    last = pos + 8 + ((data[pos + 6] << 8) | data[pos + 7])
+                    if last > end:
+                        return (pos, -1)
+                    return (pos, last)
+            pos += 1
+        return (-1, -1)
+
+    #
+    # Split capture to frames. HDLC and wrapper frames are supported.
+    #
+    # @param source
+    #            File name, file object or bytes.
+    # @return Generator of frames as bytearray.
+    #
+    def frames(self, source):
+        data = bytearray()
+        for chunk in self.readCapture(source):
+            data.extend(chunk)
+            pos = 0
+            while True:
+                start, end = self.__findFrame(data, pos)
+                if start == -1:
+                    pos = len(data)
+                    break
+                if end == -1:
+                    pos = start
+                    break
+                yield data[start:end]
+                pos = end
+            del data[:pos]
+        # Frame start was found, but the frame was not complete.
+        pos = 0
+        while pos < len(data):
+            start, end = self.__findFrame(data, pos)
+            if start == -1:
+                break
+            if end == -1:
+                pos = start + 1
+            else:
+                yield data[start:end]
+                pos = end
+
+    #
+    # Translate capture to XML.
+    #
+    # @param source
+    #            File name, file object or bytes.
+    # @return Generator of GXDLMSTranslatorMessage.
+    #
+    def messages(self, source):
+        for frame in self.frames(source):
+            msg = GXDLMSTranslatorMessage()
+            msg.message = GXByteBuffer(frame)
+            msg.interfaceType = self.interfaceType
+            try:
+                self.translator.messageToXml(msg)
+            except Exception as ex:  # pylint: disable=broad-except
+                msg.exception = ex
+            yield msg
+
+    #
+    # Translate one frame to XML or JSON record.
+    #
+    # @param translator
+    #            Used translator.
+    # @param frame
+    #            Frame as bytearray.
+    # @return XML, dictionary or JSON line. None is returned if frame is
+    #         part of segmented PDU.
+    #
+    def toRecord(self, translator, frame):
+        if self.structured:
+            return self.__toStructuredRecord(translator, frame)
+        msg = GXDLMSTranslatorMessage()
+        msg.message = GXByteBuffer(frame)
+        msg.interfaceType = self.interfaceType
+        try:
+            translator.messageToXml(msg)
+        except Exception as ex:  # pylint: disable=broad-except
+            msg.exception = ex
+        return self.__toRecord(msg, frame)
+
+    def __toStructuredRecord(self, translator, frame):
+        msg = GXDLMSTranslatorMessage()
+        msg.message = frame
+        msg.interfaceType = self.interfaceType
+        try:
+            record = translator.messageToDict(msg)
+        except Exception as ex:  # pylint: disable=broad-except
+            record = {"error": str(ex)}
+        if record is None:
+            return None
+        if self.json:
+            record["frame"] = GXByteBuffer.hex(frame, False)
+            return json.dumps(_GXTranslatorDecoder.toJson(record))
+        return record
+
+    def __toRecord(self, msg, frame):
+        if not self.json:
+            if msg.exception:
+                return "<!-- " + str(msg.exception) + " -->"
+            return msg.xml
+        record = {
+            "frame": GXByteBuffer.hex(frame, False),
+            "interfaceType": None if msg.interfaceType is None else int(msg.interfaceType),
+            "sourceAddress": msg.sourceAddress,
+            "targetAddress": msg.targetAddress,
+            "xml": msg.xml,
+        }
+        if msg.exception:
+            record["error"] = str(msg.exception)
+        return json.dumps(record)
+
+    #
+    # Translate capture to XML, dictionary or JSON records.
+    #
+    # Frames are decoded in parallel if process count is given. Each worker
+    # has its own translator, so frames must be independent. Use
+    # sequential decoding if PDU is split to several HDLC frames.
+    #
+    # @param source
+    #            File name, file object or bytes.
+    # @param processes
+    #            Amount of worker processes. Zero uses current process.
+    # @param chunksize
+    #            Amount of frames sent to the worker at once.
+    # @return Generator of records in capture order.
+    #
+    def records(self, source, processes=0, chunksize=64):
+        if not processes:
+            for frame in self.frames(source):
+                record = self.toRecord(self.translator, frame)
+                if record is not None:
+                    yield record
+            return
+        pool = multiprocessing.Pool(processes, _initWorker, (self.translator,))
+        try:
+            args = ((self, frame) for frame in self.frames(source))
+            for record in pool.imap(_translateFrame, args, chunksize):
+                if record is not None:
+                    yield record
+        finally:
+            pool.terminate()
+            pool.join()
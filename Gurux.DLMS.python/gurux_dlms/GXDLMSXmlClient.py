@@ -31,6 +31,7 @@
 #  This code is licensed under the GNU General Public License v2.
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
+import os
 import xml.etree.cElementTree as ET
 from .secure.GXDLMSSecureClient import GXDLMSSecureClient
 from .enums import InterfaceType, Command, DataType
@@ -51,6 +52,9 @@ class GXDLMSXmlClient(GXDLMSSecureClient):
     devices using XML.
     """
 
+    # Place holders for profile generic start and end time.
+    __PLACE_HOLDERS = (bytearray(b"\xA5" * 11 + b"\x01"), bytearray(b"\xA5" * 11 + b"\x02"))
+
     #
     # Constructor
     #
@@ -66,6 +70,9 @@ class GXDLMSXmlClient(GXDLMSSecureClient):
         self.translator = GXDLMSTranslator(type_)
         self.translator.hex = False
         self.useLogicalNameReferencing = True
+        # Compiled XML files. Key is file name and value is tuple of
+        # (file name, modified time) and generated PDUs.
+        self.__templates = {}
 
     @classmethod
     def removeRecursively(cls, node, nodeType, name):
@@ -82,13 +89,59 @@ class GXDLMSXmlClient(GXDLMSSecureClient):
     #
     # Load XML commands from the string or file.
     #
+    # XML file is parsed only once. Generated PDUs are kept as templates and
+    # profile generic start and end times of load settings are spliced to
+    # the template when the same file is loaded again.
+    #
     # @param filename
     #            XML file name.
     # @param settings
     #            Load settings.
     # Loaded XML objects.
-    # pylint: disable=too-many-locals,too-many-nested-blocks
     def load(self, filename, loadSettings=None):
+        templates = None
+        key = None
+        if isinstance(filename, str):
+            key = (filename, os.path.getmtime(filename))
+            templates = self.__templates.get(filename)
+            if templates and templates[0] != key:
+                templates = None
+            if templates:
+                templates = templates[1]
+        if templates is None:
+            templates = self.__compile(filename)
+            if key:
+                self.__templates[filename] = (key, templates)
+        actions = []
+        for it in templates:
+            if it.hdlc:
+                self.settings.hdlc.maxInfoTX = it.hdlc.maxInfoTX
+                self.settings.hdlc.maxInfoRX = it.hdlc.maxInfoRX
+                self.settings.hdlc.windowSizeRX = it.hdlc.windowSizeRX
+                self.settings.hdlc.windowSizeTX = it.hdlc.windowSizeTX
+            start = end = None
+            if loadSettings and it.timeIndexes:
+                if loadSettings.start:
+                    start = self.__getTime(loadSettings.start)
+                if loadSettings.end:
+                    end = self.__getTime(loadSettings.end)
+            actions.append(it.clone(start, end))
+        return actions
+
+    #
+    # Remove compiled XML templates.
+    #
+    def clearTemplates(self):
+        self.__templates.clear()
+
+    def __getTime(self, value):
+        bb = GXByteBuffer()
+        _GXCommon.setData(self.settings, bb, DataType.OCTET_STRING, value)
+        # Skip data type and length.
+        return bb.subArray(2, len(bb) - 2)
+
+    # pylint: disable=too-many-locals,too-many-nested-blocks
+    def __compile(self, filename):
         tree = ET.parse(filename)
         root = tree.getroot()
         actions = []
@@ -109,33 +162,20 @@ class GXDLMSXmlClient(GXDLMSSecureClient):
             if node.tag == "Sleep":
                 sleep = node.text
                 continue
-            if loadSettings and node.tag == "GetRequest":
+            # Profile generic start and end times are replaced with place
+            # holders so their position in the PDU can be found.
+            times = []
+            if node.tag == "GetRequest":
                 structure = node.find(
-                    "./GetRequestNormal/AccessSelection/AccessSelector/AccessParameters/Structure"
+                    "./GetRequestNormal/AccessSelection/AccessParameters/Structure"
                 )
-                if structure:
-                    start = False
+                if structure is not None:
                     for node2 in structure:
-                        if start:
-                            bb = GXByteBuffer()
-                            if start:
-                                _GXCommon.setData(
-                                    self.settings,
-                                    bb,
-                                    DataType.OCTET_STRING,
-                                    loadSettings.start,
-                                )
-                                node2.attrib["Value"] = bb.toHex(False, 2)
-                                start = False
-                            else:
-                                _GXCommon.setData(
-                                    self.settings,
-                                    bb,
-                                    DataType.OCTET_STRING,
-                                    loadSettings.end,
-                                )
-                                node2.attrib["Value"] = bb.toHex(False, 2)
-
+                        if node2.tag == "OctetString" and len(times) != 2:
+                            times.append((node2, node2.attrib.get("Value")))
+                            node2.attrib["Value"] = GXByteBuffer.hex(
+                                self.__PLACE_HOLDERS[len(times) - 1], False
+                            )
             s = GXDLMSXmlSettings(
                 self.translator.outputType,
                 self.translator.hex,
@@ -144,21 +184,35 @@ class GXDLMSXmlClient(GXDLMSSecureClient):
             )
             s.settings.clientAddress = self.settings.clientAddress
             s.settings.serverAddress = self.settings.serverAddress
-            reply = []
             reply = self.translator.xmlToPdu(GXDLMSXmlPdu.getOuterXml(node), s)
-            if s.command == Command.SNRM and not s.settings.isServer:
-                self.settings.hdlc.maxInfoTX = s.settings.hdlc.maxInfoTX
-                self.settings.hdlc.maxInfoRX = s.settings.hdlc.maxInfoRX
-                self.settings.hdlc.windowSizeRX = s.settings.hdlc.windowSizeRX
-                self.settings.hdlc.windowSizeTX = s.settings.hdlc.windowSizeTX
-            elif s.command == Command.UA and s.settings.isServer:
-                self.settings.hdlc.maxInfoTX = s.settings.hdlc.maxInfoTX
-                self.settings.hdlc.maxInfoRX = s.settings.hdlc.maxInfoRX
-                self.settings.hdlc.windowSizeRX = s.settings.hdlc.windowSizeRX
-                self.settings.hdlc.windowSizeTX = s.settings.hdlc.windowSizeTX
             if s.template:
                 reply = None
-            p = GXDLMSXmlPdu(s.command, node, reply)
+            else:
+                reply = reply.array()
+            p = GXDLMSXmlPdu(s.command, node, None)
+            if (s.command == Command.SNRM and not s.settings.isServer) or (
+                s.command == Command.UA and s.settings.isServer
+            ):
+                p.hdlc = s.settings.hdlc
+            if reply and s.command in (
+                Command.GET_REQUEST,
+                Command.SET_REQUEST,
+                Command.METHOD_REQUEST,
+            ):
+                p.invokeIdIndex = 2
+            pos = 0
+            for n, value in times:
+                if reply:
+                    pos = self.__find(reply, self.__PLACE_HOLDERS[len(p.timeIndexes)], pos)
+                    p.timeIndexes.append(pos)
+                    if value:
+                        reply[pos : pos + 12] = GXByteBuffer.hexToBytes(value)
+                if value is None:
+                    del n.attrib["Value"]
+                else:
+                    n.attrib["Value"] = value
+            if reply is not None:
+                p.data = GXByteBuffer(reply)
             if description:
                 p.description = description
             if error:
@@ -170,6 +224,13 @@ class GXDLMSXmlClient(GXDLMSSecureClient):
             actions.append(p)
         return actions
 
+    @classmethod
+    def __find(cls, data, value, pos):
+        pos = data.find(value, pos)
+        if pos == -1:
+            raise ValueError("Invalid profile generic time.")
+        return pos
+
     def pduToMessages(self, pdu):
         self.settings.command = pdu.command
         messages = []
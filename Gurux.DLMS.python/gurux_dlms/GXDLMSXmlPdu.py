@@ -33,6 +33,7 @@
 # ---------------------------------------------------------------------------
 import xml.etree.cElementTree as ET
 from .enums.Command import Command
+from .GXByteBuffer import GXByteBuffer
 
 # pylint: disable=bad-option-value,old-style-class
 class GXDLMSXmlPdu:
@@ -52,6 +53,41 @@ class GXDLMSXmlPdu:
         self.data = pdu
         # Sleep time in milliseconds.
         self.privateSleep = 0
+        # Negotiated HDLC settings from SNRM or UA.
+        self.hdlc = None
+        # Position of invoke ID in the generated PDU or -1 if not used.
+        self.invokeIdIndex = -1
+        # Positions of profile generic start and end times in the generated PDU.
+        self.timeIndexes = []
+
+    #
+    # Create copy of the PDU and update profile generic start and end times.
+    #
+    # @param start
+    #            Encoded start time or None if not changed.
+    # @param end
+    #            Encoded end time or None if not changed.
+    #
+    def clone(self, start=None, end=None):
+        p = GXDLMSXmlPdu()
+        p.__dict__.update(self.__dict__)
+        if self.data is not None:
+            data = self.data.array()
+            for index, value in zip(self.timeIndexes, (start, end)):
+                if value:
+                    data[index : index + len(value)] = value
+            p.data = GXByteBuffer(data)
+        return p
+
+    #
+    # Update invoke ID of the generated PDU. Priority and service class are
+    # not changed.
+    #
+    def setInvokeId(self, value):
+        if self.invokeIdIndex == -1:
+            raise ValueError("PDU doesn't have invoke ID.")
+        tmp = self.data.getUInt8(self.invokeIdIndex)
+        self.data.setUInt8((tmp & 0xF0) | (value & 0xF), self.invokeIdIndex)
 
     @classmethod
     def getOuterXml(cls, node):
@@ -36,6 +36,8 @@ from .GXDateTime import GXDateTime
 from .enums import DateTimeSkips
 
 class GXDate(GXDateTime):
+    __slots__ = ()
+
     def __init__(self, value=None, pattern=None):
         """
         Constructor.
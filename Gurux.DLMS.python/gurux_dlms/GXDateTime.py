@@ -41,6 +41,8 @@ from .GXTimeZone import GXTimeZone
 ###Python 2 requires this
 # pylint: disable=bad-option-value,old-style-class
 class GXDateTime:
+    __slots__ = ("extra", "skip", "status", "dayOfWeek", "value")
+
     def __init__(self, value=None, pattern=None):
         """
         Constructor.
@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXEnum(int):
     """Enum class."""
+
+    __slots__ = ()
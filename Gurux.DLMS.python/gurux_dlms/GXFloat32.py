@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXFloat32(float):
     """Float32 class."""
+
+    __slots__ = ()
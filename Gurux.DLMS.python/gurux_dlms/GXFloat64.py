@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXFloat64(float):
     """GXFloat64 class."""
+
+    __slots__ = ()
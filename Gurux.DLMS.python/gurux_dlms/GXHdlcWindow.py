@@ -0,0 +1,252 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from .GXByteBuffer import GXByteBuffer
+from .GXDLMS import GXDLMS
+from .HdlcControlFrame import HdlcControlFrame
+from ._GXFCS16 import _GXFCS16
+from .enums import RequestTypes
+
+
+# pylint: disable=useless-object-inheritance
+class GXHdlcWindow(object):
+    #
+    # HDLC sliding window.
+    #
+    # Sender sends up to windowSizeTX I-frames without waiting the reply.
+    # Poll bit is set only for the last frame of the window and the
+    # receiver acknowledges the whole window with one RR. Receiver can send
+    # only after the frame with the poll/final bit, so if a frame is lost,
+    # frames after it are dropped and REJ is sent when the final frame of
+    # the window is received. Recovery is go-back-N: all frames from N(R)
+    # on are sent again. IEC 62056-46 doesn't define selective reject.
+    # If the final frame is lost the receiver polls with RR or REJ after
+    # the timeout.
+    #
+    # Window doesn't send or receive data. Frames that GXDLMS generates are
+    # given to send and received frames are given to handleFrame one frame
+    # at the time. Both return the frames that must be sent next. Frame
+    # sequences in the settings are kept up to date so the next request can
+    # be sent normally after the windowed transfer.
+    #
+
+    #
+    # Constructor.
+    #
+    # @param settings
+    #            DLMS settings.
+    #
+    def __init__(self, settings):
+        self.settings = settings
+        # Amount of frames that are sent again.
+        self.retransmitted = 0
+        self.__frames = []
+        # Position of the first frame that is not acknowledged.
+        self.__acked = 0
+        # Position of the next frame to send.
+        self.__sent = 0
+        # Is a frame missing from the received window.
+        self.__missing = False
+
+    #
+    # Start sending the frames.
+    #
+    # @param frames
+    #            HDLC frames of the message.
+    # Frames of the first window.
+    #
+    def send(self, frames):
+        self.__frames = [bytearray(it) for it in frames]
+        self.__acked = 0
+        self.__sent = 0
+        return self.__getWindow(0)
+
+    #
+    # Are all sent frames acknowledged.
+    #
+    def isSent(self):
+        return self.__acked == len(self.__frames)
+
+    #
+    # Handle timeout. If all sent frames are not acknowledged, they are sent
+    # again. Otherwise the final frame of the received window is lost and
+    # the sender is polled with current N(R). REJ is used if a frame is
+    # missing.
+    #
+    def timeout(self):
+        if self.__acked != len(self.__frames):
+            self.__retransmit()
+            return self.__getWindow(self.__acked)
+        return [self.__getAck()]
+
+    #
+    # Handle received HDLC frame.
+    #
+    # @param frame
+    #            Received frame.
+    # @param reply
+    #            Received data. Data of the I-frame is added to the reply.
+    # Frames to send.
+    #
+    def handleFrame(self, frame, reply=None):
+        if isinstance(frame, GXByteBuffer):
+            frame = frame.array()
+        control = frame[self.__getControlPosition(frame)]
+        if (control & 0x3) == 0x1:
+            return self.__handleAck(control)
+        if (control & 0x1) != 0:
+            # U-frame is handled as usual.
+            GXDLMS.getData(self.settings, GXByteBuffer(frame), reply, None)
+            return []
+        missing = (((control >> 1) & 0x7) - self.__getReceiveSequence()) & 0x7
+        if missing != 0:
+            if missing >= self.settings.hdlc.windowSizeRX:
+                # Frame is already received. Acknowledge the window again
+                # if the acknowledge is lost.
+                if (control & 0x10) != 0:
+                    return [self.__getAck()]
+                return []
+            # Frame is missing. Frames after it are dropped and the frames
+            # are asked again when the sender gives the turn.
+            self.__missing = True
+            if (control & 0x10) != 0:
+                return [self.__getAck()]
+            return []
+        self.__missing = False
+        if self.__frames and self.__acked != len(self.__frames):
+            # I-frame acknowledges all sent frames.
+            self.__acked = len(self.__frames)
+        GXDLMS.getData(self.settings, GXByteBuffer(frame), reply, None)
+        if (reply.moreData & RequestTypes.FRAME) != 0:
+            if (control & 0x10) != 0:
+                return [self.__getSFrame(HdlcControlFrame.RECEIVE_READY)]
+            return []
+        # Whole message is received. Next I-frame increases the receive
+        # sequence by one.
+        settings = self.settings
+        settings.senderFrame = (settings.senderFrame & 0x1F) | (
+            (settings.receiverFrame << 4) & 0xE0
+        )
+        return []
+
+    def __handleAck(self, control):
+        # Frames before N(R) are received.
+        if self.__acked != len(self.__frames):
+            count = (
+                (control >> 5) - self.__getSequence(self.__frames[self.__acked])
+            ) & 0x7
+            if count <= self.__sent - self.__acked:
+                self.__acked += count
+        # RR that doesn't acknowledge the whole window means that frames are
+        # lost. They are sent again like with REJ.
+        if (
+            (control >> 2) & 0x3 == HdlcControlFrame.REJECT
+            or self.__acked != self.__sent
+        ):
+            self.__retransmit()
+            return self.__getWindow(self.__acked)
+        if self.__acked == self.__sent and self.__sent != len(self.__frames):
+            return self.__getWindow(self.__sent)
+        return []
+
+    def __retransmit(self):
+        count = self.__sent - self.__acked
+        self.retransmitted += count
+        if count and self.settings.metrics:
+            self.settings.metrics.increment("retransmissions", count)
+
+    def __getWindow(self, start):
+        end = min(start + self.settings.hdlc.windowSizeTX, len(self.__frames))
+        messages = []
+        for pos in range(start, end):
+            frame = self.__frames[pos]
+            index = self.__getControlPosition(frame)
+            if pos == end - 1:
+                control = frame[index] | 0x10
+            else:
+                control = frame[index] & ~0x10
+            if control != frame[index]:
+                self.__setControl(frame, index, control)
+            messages.append(bytes(frame))
+        self.__sent = max(self.__sent, end)
+        if end == len(self.__frames) and start != end:
+            # Reply of the message acknowledges the last frame.
+            settings = self.settings
+            settings.receiverFrame = (settings.receiverFrame & 0x1F) | (
+                (frame[index] << 4) & 0xE0
+            )
+        return messages
+
+    @classmethod
+    def __getSequence(cls, frame):
+        return (frame[cls.__getControlPosition(frame)] >> 1) & 0x7
+
+    def __getReceiveSequence(self):
+        return ((self.settings.receiverFrame >> 1) + 1) & 0x7
+
+    #
+    # Get REJ if a frame is missing from the received window. Otherwise RR.
+    #
+    def __getAck(self):
+        if self.__missing:
+            self.__missing = False
+            return self.__getSFrame(HdlcControlFrame.REJECT)
+        return self.__getSFrame(HdlcControlFrame.RECEIVE_READY)
+
+    def __getSFrame(self, type_):
+        settings = self.settings
+        value = self.__getReceiveSequence() << 5 | 0x10
+        settings.senderFrame = value | (settings.senderFrame & 0xE) | 0x1
+        return GXDLMS.getHdlcFrame(settings, value | type_ << 2 | 0x1, None)
+
+    @classmethod
+    def __getControlPosition(cls, frame):
+        # Destination and source address end when the lowest bit is set.
+        pos = 3
+        while (frame[pos] & 0x1) == 0:
+            pos += 1
+        pos += 1
+        while (frame[pos] & 0x1) == 0:
+            pos += 1
+        return pos + 1
+
+    @classmethod
+    def __setControl(cls, frame, index, control):
+        frame[index] = control
+        crc = _GXFCS16.countFCS16(frame, 1, index)
+        frame[index + 1] = crc >> 8
+        frame[index + 2] = crc & 0xFF
+        if len(frame) > index + 4:
+            crc = _GXFCS16.countFCS16(frame, 1, len(frame) - 4)
+            frame[-3] = crc >> 8
+            frame[-2] = crc & 0xFF
@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXInt16(int):
     """Int16 class."""
+
+    __slots__ = ()
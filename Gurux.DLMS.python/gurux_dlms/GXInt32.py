@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXInt32(int):
     """Int32 class."""
+
+    __slots__ = ()
@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXInt64(int):
     """Int64 class."""
+
+    __slots__ = ()
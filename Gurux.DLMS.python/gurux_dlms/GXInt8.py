@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXInt8(int):
     """Int8 class."""
+
+    __slots__ = ()
@@ -38,6 +38,38 @@ from .GXDLMSException import GXDLMSException
 
 # pylint: disable=bad-option-value,old-style-class,too-few-public-methods,too-many-instance-attributes
 class GXReplyData:
+    __slots__ = (
+        "moreData",
+        "command",
+        "data",
+        "complete",
+        "error",
+        "value",
+        "echo",
+        "commandType",
+        "frameId",
+        "dataValue",
+        "totalCount",
+        "readPosition",
+        "packetLength",
+        "peek",
+        "cipherIndex",
+        "time",
+        "xml",
+        "invokeId",
+        "blockNumber",
+        "blockNumberAck",
+        "streaming",
+        "gbtWindowSize",
+        "targetAddress",
+        "sourceAddress",
+        "gateway",
+        "valueType",
+        "cipheredCommand",
+        "gbtWindow",
+        "hdlcScan",
+    )
+
     #
     #      Constructor.
     #
@@ -119,6 +151,11 @@ class GXReplyData:
         # Data type.
         self.valueType = DataType.NONE
         self.cipheredCommand = Command.NONE
+        # GBT window that receives streamed blocks.
+        self.gbtWindow = None
+        # Scanner state of the partially received HDLC frame.  This is for
+        # internal use.
+        self.hdlcScan = None
 
     def clear(self):
         """"
@@ -142,6 +179,7 @@ class GXReplyData:
             self.xml.xml = ""
         self.invokeId = 0
         self.value = None
+        self.hdlcScan = None
 
     def isMoreData(self):
         """
@@ -32,5 +32,7 @@
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
 class GXStructure(list):
+    __slots__ = ()
+
     def __init__(self):
         list.__init__(self)
@@ -35,6 +35,8 @@ from .GXDateTime import GXDateTime
 from .enums import DateTimeSkips
 
 class GXTime(GXDateTime):
+    __slots__ = ()
+
     def __init__(self, value=None, pattern=None):
         """
         Constructor.
@@ -42,6 +42,12 @@ class GXTimeZone(datetime.tzinfo):
     :param offset:
         UTC time zone offset in minutes.
     """
+    __slots__ = ("_offset", "_name")
+
+    # Shared time zones. Time zones are immutable and they are shared between
+    # all date-time values that have the same deviation.
+    __zones = {}
+
     def __init__(self, offset):
         self._offset = datetime.timedelta(seconds=offset * 60)
         if offset == 0:
@@ -55,6 +61,22 @@ class GXTimeZone(datetime.tzinfo):
             self._name += ":"
             self._name += str(offset % 60).zfill(2)
 
+    @classmethod
+    def fromOffset(cls, offset):
+        """
+        Returns shared time zone for given UTC offset.
+
+        :param offset:
+            UTC time zone offset in minutes.
+        """
+        tz = cls.__zones.get(offset)
+        if tz is None:
+            tz = cls.__zones.setdefault(offset, GXTimeZone(offset))
+        return tz
+
+    def __reduce__(self):
+        return (GXTimeZone.fromOffset, (int(self._offset.total_seconds() / 60),))
+
     def utcoffset(self, dt):
         ###UTC offset in seconds.
         return self._offset
@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXUInt16(int):
     """UInt16 class."""
+
+    __slots__ = ()
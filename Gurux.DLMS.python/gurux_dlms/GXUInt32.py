@@ -41,3 +41,5 @@ else:
 
 class GXUInt32(__base):
     """UInt32 class."""
+
+    __slots__ = ()
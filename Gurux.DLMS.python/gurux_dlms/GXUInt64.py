@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXUInt64(int):
     """UInt64 class."""
+
+    __slots__ = ()
@@ -33,3 +33,5 @@
 # ---------------------------------------------------------------------------
 class GXUInt8(int):
     """UInt8 class."""
+
+    __slots__ = ()
@@ -65,6 +65,8 @@ class ValueEventArgs:
         self.selector = readSelector
         # Optional parameters.
         self.parameters = forParameters
+        # Encoded parameters.  This is reserved for internal use.
+        self.rawParameters = None
         # Object value.
         self.eventValue = None
         # Is request handled.
@@ -85,6 +87,9 @@ class ValueEventArgs:
         self.rowBeginIndex = 0
         # Rows end index.
         self.rowEndIndex = 0
+        # Buffer index of the next profile generic row that is sent.  This is
+        # reserved for internal use.
+        self.bufferIndex = 0
         # DLMS server.
         self.server = None
         # Invoke ID.
@@ -80,11 +80,36 @@ class _GXFCS16:
     #
     @classmethod
     def countFCS16(cls, buff, offset, count):
-        fcs16 = 0xFFFF
-        pos = offset
-        while pos < offset + count:
-            fcs16 = int((((fcs16 >> 8) ^ _GXFCS16.__fcs16Table[(fcs16 ^ buff[pos]) & 0xFF]) & 0xFFFF))
-            pos += 1
+        return cls.finalFCS16(cls.updateFCS16(0xFFFF, buff, offset, count))
+
+    #
+    #      * Reserved for internal use.
+    #      *
+    #      * Continue FCS16 calculation with new bytes.
+    #      *
+    #      * @param fcs16
+    #      *            Running FCS. Start value is 0xFFFF.
+    #      * @param buff
+    #      * @param offset
+    #      * @param count
+    #      * @return Running FCS.
+    #
+    @classmethod
+    def updateFCS16(cls, fcs16, buff, offset, count):
+        table = _GXFCS16.__fcs16Table
+        for pos in range(offset, offset + count):
+            fcs16 = (fcs16 >> 8) ^ table[(fcs16 ^ buff[pos]) & 0xFF]
+        return fcs16
+
+    #
+    #      * Reserved for internal use.
+    #      *
+    #      * @param fcs16
+    #      *            Running FCS.
+    #      * @return FCS16 as it's sent in the frame.
+    #
+    @classmethod
+    def finalFCS16(cls, fcs16):
         fcs16 = ~fcs16
         fcs16 = ((fcs16 >> 8) & 0xFF) | (fcs16 << 8)
         return fcs16 & 0xFFFF
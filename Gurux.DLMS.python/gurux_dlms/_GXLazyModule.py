@@ -0,0 +1,113 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import sys
+import types
+from importlib import import_module
+
+
+class _GXLazyModule(types.ModuleType):
+    #
+    # Package that imports exported classes when they are used the first
+    # time. Reserved for internal use.
+    #
+
+    def __getattr__(self, name):
+        module = self.__dict__["_lazyImports"].get(name)
+        if module is None:
+            return self.__getSubmodule(name)
+        value = getattr(import_module(module, self.__name__), name)
+        types.ModuleType.__setattr__(self, name, value)
+        return value
+
+    #
+    # Subpackages like enums and objects are imported when they are
+    # accessed as attributes of the package.
+    #
+    def __getSubmodule(self, name):
+        if not name.startswith("__"):
+            try:
+                return import_module("." + name, self.__name__)
+            except ImportError as ex:
+                # Raise import errors of the submodule itself.
+                if ex.name != self.__name__ + "." + name:
+                    raise
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (self.__name__, name)
+        )
+
+    def __setattr__(self, name, value):
+        # Import system adds imported submodule to the package. Exported
+        # class has the same name and it's used instead of the module.
+        if isinstance(value, types.ModuleType) and name in self._lazyImports:
+            value = getattr(value, name, value)
+        types.ModuleType.__setattr__(self, name, value)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._lazyImports))
+
+    #
+    # Import exported classes of the package when they are used.
+    #
+    # Exported names must also be imported in the package under the
+    # "if not install(...)" block. The imports are used by static code
+    # analysis and by Python versions where the module class can't be
+    # changed.
+    #
+    # @param name
+    #            Package name.
+    # @param lazyImports
+    #            Exported names and modules where they are imported.
+    # @param subpackages
+    #            Subpackages that are exported with star import.
+    # @return True, if the names are imported when they are used.
+    #
+    @classmethod
+    def install(cls, name, lazyImports, subpackages=()):
+        module = sys.modules[name]
+        module._lazyImports = lazyImports
+        # Star import uses __all__, because lazy names are not yet in the
+        # module dictionary.
+        names = [
+            key
+            for key, value in module.__dict__.items()
+            if not key.startswith("_") and not isinstance(value, types.ModuleType)
+        ]
+        names.extend(it for it in lazyImports if not it.startswith("_"))
+        names.extend(subpackages)
+        module.__all__ = names
+        if sys.version_info < (3, 5):
+            # Module class can't be changed. All classes are imported.
+            return False
+        module.__class__ = cls
+        return True
@@ -31,81 +31,78 @@
 #  This code is licensed under the GNU General Public License v2.
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
+from importlib import import_module
 from .enums import ObjectType
-
-# pylint: disable=bad-option-value,too-many-locals,
-# cyclic-import,old-style-class,too-few-public-methods
-from .objects.GXDLMSAssociationLogicalName import GXDLMSAssociationLogicalName
 from .objects.GXDLMSObject import GXDLMSObject
-from .objects.GXDLMSActionSchedule import GXDLMSActionSchedule
-from .objects.GXDLMSActivityCalendar import GXDLMSActivityCalendar
-from .objects.GXDLMSAssociationShortName import GXDLMSAssociationShortName
-from .objects.GXDLMSAutoAnswer import GXDLMSAutoAnswer
-from .objects.GXDLMSAutoConnect import GXDLMSAutoConnect
-from .objects.GXDLMSClock import GXDLMSClock
-from .objects.GXDLMSData import GXDLMSData
-from .objects.GXDLMSDemandRegister import GXDLMSDemandRegister
-from .objects.GXDLMSMacAddressSetup import GXDLMSMacAddressSetup
-from .objects.GXDLMSRegister import GXDLMSRegister
-from .objects.GXDLMSExtendedRegister import GXDLMSExtendedRegister
-from .objects.GXDLMSGprsSetup import GXDLMSGprsSetup
-from .objects.GXDLMSHdlcSetup import GXDLMSHdlcSetup
-from .objects.GXDLMSIECLocalPortSetup import GXDLMSIECLocalPortSetup
-from .objects.GXDLMSIecTwistedPairSetup import GXDLMSIecTwistedPairSetup
-from .objects.GXDLMSIp4Setup import GXDLMSIp4Setup
-from .objects.GXDLMSIp6Setup import GXDLMSIp6Setup
-from .objects.GXDLMSMBusSlavePortSetup import GXDLMSMBusSlavePortSetup
-from .objects.GXDLMSImageTransfer import GXDLMSImageTransfer
-from .objects.GXDLMSSecuritySetup import GXDLMSSecuritySetup
-from .objects.GXDLMSDisconnectControl import GXDLMSDisconnectControl
-from .objects.GXDLMSLimiter import GXDLMSLimiter
-
-from .objects.GXDLMSMBusClient import GXDLMSMBusClient
-from .objects.GXDLMSModemConfiguration import GXDLMSModemConfiguration
-from .objects.GXDLMSPppSetup import GXDLMSPppSetup
-from .objects.GXDLMSProfileGeneric import GXDLMSProfileGeneric
-from .objects.GXDLMSRegisterMonitor import GXDLMSRegisterMonitor
-from .objects.GXDLMSRegisterActivation import GXDLMSRegisterActivation
-from .objects.GXDLMSSapAssignment import GXDLMSSapAssignment
-from .objects.GXDLMSSchedule import GXDLMSSchedule
-from .objects.GXDLMSScriptTable import GXDLMSScriptTable
-from .objects.GXDLMSSpecialDaysTable import GXDLMSSpecialDaysTable
-from .objects.GXDLMSTcpUdpSetup import GXDLMSTcpUdpSetup
-from .objects.GXDLMSPushSetup import GXDLMSPushSetup
-from .objects.GXDLMSMBusMasterPortSetup import GXDLMSMBusMasterPortSetup
-from .objects.GXDLMSGSMDiagnostic import GXDLMSGSMDiagnostic
-from .objects.GXDLMSAccount import GXDLMSAccount
-from .objects.GXDLMSCredit import GXDLMSCredit
-from .objects.GXDLMSCharge import GXDLMSCharge
-from .objects.GXDLMSTokenGateway import GXDLMSTokenGateway
-from .objects.GXDLMSParameterMonitor import GXDLMSParameterMonitor
-from .objects.GXDLMSUtilityTables import GXDLMSUtilityTables
-from .objects.GXDLMSLlcSscsSetup import GXDLMSLlcSscsSetup
-from .objects.GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters import (
-    GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters,
-)
-from .objects.GXDLMSPrimeNbOfdmPlcMacSetup import GXDLMSPrimeNbOfdmPlcMacSetup
-from .objects.GXDLMSPrimeNbOfdmPlcMacFunctionalParameters import (
-    GXDLMSPrimeNbOfdmPlcMacFunctionalParameters,
-)
-from .objects.GXDLMSPrimeNbOfdmPlcMacCounters import GXDLMSPrimeNbOfdmPlcMacCounters
-from .objects.GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData import (
-    GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData,
-)
-from .objects.GXDLMSPrimeNbOfdmPlcApplicationsIdentification import (
-    GXDLMSPrimeNbOfdmPlcApplicationsIdentification,
-)
-from .objects.GXDLMSNtpSetup import GXDLMSNtpSetup
-from .objects.GXDLMSG3PlcMacLayerCounters import GXDLMSG3PlcMacLayerCounters
-from .objects.GXDLMSG3PlcMacSetup import GXDLMSG3PlcMacSetup
-from .objects.GXDLMSFunctionControl import GXDLMSFunctionControl
-from .objects.GXDLMSG3Plc6LoWPan import GXDLMSG3Plc6LoWPan
 
 
 class _GXObjectFactory:
     # pylint: disable=too-few-public-methods
     # Reserved for internal use.
 
+    # COSEM object classes. Classes are imported when they are used the
+    # first time.
+    __CLASSES = {
+        ObjectType.ACTION_SCHEDULE: "GXDLMSActionSchedule",
+        ObjectType.ACTIVITY_CALENDAR: "GXDLMSActivityCalendar",
+        ObjectType.ASSOCIATION_LOGICAL_NAME: "GXDLMSAssociationLogicalName",
+        ObjectType.ASSOCIATION_SHORT_NAME: "GXDLMSAssociationShortName",
+        ObjectType.AUTO_ANSWER: "GXDLMSAutoAnswer",
+        ObjectType.AUTO_CONNECT: "GXDLMSAutoConnect",
+        ObjectType.CLOCK: "GXDLMSClock",
+        ObjectType.DATA: "GXDLMSData",
+        ObjectType.DEMAND_REGISTER: "GXDLMSDemandRegister",
+        ObjectType.MAC_ADDRESS_SETUP: "GXDLMSMacAddressSetup",
+        ObjectType.REGISTER: "GXDLMSRegister",
+        ObjectType.EXTENDED_REGISTER: "GXDLMSExtendedRegister",
+        ObjectType.GPRS_SETUP: "GXDLMSGprsSetup",
+        ObjectType.IEC_HDLC_SETUP: "GXDLMSHdlcSetup",
+        ObjectType.IEC_LOCAL_PORT_SETUP: "GXDLMSIECLocalPortSetup",
+        ObjectType.IEC_TWISTED_PAIR_SETUP: "GXDLMSIecTwistedPairSetup",
+        ObjectType.IP4_SETUP: "GXDLMSIp4Setup",
+        ObjectType.IP6_SETUP: "GXDLMSIp6Setup",
+        ObjectType.MBUS_SLAVE_PORT_SETUP: "GXDLMSMBusSlavePortSetup",
+        ObjectType.IMAGE_TRANSFER: "GXDLMSImageTransfer",
+        ObjectType.SECURITY_SETUP: "GXDLMSSecuritySetup",
+        ObjectType.DISCONNECT_CONTROL: "GXDLMSDisconnectControl",
+        ObjectType.LIMITER: "GXDLMSLimiter",
+        ObjectType.MBUS_CLIENT: "GXDLMSMBusClient",
+        ObjectType.MODEM_CONFIGURATION: "GXDLMSModemConfiguration",
+        ObjectType.PPP_SETUP: "GXDLMSPppSetup",
+        ObjectType.PROFILE_GENERIC: "GXDLMSProfileGeneric",
+        ObjectType.REGISTER_MONITOR: "GXDLMSRegisterMonitor",
+        ObjectType.REGISTER_ACTIVATION: "GXDLMSRegisterActivation",
+        ObjectType.SAP_ASSIGNMENT: "GXDLMSSapAssignment",
+        ObjectType.SCHEDULE: "GXDLMSSchedule",
+        ObjectType.SCRIPT_TABLE: "GXDLMSScriptTable",
+        ObjectType.SPECIAL_DAYS_TABLE: "GXDLMSSpecialDaysTable",
+        ObjectType.TCP_UDP_SETUP: "GXDLMSTcpUdpSetup",
+        ObjectType.UTILITY_TABLES: "GXDLMSUtilityTables",
+        ObjectType.PUSH_SETUP: "GXDLMSPushSetup",
+        ObjectType.MBUS_MASTER_PORT_SETUP: "GXDLMSMBusMasterPortSetup",
+        ObjectType.GSM_DIAGNOSTIC: "GXDLMSGSMDiagnostic",
+        ObjectType.ACCOUNT: "GXDLMSAccount",
+        ObjectType.CREDIT: "GXDLMSCredit",
+        ObjectType.CHARGE: "GXDLMSCharge",
+        ObjectType.TOKEN_GATEWAY: "GXDLMSTokenGateway",
+        ObjectType.PARAMETER_MONITOR: "GXDLMSParameterMonitor",
+        ObjectType.LLC_SSCS_SETUP: "GXDLMSLlcSscsSetup",
+        ObjectType.PRIME_NB_OFDM_PLC_PHYSICAL_LAYER_COUNTERS: "GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters",
+        ObjectType.PRIME_NB_OFDM_PLC_MAC_SETUP: "GXDLMSPrimeNbOfdmPlcMacSetup",
+        ObjectType.PRIME_NB_OFDM_PLC_MAC_FUNCTIONAL_PARAMETERS: "GXDLMSPrimeNbOfdmPlcMacFunctionalParameters",
+        ObjectType.PRIME_NB_OFDM_PLC_MAC_COUNTERS: "GXDLMSPrimeNbOfdmPlcMacCounters",
+        ObjectType.PRIME_NB_OFDM_PLC_MAC_NETWORK_ADMINISTRATION_DATA: "GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData",
+        ObjectType.PRIME_NB_OFDM_PLC_APPLICATIONS_IDENTIFICATION: "GXDLMSPrimeNbOfdmPlcApplicationsIdentification",
+        ObjectType.NTP_SETUP: "GXDLMSNtpSetup",
+        ObjectType.G3_PLC_MAC_LAYER_COUNTERS: "GXDLMSG3PlcMacLayerCounters",
+        ObjectType.G3_PLC_MAC_SETUP: "GXDLMSG3PlcMacSetup",
+        ObjectType.G3_PLC6_LO_WPAN: "GXDLMSG3Plc6LoWPan",
+        ObjectType.FUNCTION_CONTROL: "GXDLMSFunctionControl",
+    }
+
+    # Imported COSEM object classes.
+    __types = {}
+
     #
     # Constructor.
     def __init__(self):
@@ -113,131 +110,14 @@ class _GXObjectFactory:
 
     @classmethod
     def createObject(cls, ot):
-        # pylint: disable=bad-option-value,redefined-variable-type
         #  If IC is manufacturer specific or unknown.
         if ot is None:
             raise ValueError("Invalid object type.")
-
-        if ot == ObjectType.ACTION_SCHEDULE:
-            ret = GXDLMSActionSchedule()
-        elif ot == ObjectType.ACTIVITY_CALENDAR:
-            ret = GXDLMSActivityCalendar()
-        elif ot == ObjectType.ASSOCIATION_LOGICAL_NAME:
-            ret = GXDLMSAssociationLogicalName()
-        elif ot == ObjectType.ASSOCIATION_SHORT_NAME:
-            ret = GXDLMSAssociationShortName()
-        elif ot == ObjectType.AUTO_ANSWER:
-            ret = GXDLMSAutoAnswer()
-        elif ot == ObjectType.AUTO_CONNECT:
-            ret = GXDLMSAutoConnect()
-        elif ot == ObjectType.CLOCK:
-            ret = GXDLMSClock()
-        elif ot == ObjectType.DATA:
-            ret = GXDLMSData()
-        elif ot == ObjectType.DEMAND_REGISTER:
-            ret = GXDLMSDemandRegister()
-        elif ot == ObjectType.MAC_ADDRESS_SETUP:
-            ret = GXDLMSMacAddressSetup()
-        elif ot == ObjectType.REGISTER:
-            ret = GXDLMSRegister()
-        elif ot == ObjectType.EXTENDED_REGISTER:
-            ret = GXDLMSExtendedRegister()
-        elif ot == ObjectType.GPRS_SETUP:
-            ret = GXDLMSGprsSetup()
-        elif ot == ObjectType.IEC_HDLC_SETUP:
-            ret = GXDLMSHdlcSetup()
-        elif ot == ObjectType.IEC_LOCAL_PORT_SETUP:
-            ret = GXDLMSIECLocalPortSetup()
-        elif ot == ObjectType.IEC_TWISTED_PAIR_SETUP:
-            ret = GXDLMSIecTwistedPairSetup()
-        elif ot == ObjectType.IP4_SETUP:
-            ret = GXDLMSIp4Setup()
-        elif ot == ObjectType.IP6_SETUP:
-            ret = GXDLMSIp6Setup()
-        elif ot == ObjectType.MBUS_SLAVE_PORT_SETUP:
-            ret = GXDLMSMBusSlavePortSetup()
-        elif ot == ObjectType.IMAGE_TRANSFER:
-            ret = GXDLMSImageTransfer()
-        elif ot == ObjectType.SECURITY_SETUP:
-            ret = GXDLMSSecuritySetup()
-        elif ot == ObjectType.DISCONNECT_CONTROL:
-            ret = GXDLMSDisconnectControl()
-        elif ot == ObjectType.LIMITER:
-            ret = GXDLMSLimiter()
-        elif ot == ObjectType.MBUS_CLIENT:
-            ret = GXDLMSMBusClient()
-        elif ot == ObjectType.MODEM_CONFIGURATION:
-            ret = GXDLMSModemConfiguration()
-        elif ot == ObjectType.PPP_SETUP:
-            ret = GXDLMSPppSetup()
-        elif ot == ObjectType.PROFILE_GENERIC:
-            ret = GXDLMSProfileGeneric()
-        elif ot == ObjectType.REGISTER_MONITOR:
-            ret = GXDLMSRegisterMonitor()
-        elif ot == ObjectType.REGISTER_ACTIVATION:
-            ret = GXDLMSRegisterActivation()
-        elif ot == ObjectType.REGISTER_TABLE:
-            ret = GXDLMSObject(ot)
-        elif ot == ObjectType.ZIG_BEE_SAS_STARTUP:
-            ret = GXDLMSObject(ot)
-        elif ot == ObjectType.ZIG_BEE_SAS_JOIN:
-            ret = GXDLMSObject(ot)
-        elif ot == ObjectType.SAP_ASSIGNMENT:
-            ret = GXDLMSSapAssignment()
-        elif ot == ObjectType.SCHEDULE:
-            ret = GXDLMSSchedule()
-        elif ot == ObjectType.SCRIPT_TABLE:
-            ret = GXDLMSScriptTable()
-        elif ot == ObjectType.SPECIAL_DAYS_TABLE:
-            ret = GXDLMSSpecialDaysTable()
-        elif ot == ObjectType.STATUS_MAPPING:
-            ret = GXDLMSObject(ot)
-        elif ot == ObjectType.TCP_UDP_SETUP:
-            ret = GXDLMSTcpUdpSetup()
-        elif ot == ObjectType.ZIG_BEE_SAS_APS_FRAGMENTATION:
-            ret = GXDLMSObject(ot)
-        elif ot == ObjectType.UTILITY_TABLES:
-            ret = GXDLMSUtilityTables()
-        elif ot == ObjectType.PUSH_SETUP:
-            ret = GXDLMSPushSetup()
-        elif ot == ObjectType.MBUS_MASTER_PORT_SETUP:
-            ret = GXDLMSMBusMasterPortSetup()
-        elif ot == ObjectType.GSM_DIAGNOSTIC:
-            ret = GXDLMSGSMDiagnostic()
-        elif ot == ObjectType.ACCOUNT:
-            ret = GXDLMSAccount()
-        elif ot == ObjectType.CREDIT:
-            ret = GXDLMSCredit()
-        elif ot == ObjectType.CHARGE:
-            ret = GXDLMSCharge()
-        elif ot == ObjectType.TOKEN_GATEWAY:
-            ret = GXDLMSTokenGateway()
-        elif ot == ObjectType.PARAMETER_MONITOR:
-            ret = GXDLMSParameterMonitor()
-        elif ot == ObjectType.LLC_SSCS_SETUP:
-            ret = GXDLMSLlcSscsSetup()
-        elif ot == ObjectType.PRIME_NB_OFDM_PLC_PHYSICAL_LAYER_COUNTERS:
-            ret = GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters()
-        elif ot == ObjectType.PRIME_NB_OFDM_PLC_MAC_SETUP:
-            ret = GXDLMSPrimeNbOfdmPlcMacSetup()
-        elif ot == ObjectType.PRIME_NB_OFDM_PLC_MAC_FUNCTIONAL_PARAMETERS:
-            ret = GXDLMSPrimeNbOfdmPlcMacFunctionalParameters()
-        elif ot == ObjectType.PRIME_NB_OFDM_PLC_MAC_COUNTERS:
-            ret = GXDLMSPrimeNbOfdmPlcMacCounters()
-        elif ot == ObjectType.PRIME_NB_OFDM_PLC_MAC_NETWORK_ADMINISTRATION_DATA:
-            ret = GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData()
-        elif ot == ObjectType.PRIME_NB_OFDM_PLC_APPLICATIONS_IDENTIFICATION:
-            ret = GXDLMSPrimeNbOfdmPlcApplicationsIdentification()
-        elif ot == ObjectType.NTP_SETUP:
-            ret = GXDLMSNtpSetup()
-        elif ot == ObjectType.G3_PLC_MAC_LAYER_COUNTERS:
-            ret = GXDLMSG3PlcMacLayerCounters()
-        elif ot == ObjectType.G3_PLC_MAC_SETUP:
-            ret = GXDLMSG3PlcMacSetup()
-        elif ot == ObjectType.G3_PLC6_LO_WPAN:
-            ret = GXDLMSG3Plc6LoWPan()
-        elif ot == ObjectType.FUNCTION_CONTROL:
-            ret = GXDLMSFunctionControl()
-        else:
-            ret = GXDLMSObject(ot)
-        return ret
+        type_ = cls.__types.get(ot)
+        if type_ is None:
+            name = cls.__CLASSES.get(ot)
+            if name is None:
+                return GXDLMSObject(ot)
+            type_ = getattr(import_module(".objects." + name, __package__), name)
+            cls.__types[ot] = type_
+        return type_()
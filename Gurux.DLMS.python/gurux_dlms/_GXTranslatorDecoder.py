@@ -0,0 +1,358 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from .internal._GXCommon import _GXCommon
+from .internal._GXDataInfo import _GXDataInfo
+from .GXByteBuffer import GXByteBuffer
+from .GXDateTime import GXDateTime
+from ._GXFCS16 import _GXFCS16
+from .enums import Command
+from .enums.HdlcFrameType import HdlcFrameType
+from .enums.InterfaceType import InterfaceType
+from .enums.ObjectType import ObjectType
+
+
+# pylint: disable=bad-option-value,old-style-class,too-few-public-methods
+class _GXTranslatorDecoder:
+    #
+    # Decode DLMS frames and PDUs to dictionaries without generating XML.
+    # This class is reserved for internal use. Use GXDLMSTranslator.messageToDict
+    # and GXDLMSTranslator.pduToDict.
+    #
+
+    # Commands that are ciphered with general or dedicated key.
+    __CIPHERED = (
+        Command.GLO_GET_REQUEST,
+        Command.GLO_GET_RESPONSE,
+        Command.GLO_SET_REQUEST,
+        Command.GLO_SET_RESPONSE,
+        Command.GLO_METHOD_REQUEST,
+        Command.GLO_METHOD_RESPONSE,
+        Command.GLO_EVENT_NOTIFICATION,
+        Command.GLO_INITIATE_REQUEST,
+        Command.GLO_INITIATE_RESPONSE,
+        Command.GLO_READ_REQUEST,
+        Command.GLO_READ_RESPONSE,
+        Command.GLO_WRITE_REQUEST,
+        Command.GLO_WRITE_RESPONSE,
+        Command.DED_GET_REQUEST,
+        Command.DED_GET_RESPONSE,
+        Command.DED_SET_REQUEST,
+        Command.DED_SET_RESPONSE,
+        Command.DED_METHOD_REQUEST,
+        Command.DED_METHOD_RESPONSE,
+        Command.DED_EVENT_NOTIFICATION,
+    )
+
+    # Names of the S-frames by the type bits of the control field.
+    __S_FRAMES = ("ReceiveReady", "ReceiveNotReady", "Reject", "SelectiveReject")
+
+    @classmethod
+    def __getAddress(cls, data, pos):
+        value = 0
+        while True:
+            ch = data[pos]
+            value = (value << 7) | (ch >> 1)
+            pos += 1
+            if ch & 1:
+                return value, pos
+
+    #
+    # Decode HDLC or wrapper frame.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param frame
+    #            Frame as bytearray.
+    # @param interfaceType
+    #            Interface type or None if it's resolved from the frame.
+    # @param pending
+    #            Buffer where segmented HDLC frames are collected.
+    # @return Decoded frame or None if PDU is not complete yet.
+    #
+    @classmethod
+    def decodeFrame(cls, settings, frame, interfaceType, pending):
+        if interfaceType in (None, InterfaceType.WRAPPER) and frame[0] == 0 and frame[1] == 1:
+            ret = {
+                "interfaceType": int(InterfaceType.WRAPPER),
+                "sourceAddress": (frame[2] << 8) | frame[3],
+                "targetAddress": (frame[4] << 8) | frame[5],
+            }
+            ret.update(cls.decodePdu(settings, GXByteBuffer(frame[8:])))
+            return ret
+        if frame[0] != 0x7E or frame[1] & 0xF0 != 0xA0:
+            raise ValueError("Invalid DLMS framing.")
+        target, pos = cls.__getAddress(frame, 3)
+        source, pos = cls.__getAddress(frame, pos)
+        control = frame[pos]
+        ret = {
+            "interfaceType": int(InterfaceType.HDLC),
+            "sourceAddress": source,
+            "targetAddress": target,
+            "frameType": control,
+        }
+        end = len(frame) - 3
+        # HCS is sent only if frame has information field. FCS is counted
+        # from the running HCS, so the header is counted only once.
+        crc = _GXFCS16.updateFCS16(0xFFFF, frame, 1, pos)
+        if pos + 3 < end and cls.__getCrc(frame, pos + 1) != _GXFCS16.finalFCS16(crc):
+            raise ValueError("Wrong CRC.")
+        crc = _GXFCS16.updateFCS16(crc, frame, pos + 1, end - pos - 1)
+        if cls.__getCrc(frame, end) != _GXFCS16.finalFCS16(crc):
+            raise ValueError("Wrong CRC.")
+        # Skip control field and HCS.
+        pos += 3
+        if control & 3 == HdlcFrameType.S_FRAME:
+            # RR, RNR, REJ or SREJ. N(R) is the next expected I-frame.
+            ret["command"] = cls.__S_FRAMES[(control >> 2) & 3]
+            ret["receiveSequence"] = control >> 5
+        elif (control & 1 == 0 or control & 0xEF == 0x03) and pos < end:
+            # I-frame or UI-frame. LLC bytes are only in the first segment.
+            if not pending and frame[pos] == 0xE6 and frame[pos + 1] in (0xE6, 0xE7):
+                pos += 3
+            pending.extend(frame[pos:end])
+            if frame[1] & 0x8:
+                return None
+            ret.update(cls.decodePdu(settings, GXByteBuffer(pending)))
+            del pending[:]
+        elif control & 1 == 0:
+            ret["command"] = None
+        else:
+            try:
+                ret["command"] = Command.toString(control)
+            except ValueError:
+                # Unknown U-frame.
+                ret["command"] = None
+            ret["commandId"] = control
+        return ret
+
+    @classmethod
+    def __getCrc(cls, frame, pos):
+        return (frame[pos] << 8) | frame[pos + 1]
+
+    @classmethod
+    def __getValue(cls, settings, data):
+        info = _GXDataInfo()
+        value = _GXCommon.getData(settings, data, info)
+        if not info.complete:
+            return None
+        return value
+
+    @classmethod
+    def __getDescriptor(cls, data, method=False):
+        ci = data.getUInt16()
+        ln = bytearray(6)
+        data.get(ln)
+        index = data.getUInt8()
+        try:
+            ot = ObjectType(ci).name
+        except ValueError:
+            ot = None
+        return {
+            "classId": ci,
+            "objectType": ot,
+            "logicalName": _GXCommon.toLogicalName(ln),
+            "methodId" if method else "attributeId": index,
+        }
+
+    @classmethod
+    def __getSelection(cls, settings, data, descriptor):
+        if data.getUInt8() != 0:
+            descriptor["selector"] = data.getUInt8()
+            descriptor["parameters"] = cls.__getValue(settings, data)
+
+    @classmethod
+    def __getRawData(cls, data):
+        count = _GXCommon.getObjectCount(data)
+        return GXByteBuffer.hex(data.subArray(data.position, count), False)
+
+    @classmethod
+    def __getResult(cls, settings, data, ret):
+        # Get-Data-Result choice.
+        if data.getUInt8() == 0:
+            ret.setdefault("values", []).append(cls.__getValue(settings, data))
+        else:
+            ret.setdefault("results", []).append(data.getUInt8())
+
+    #
+    # Decode PDU.
+    #
+    # @param settings
+    #            DLMS settings.
+    # @param data
+    #            PDU as GXByteBuffer.
+    # @return Dictionary with command and decoded fields.
+    #
+    @classmethod
+    def decodePdu(cls, settings, data):
+        # pylint: disable=too-many-branches,too-many-statements
+        cmd = data.getUInt8()
+        ret = {"command": Command.toString(cmd), "commandId": cmd}
+        if cmd in (Command.GET_REQUEST, Command.SET_REQUEST, Command.METHOD_REQUEST):
+            type_ = data.getUInt8()
+            ret["type"] = type_
+            ret["invokeId"] = data.getUInt8()
+            if cmd == Command.GET_REQUEST:
+                if type_ == 1:
+                    it = cls.__getDescriptor(data)
+                    cls.__getSelection(settings, data, it)
+                    ret["attributes"] = [it]
+                elif type_ == 2:
+                    ret["blockNumber"] = data.getUInt32()
+                elif type_ == 3:
+                    ret["attributes"] = []
+                    for _ in range(_GXCommon.getObjectCount(data)):
+                        it = cls.__getDescriptor(data)
+                        cls.__getSelection(settings, data, it)
+                        ret["attributes"].append(it)
+            elif cmd == Command.SET_REQUEST:
+                if type_ in (1, 2):
+                    it = cls.__getDescriptor(data)
+                    cls.__getSelection(settings, data, it)
+                    ret["attributes"] = [it]
+                elif type_ in (4, 5):
+                    ret["attributes"] = []
+                    for _ in range(_GXCommon.getObjectCount(data)):
+                        it = cls.__getDescriptor(data)
+                        cls.__getSelection(settings, data, it)
+                        ret["attributes"].append(it)
+                if type_ in (2, 3, 5):
+                    ret["lastBlock"] = data.getUInt8() != 0
+                    ret["blockNumber"] = data.getUInt32()
+                    ret["rawData"] = cls.__getRawData(data)
+                elif type_ == 1:
+                    ret["values"] = [cls.__getValue(settings, data)]
+                elif type_ == 4:
+                    ret["values"] = [
+                        cls.__getValue(settings, data)
+                        for _ in range(_GXCommon.getObjectCount(data))
+                    ]
+            elif type_ == 1:
+                it = cls.__getDescriptor(data, True)
+                ret["methods"] = [it]
+                if data.getUInt8() != 0:
+                    ret["values"] = [cls.__getValue(settings, data)]
+        elif cmd in (Command.GET_RESPONSE, Command.SET_RESPONSE, Command.METHOD_RESPONSE):
+            type_ = data.getUInt8()
+            ret["type"] = type_
+            ret["invokeId"] = data.getUInt8()
+            if cmd == Command.GET_RESPONSE:
+                if type_ == 1:
+                    cls.__getResult(settings, data, ret)
+                elif type_ == 2:
+                    ret["lastBlock"] = data.getUInt8() != 0
+                    ret["blockNumber"] = data.getUInt32()
+                    if data.getUInt8() == 0:
+                        ret["rawData"] = cls.__getRawData(data)
+                    else:
+                        ret["results"] = [data.getUInt8()]
+                elif type_ == 3:
+                    for _ in range(_GXCommon.getObjectCount(data)):
+                        cls.__getResult(settings, data, ret)
+            elif cmd == Command.SET_RESPONSE:
+                if type_ in (1, 3):
+                    ret["results"] = [data.getUInt8()]
+                elif type_ == 5:
+                    ret["results"] = [
+                        data.getUInt8() for _ in range(_GXCommon.getObjectCount(data))
+                    ]
+                if type_ in (2, 3):
+                    ret["blockNumber"] = data.getUInt32()
+            elif type_ == 1:
+                ret["results"] = [data.getUInt8()]
+                if data.available() and data.getUInt8() != 0:
+                    cls.__getResult(settings, data, ret)
+        elif cmd == Command.DATA_NOTIFICATION:
+            ret["invokeId"] = data.getUInt32()
+            count = data.getUInt8()
+            if count != 0:
+                ret["time"] = GXByteBuffer.hex(data.subArray(data.position, count), False)
+                data.position = data.position + count
+            ret["values"] = [cls.__getValue(settings, data)]
+        elif cmd == Command.EVENT_NOTIFICATION:
+            if data.getUInt8() != 0:
+                count = data.getUInt8()
+                ret["time"] = GXByteBuffer.hex(data.subArray(data.position, count), False)
+                data.position = data.position + count
+            ret["attributes"] = [cls.__getDescriptor(data)]
+            ret["values"] = [cls.__getValue(settings, data)]
+        elif cmd == Command.EXCEPTION_RESPONSE:
+            ret["stateError"] = data.getUInt8()
+            ret["serviceError"] = data.getUInt8()
+        elif cmd == Command.GENERAL_BLOCK_TRANSFER:
+            control = data.getUInt8()
+            ret["lastBlock"] = control & 0x80 != 0
+            ret["streaming"] = control & 0x40 != 0
+            ret["window"] = control & 0x3F
+            ret["blockNumber"] = data.getUInt16()
+            ret["blockNumberAck"] = data.getUInt16()
+            ret["rawData"] = cls.__getRawData(data)
+        elif cmd in cls.__CIPHERED:
+            _GXCommon.getObjectCount(data)
+            ret["security"] = cls.__getSecurityHeader(data)
+        elif cmd in (Command.GENERAL_GLO_CIPHERING, Command.GENERAL_DED_CIPHERING):
+            count = _GXCommon.getObjectCount(data)
+            systemTitle = data.subArray(data.position, count)
+            data.position = data.position + count
+            _GXCommon.getObjectCount(data)
+            ret["security"] = cls.__getSecurityHeader(data)
+            ret["security"]["systemTitle"] = GXByteBuffer.hex(systemTitle, False)
+        return ret
+
+    @classmethod
+    def __getSecurityHeader(cls, data):
+        sc = data.getUInt8()
+        return {
+            "securityControl": sc,
+            "security": sc & 0x30,
+            "keySet": (sc >> 6) & 1,
+            "compression": sc & 0x80 != 0,
+            "invocationCounter": data.getUInt32(),
+        }
+
+    #
+    # Convert decoded value to type that can be serialized to JSON.
+    #
+    @classmethod
+    def toJson(cls, value):
+        if isinstance(value, (bytearray, bytes)):
+            return GXByteBuffer.hex(value, False)
+        if isinstance(value, GXDateTime) and value.value is not None:
+            return value.value.isoformat()
+        if isinstance(value, (list, tuple)):
+            return [cls.toJson(it) for it in value]
+        if isinstance(value, dict):
+            return {k: cls.toJson(v) for k, v in value.items()}
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        return str(value)
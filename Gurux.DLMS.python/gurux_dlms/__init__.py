@@ -38,36 +38,30 @@ from .ActionResponseType import ActionResponseType
 from .ConfirmedServiceError import ConfirmedServiceError
 from .ConnectionState import ConnectionState
 from .GetCommandType import GetCommandType
-from ._GXAPDU import _GXAPDU
 from .GXBitString import GXBitString
 from .GXByteBuffer import GXByteBuffer
 from .GXTimeZone import GXTimeZone
 from .GXDate import GXDate
 from .GXDateTime import GXDateTime
-from .GXDLMS import GXDLMS
 from .GXDLMSAccessItem import GXDLMSAccessItem
-from .GXDLMSClient import GXDLMSClient
 from .GXDLMSConfirmedServiceError import GXDLMSConfirmedServiceError
 from .GXDLMSExceptionResponse import GXDLMSExceptionResponse
 from .GXDLMSConnectionEventArgs import GXDLMSConnectionEventArgs
-from .GXDLMSConverter import GXDLMSConverter
+from .GXDLMSCaptureRecord import GXDLMSCaptureRecord
 from .GXDLMSException import GXDLMSException
 from .GXDLMSGateway import GXDLMSGateway
+from .GXDLMSHistogram import GXDLMSHistogram
 from .GXDLMSLimits import GXDLMSLimits
 from .GXHdlcSettings import GXHdlcSettings
-from .GXDLMSLNCommandHandler import GXDLMSLNCommandHandler
 from .GXDLMSLNParameters import GXDLMSLNParameters
 from .GXDLMSLongTransaction import GXDLMSLongTransaction
-from .GXDLMSNotify import GXDLMSNotify
-from .GXDLMSServer import GXDLMSServer
-from .GXDLMSSettings import GXDLMSSettings
-from .GXDLMSSNCommandHandler import GXDLMSSNCommandHandler
+from .GXDLMSMetrics import GXDLMSMetrics
+from .GXDLMSReadPlanner import GXDLMSReadPlanner
+from .GXDLMSRequestPipeline import GXDLMSRequestPipeline
+from .GXDLMSResponseCache import GXDLMSResponseCache
 from .GXDLMSSNParameters import GXDLMSSNParameters
-from .GXDLMSTranslator import GXDLMSTranslator
-from .GXDLMSTranslatorStructure import GXDLMSTranslatorStructure
-from .GXDLMSXmlClient import GXDLMSXmlClient
+from .GXDLMSTracer import GXDLMSTracer
 from .GXDLMSXmlPdu import GXDLMSXmlPdu
-from .GXDLMSXmlSettings import GXDLMSXmlSettings
 from .GXICipher import GXICipher
 from .GXReplyData import GXReplyData
 from .GXServerReply import GXServerReply
@@ -92,17 +86,11 @@ from .SetResponseType import SetResponseType
 from .SingleReadResponse import SingleReadResponse
 from .SingleWriteResponse import SingleWriteResponse
 from .TranslatorGeneralTags import TranslatorGeneralTags
-from .TranslatorSimpleTags import TranslatorSimpleTags
-from .TranslatorStandardTags import TranslatorStandardTags
 from .TranslatorTags import TranslatorTags
-from .ValueEventArgs import ValueEventArgs
 from .VariableAccessSpecification import VariableAccessSpecification
-from ._GXObjectFactory import _GXObjectFactory
 from ._GXFCS16 import _GXFCS16
 from .CountType import CountType
 from .AesGcmParameter import AesGcmParameter
-from .GXCiphering import GXCiphering
-from .GXDLMSChippering import GXDLMSChippering
 from .GXDLMSChipperingStream import GXDLMSChipperingStream
 from .GXEnum import GXEnum
 from .GXInt8 import GXInt8
@@ -120,4 +108,82 @@ from .GXIntFlag import GXIntFlag
 from .GXDLMSTranslatorMessage import GXDLMSTranslatorMessage
 from .IGXCryptoNotifier import IGXCryptoNotifier
 from .GXCryptoKeyParameter import GXCryptoKeyParameter
+from ._GXLazyModule import _GXLazyModule
+
 name = "gurux_dlms"
+
+# Classes that import most of the package, like client, server and
+# translator, are imported when they are used the first time. The imports
+# below are used by static code analysis and by Python versions where the
+# module class can't be changed.
+if not _GXLazyModule.install(
+    __name__,
+    {
+        "_GXAPDU": "._GXAPDU",
+        "GXDLMS": ".GXDLMS",
+        "GXDLMSClient": ".GXDLMSClient",
+        "GXDLMSBulkDecoder": ".GXDLMSBulkDecoder",
+        "GXDLMSCaptureLog": ".GXDLMSCaptureLog",
+        "GXDLMSConverter": ".GXDLMSConverter",
+        "GXDLMSEncoderPlan": ".GXDLMSEncoderPlan",
+        "GXDLMSExporter": ".GXDLMSExporter",
+        "GXDLMSFrameCache": ".GXDLMSFrameCache",
+        "GXDLMSGbtWindow": ".GXDLMSGbtWindow",
+        "GXDLMSImageTransferEngine": ".GXDLMSImageTransferEngine",
+        "GXHdlcWindow": ".GXHdlcWindow",
+        "GXDLMSLNCommandHandler": ".GXDLMSLNCommandHandler",
+        "GXDLMSNotify": ".GXDLMSNotify",
+        "GXDLMSServer": ".GXDLMSServer",
+        "GXDLMSSettings": ".GXDLMSSettings",
+        "GXDLMSSNCommandHandler": ".GXDLMSSNCommandHandler",
+        "GXDLMSTranslator": ".GXDLMSTranslator",
+        "GXDLMSTranslatorStructure": ".GXDLMSTranslatorStructure",
+        "GXDLMSXmlClient": ".GXDLMSXmlClient",
+        "GXDLMSXmlSettings": ".GXDLMSXmlSettings",
+        "TranslatorSimpleTags": ".TranslatorSimpleTags",
+        "TranslatorStandardTags": ".TranslatorStandardTags",
+        "ValueEventArgs": ".ValueEventArgs",
+        "_GXObjectFactory": "._GXObjectFactory",
+        "GXCiphering": ".GXCiphering",
+        "GXDLMSChippering": ".GXDLMSChippering",
+        "GXDLMSTranslatorStream": ".GXDLMSTranslatorStream",
+    },
+    [
+        "asn",
+        "ecdsa",
+        "enums",
+        "internal",
+        "manufacturersettings",
+        "objects",
+        "plc",
+        "secure",
+    ],
+):
+    from ._GXAPDU import _GXAPDU
+    from .GXDLMS import GXDLMS
+    from .GXDLMSClient import GXDLMSClient
+    from .GXDLMSBulkDecoder import GXDLMSBulkDecoder
+    from .GXDLMSCaptureLog import GXDLMSCaptureLog
+    from .GXDLMSConverter import GXDLMSConverter
+    from .GXDLMSEncoderPlan import GXDLMSEncoderPlan
+    from .GXDLMSExporter import GXDLMSExporter
+    from .GXDLMSFrameCache import GXDLMSFrameCache
+    from .GXDLMSGbtWindow import GXDLMSGbtWindow
+    from .GXDLMSImageTransferEngine import GXDLMSImageTransferEngine
+    from .GXHdlcWindow import GXHdlcWindow
+    from .GXDLMSLNCommandHandler import GXDLMSLNCommandHandler
+    from .GXDLMSNotify import GXDLMSNotify
+    from .GXDLMSServer import GXDLMSServer
+    from .GXDLMSSettings import GXDLMSSettings
+    from .GXDLMSSNCommandHandler import GXDLMSSNCommandHandler
+    from .GXDLMSTranslator import GXDLMSTranslator
+    from .GXDLMSTranslatorStructure import GXDLMSTranslatorStructure
+    from .GXDLMSXmlClient import GXDLMSXmlClient
+    from .GXDLMSXmlSettings import GXDLMSXmlSettings
+    from .TranslatorSimpleTags import TranslatorSimpleTags
+    from .TranslatorStandardTags import TranslatorStandardTags
+    from .ValueEventArgs import ValueEventArgs
+    from ._GXObjectFactory import _GXObjectFactory
+    from .GXCiphering import GXCiphering
+    from .GXDLMSChippering import GXDLMSChippering
+    from .GXDLMSTranslatorStream import GXDLMSTranslatorStream
@@ -31,7 +31,6 @@
 #  This code is licensed under the GNU General Public License v2.
 #  Full text may be retrieved at http:#www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
-import sys
 import re
 from .enums.CertificateVersion import CertificateVersion
 from .enums.HashAlgorithm import HashAlgorithm
@@ -60,9 +59,6 @@ from .enums.ExtendedKeyUsage import ExtendedKeyUsage
 from .GXx509Certificate import GXx509Certificate
 from ..GXArray import GXArray
 
-if sys.version_info >= (3, 0):
-    import urllib.request
-
 
 # pylint: disable=too-many-instance-attributes
 class GXPkcs10:
@@ -464,6 +460,9 @@ class GXPkcs10:
             usage += it.certificate.toDer()
             usage += '"}'
 
+        # pylint: disable=import-outside-toplevel
+        import urllib.request
+
         der = '{"Certificates":[' + usage + "]}"
         req = urllib.request.Request(address, der.encode("utf-8"), method="POST")
         req.add_header("Content-Type", "application/json")
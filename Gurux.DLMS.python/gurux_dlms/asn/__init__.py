@@ -31,23 +31,50 @@
 #  This code is licensed under the GNU General Public License v2.
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
+from .._GXLazyModule import _GXLazyModule
 
-
-from .GXAsn1Context import GXAsn1Context
-from .GXAsn1Converter import GXAsn1Converter
-from .GXAsn1Ia5String import GXAsn1Ia5String
-from .GXAsn1Integer import GXAsn1Integer
-from .GXAsn1ObjectIdentifier import GXAsn1ObjectIdentifier
-from .GXAsn1Sequence import GXAsn1Sequence
-from .GXAsn1Settings import GXAsn1Settings
-from .GXAsn1Utf8String import GXAsn1Utf8String
-from .GXCertificateRequest import GXCertificateRequest
-from .GXPkcs10 import GXPkcs10
-from .GXPkcs8 import GXPkcs8
-from .GXx509Certificate import GXx509Certificate
-from .GXx509CertificateCollection import GXx509CertificateCollection
-from .HashAlgorithmConverter import HashAlgorithmConverter
-from .PkcsObjectIdentifierConverter import PkcsObjectIdentifierConverter
-from .X509CertificateTypeConverter import X509CertificateTypeConverter
-from .X9ObjectIdentifierConverter import X9ObjectIdentifierConverter
-from .GXAsn1PublicKey import GXAsn1PublicKey
+# Exported classes are imported when they are used the first time. The
+# imports below are used by static code analysis and by Python versions where
+# the module class can't be changed.
+if not _GXLazyModule.install(
+    __name__,
+    {
+        "GXAsn1Context": ".GXAsn1Context",
+        "GXAsn1Converter": ".GXAsn1Converter",
+        "GXAsn1Ia5String": ".GXAsn1Ia5String",
+        "GXAsn1Integer": ".GXAsn1Integer",
+        "GXAsn1ObjectIdentifier": ".GXAsn1ObjectIdentifier",
+        "GXAsn1Sequence": ".GXAsn1Sequence",
+        "GXAsn1Settings": ".GXAsn1Settings",
+        "GXAsn1Utf8String": ".GXAsn1Utf8String",
+        "GXCertificateRequest": ".GXCertificateRequest",
+        "GXPkcs10": ".GXPkcs10",
+        "GXPkcs8": ".GXPkcs8",
+        "GXx509Certificate": ".GXx509Certificate",
+        "GXx509CertificateCollection": ".GXx509CertificateCollection",
+        "HashAlgorithmConverter": ".HashAlgorithmConverter",
+        "PkcsObjectIdentifierConverter": ".PkcsObjectIdentifierConverter",
+        "X509CertificateTypeConverter": ".X509CertificateTypeConverter",
+        "X9ObjectIdentifierConverter": ".X9ObjectIdentifierConverter",
+        "GXAsn1PublicKey": ".GXAsn1PublicKey",
+    },
+    ["enums"],
+):
+    from .GXAsn1Context import GXAsn1Context
+    from .GXAsn1Converter import GXAsn1Converter
+    from .GXAsn1Ia5String import GXAsn1Ia5String
+    from .GXAsn1Integer import GXAsn1Integer
+    from .GXAsn1ObjectIdentifier import GXAsn1ObjectIdentifier
+    from .GXAsn1Sequence import GXAsn1Sequence
+    from .GXAsn1Settings import GXAsn1Settings
+    from .GXAsn1Utf8String import GXAsn1Utf8String
+    from .GXCertificateRequest import GXCertificateRequest
+    from .GXPkcs10 import GXPkcs10
+    from .GXPkcs8 import GXPkcs8
+    from .GXx509Certificate import GXx509Certificate
+    from .GXx509CertificateCollection import GXx509CertificateCollection
+    from .HashAlgorithmConverter import HashAlgorithmConverter
+    from .PkcsObjectIdentifierConverter import PkcsObjectIdentifierConverter
+    from .X509CertificateTypeConverter import X509CertificateTypeConverter
+    from .X9ObjectIdentifierConverter import X9ObjectIdentifierConverter
+    from .GXAsn1PublicKey import GXAsn1PublicKey
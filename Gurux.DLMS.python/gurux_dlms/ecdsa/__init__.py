@@ -31,9 +31,26 @@
 #  This code is licensed under the GNU General Public License v2.
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
-from .GXPrivateKey import GXPrivateKey
-from .GXPublicKey import GXPublicKey
-from .GXEccPoint import GXEccPoint
-from .GXCurve import GXCurve
-from ._GXShamirs import _GXShamirs
-from .GXEcdsa import GXEcdsa
+from .._GXLazyModule import _GXLazyModule
+
+# Exported classes are imported when they are used the first time. The
+# imports below are used by static code analysis and by Python versions where
+# the module class can't be changed.
+if not _GXLazyModule.install(
+    __name__,
+    {
+        "GXPrivateKey": ".GXPrivateKey",
+        "GXPublicKey": ".GXPublicKey",
+        "GXEccPoint": ".GXEccPoint",
+        "GXCurve": ".GXCurve",
+        "_GXShamirs": "._GXShamirs",
+        "GXEcdsa": ".GXEcdsa",
+    },
+    ["enums"],
+):
+    from .GXPrivateKey import GXPrivateKey
+    from .GXPublicKey import GXPublicKey
+    from .GXEccPoint import GXEccPoint
+    from .GXCurve import GXCurve
+    from ._GXShamirs import _GXShamirs
+    from .GXEcdsa import GXEcdsa
@@ -0,0 +1,55 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from ..GXIntEnum import GXIntEnum
+
+class ReadPolicy(GXIntEnum):
+    """
+    Enumerates how often attribute values are read by the read planner.
+    """
+    #pylint: disable=too-few-public-methods
+
+    #Attribute is read on every collection cycle.
+    ALWAYS = 0
+
+    #Attribute is read only once.
+    STATIC = 1
+
+    #Attribute is read once a day.
+    DAILY = 2
+
+    #Attribute is read when given interval has elapsed from the last read.
+    INTERVAL = 3
+
+    #Attribute is never read.
+    NEVER = 4
@@ -48,6 +48,7 @@ from .DateTimeExtraInfo import DateTimeExtraInfo
 from .Definition import Definition
 from .ErrorCode import ErrorCode
 from .ExceptionServiceError import ExceptionServiceError
+from .ExportFormat import ExportFormat
 from .HardwareResource import HardwareResource
 from .Initiate import Initiate
 from .InterfaceType import InterfaceType
@@ -62,6 +63,7 @@ from .Security import Security
 from .ServiceClass import ServiceClass
 from .ServiceError import ServiceError
 from .SourceDiagnostic import SourceDiagnostic
+from .ReadPolicy import ReadPolicy
 from .Standard import Standard
 from .StateError import StateError
 from .Task import Task
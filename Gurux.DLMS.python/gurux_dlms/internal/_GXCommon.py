@@ -35,10 +35,12 @@
 from datetime import datetime
 from ..GXTimeZone import GXTimeZone
 from ._GXDataInfo import _GXDataInfo
+from ._GXDateTimeCodec import _GXDateTimeCodec
+from ._GXLazyDateTime import _GXLazyDateTime
 from ..GXByteBuffer import GXByteBuffer
 from ..GXBitString import GXBitString
 from ..enums import DataType
-from ..enums import DateTimeSkips, DateTimeExtraInfo, ClockStatus
+from ..enums import DateTimeSkips, DateTimeExtraInfo
 from ..TranslatorTags import TranslatorTags
 from ..enums.TranslatorOutputType import TranslatorOutputType
 from ..GXArray import GXArray
@@ -236,6 +238,52 @@ class _GXCommon:
                 ret = GXByteBuffer.hex(ret)
         return ret
 
+    # Sizes of the fixed size data types.
+    __DATA_SIZES = {
+        int(DataType.NONE): 0,
+        int(DataType.BOOLEAN): 1,
+        int(DataType.BCD): 1,
+        int(DataType.INT8): 1,
+        int(DataType.UINT8): 1,
+        int(DataType.ENUM): 1,
+        int(DataType.INT16): 2,
+        int(DataType.UINT16): 2,
+        int(DataType.INT32): 4,
+        int(DataType.UINT32): 4,
+        int(DataType.FLOAT32): 4,
+        int(DataType.TIME): 4,
+        int(DataType.DATE): 5,
+        int(DataType.INT64): 8,
+        int(DataType.UINT64): 8,
+        int(DataType.FLOAT64): 8,
+        int(DataType.DATETIME): 12,
+    }
+
+    #
+    # Move position over one DLMS value without parsing it.
+    #
+    # data
+    # Received data.
+    #
+    @classmethod
+    def skipData(cls, data):
+        type_ = data.getUInt8()
+        size = cls.__DATA_SIZES.get(type_)
+        if size is not None:
+            data.position = data.position + size
+        elif type_ in (DataType.ARRAY, DataType.STRUCTURE):
+            for _ in range(cls.getObjectCount(data)):
+                cls.skipData(data)
+        elif type_ in (DataType.OCTET_STRING, DataType.STRING, DataType.STRING_UTF8):
+            size = cls.getObjectCount(data)
+            data.position = data.position + size
+        elif type_ == DataType.BITSTRING:
+            size = cls.getObjectCount(data)
+            data.position = data.position + int((size + 7) / 8)
+        else:
+            data.position = data.position - 1
+            cls.getData(None, data, _GXDataInfo())
+
     #
     # Get data from DLMS frame.
     #
@@ -519,111 +567,36 @@ class _GXCommon:
     #
     @classmethod
     def getDateTime(cls, settings, buff, info):
-        # pylint: disable=too-many-locals, broad-except
+        # pylint: disable=broad-except,protected-access
         value = None
-        skip = DateTimeSkips.NONE
         #  If there is not enough data available.
-        if len(buff) - buff.position < 12:
+        if len(buff) - buff.position < _GXDateTimeCodec.SIZE:
             info.complete = False
             return None
-        str_ = None
-        if info.xml:
-            str_ = buff.toHex(False, buff.position, 12)
-        dt = GXDateTime()
-        try:
-            #  Get year.
-            year = buff.getUInt16()
-            #  Get month
-            month = buff.getUInt8()
-            #  Get day
-            day = buff.getUInt8()
-            #  Skip week day
-            dayOfWeek = buff.getUInt8()
-            if dayOfWeek == 0xFF:
-                skip |= DateTimeSkips.DAY_OF_WEEK
-            else:
-                dt.dayOfWeek = dayOfWeek
-            #  Get time.
-            hour = buff.getUInt8()
-            minute = buff.getUInt8()
-            second = buff.getUInt8()
-            ms = buff.getUInt8() & 0xFF
-            if ms != 0xFF:
-                ms *= 10
-            else:
-                ms = -1
-            deviation = buff.getInt16()
-            if deviation == -32768:
-                deviation = 0x8000
-                skip |= DateTimeSkips.DEVITATION
-            status = buff.getUInt8()
-            dt.status = status
-            if year < 1900 or year == 0xFFFF:
-                skip |= DateTimeSkips.YEAR
-                year = 2000
-            if month == 0xFE:
-                dt.extra |= DateTimeExtraInfo.DST_BEGIN
-                month = 1
-            elif month == 0xFD:
-                dt.extra |= DateTimeExtraInfo.DST_END
-                month = 1
-            else:
-                if month < 1 or month > 12:
-                    skip |= DateTimeSkips.MONTH
-                    month = 1
-
-            if day == 0xFE:
-                dt.extra |= DateTimeExtraInfo.LAST_DAY
-                day = 1
-            elif day == 0xFD:
-                dt.extra |= DateTimeExtraInfo.LAST_DAY2
-                day = 1
-            else:
-                if day == -1 or day == 0 or day > 31:
-                    skip |= DateTimeSkips.DAY
-                    day = 1
-
-            if hour < 0 or hour > 24:
-                skip |= DateTimeSkips.HOUR
-                hour = 0
-            if minute < 0 or minute > 60:
-                skip |= DateTimeSkips.MINUTE
-                minute = 0
-            if second < 0 or second > 60:
-                skip |= DateTimeSkips.SECOND
-                second = 0
-            #  If ms is Zero it's skipped.
-            if ms < 0 or ms > 1000:
-                skip |= DateTimeSkips.MILLISECOND
-                ms = 0
-            tz = None
-            if deviation != 0x8000:
-                if settings.useUtc2NormalTime:
-                    tz = deviation
-                else:
-                    tz = -deviation
-            if tz is None:
-                dt.value = datetime(year, month, day, hour, minute, second, ms * 1000)
-            else:
-                dt.value = datetime(
-                    year,
-                    month,
-                    day,
-                    hour,
-                    minute,
-                    second,
-                    ms * 1000,
-                    tzinfo=GXTimeZone(tz),
+        index = buff.position
+        buff.position += _GXDateTimeCodec.SIZE
+        if info.xml is None:
+            if settings.lazyDateTime:
+                return _GXLazyDateTime(
+                    bytes(buff._data[index : buff.position]),
+                    settings.useUtc2NormalTime,
                 )
-            dt.skip = skip
-            value = dt
-        except Exception as ex:
-            if info.xml is None:
-                raise ex
-        if info.xml:
-            if dt.skip & DateTimeSkips.YEAR == 0 and value:
-                info.xml.appendComment(str(value))
-            info.xml.appendLine(info.xml.getDataType(info.type_), None, str_)
+            return _GXDateTimeCodec.decode(
+                GXDateTime(), buff._data, index, settings.useUtc2NormalTime
+            )
+        str_ = buff.toHex(False, index, _GXDateTimeCodec.SIZE)
+        try:
+            value = _GXDateTimeCodec.decode(
+                GXDateTime(),
+                buff._data,
+                index,
+                settings is not None and settings.useUtc2NormalTime,
+            )
+        except Exception:
+            value = None
+        if value and value.skip & DateTimeSkips.YEAR == 0:
+            info.xml.appendComment(str(value))
+        info.xml.appendLine(info.xml.getDataType(info.type_), None, str_)
         return value
 
     #
@@ -795,14 +768,14 @@ class _GXCommon:
         if dt == DataType.STRING:
             while buff.position - start < len_:
                 tmp.clear()
-                tmp.type = dt
+                tmp.type_ = dt
                 list_.append(cls.getString(buff, tmp, False))
                 if not tmp.complete:
                     break
         elif dt == DataType.OCTET_STRING:
             while buff.position - start < len_:
                 tmp.clear()
-                tmp.type = dt
+                tmp.type_ = dt
                 list_.append(cls.getOctetString(settings, buff, tmp, False))
                 if not tmp.complete:
                     break
@@ -1405,28 +1378,7 @@ class _GXCommon:
     #
     @classmethod
     def setTime(cls, buff, value):
-        dt = _GXCommon.__getDateTime(value)
-        #  Add time.
-        if dt.skip & DateTimeSkips.HOUR != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.hour)
-        if dt.skip & DateTimeSkips.MINUTE != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.minute)
-        if dt.skip & DateTimeSkips.SECOND != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.second)
-        if dt.skip & DateTimeSkips.MILLISECOND != DateTimeSkips.NONE:
-            #  Hundredth of seconds is not used.
-            buff.setUInt8(0xFF)
-        else:
-            ms = dt.value.microsecond
-            if ms != 0:
-                ms /= 10000
-            buff.setUInt8(int(ms))
+        buff.set(_GXDateTimeCodec.encodeTime(_GXCommon.__getDateTime(value)))
 
     #
     # Convert date to DLMS bytes.
@@ -1438,39 +1390,7 @@ class _GXCommon:
     #
     @classmethod
     def setDate(cls, buff, value):
-        dt = _GXCommon.__getDateTime(value)
-        #  Add year.
-        if dt.skip & DateTimeSkips.YEAR != DateTimeSkips.NONE:
-            buff.setUInt16(0xFFFF)
-        else:
-            buff.setUInt16(dt.value.year)
-        #  Add month
-        if dt.extra & DateTimeExtraInfo.DST_BEGIN != 0:
-            buff.setUInt8(0xFE)
-        elif dt.extra & DateTimeExtraInfo.DST_END != 0:
-            buff.setUInt8(0xFD)
-        elif dt.skip & DateTimeSkips.MONTH != 0:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.month)
-        #  Add day
-        if dt.extra & DateTimeExtraInfo.LAST_DAY2 != DateTimeSkips.NONE:
-            buff.setUInt8(0xFD)
-        elif dt.extra & DateTimeExtraInfo.LAST_DAY != DateTimeSkips.NONE:
-            buff.setUInt8(0xFE)
-        elif dt.skip & DateTimeSkips.DAY != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.day)
-
-        #  Day of week.
-        if dt.skip & DateTimeSkips.DAY_OF_WEEK != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            if dt.dayOfWeek == 0:
-                buff.setUInt8(dt.value.weekday() + 1)
-            else:
-                buff.setUInt8(dt.dayOfWeek)
+        buff.set(_GXDateTimeCodec.encodeDate(_GXCommon.__getDateTime(value)))
 
     @classmethod
     def __getDateTime(cls, value):
@@ -1494,84 +1414,15 @@ class _GXCommon:
     #
     @classmethod
     def setDateTime(cls, settings, buff, value):
-        dt = cls.__getDateTime(value)
-        skip = dt.skip
-        if settings and settings.dateTimeSkips:
-            skip = skip or settings.dateTimeSkips
-
-        #  Add year.
-        if skip & DateTimeSkips.YEAR != DateTimeSkips.NONE:
-            buff.setUInt16(0xFFFF)
-        else:
-            buff.setUInt16(dt.value.year)
-        #  Add month
-        if dt.extra & DateTimeExtraInfo.DST_BEGIN != 0:
-            buff.setUInt8(0xFD)
-        elif dt.extra & DateTimeExtraInfo.DST_END != 0:
-            buff.setUInt8(0xFE)
-        elif skip & DateTimeSkips.MONTH != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.month)
-
-        #  Add day
-        if dt.extra & DateTimeExtraInfo.LAST_DAY2 != DateTimeSkips.NONE:
-            buff.setUInt8(0xFD)
-        elif dt.extra & DateTimeExtraInfo.LAST_DAY != DateTimeSkips.NONE:
-            buff.setUInt8(0xFE)
-        elif skip & DateTimeSkips.DAY != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.day)
-        #  Day of week.
-        if skip & DateTimeSkips.DAY_OF_WEEK != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            if dt.dayOfWeek == 0:
-                buff.setUInt8(dt.value.weekday() + 1)
-            else:
-                buff.setUInt8(dt.dayOfWeek)
-        #  Add time.
-        if skip & DateTimeSkips.HOUR != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.hour)
-        if skip & DateTimeSkips.MINUTE != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.minute)
-        if skip & DateTimeSkips.SECOND != DateTimeSkips.NONE:
-            buff.setUInt8(0xFF)
-        else:
-            buff.setUInt8(dt.value.second)
-        if skip & DateTimeSkips.MILLISECOND != DateTimeSkips.NONE:
-            #  Hundredth of seconds is not used.
-            buff.setUInt8(0xFF)
-        else:
-            ms = dt.value.microsecond
-            if ms != 0:
-                ms /= 10000
-            buff.setUInt8(int(ms))
-        #  devitation not used.
-        if skip & DateTimeSkips.DEVITATION != DateTimeSkips.NONE:
-            buff.setUInt16(0x8000)
-        else:
-            #  Add devitation.
-            d = int(dt.value.utcoffset().seconds / 60)
-            if not (settings and settings.useUtc2NormalTime):
-                d = -d
-            buff.setUInt16(d)
-        #  Add clock_status
-        if skip & DateTimeSkips.STATUS == DateTimeSkips.NONE:
-            if (
-                dt.value.dst()
-                or dt.status & ClockStatus.DAYLIGHT_SAVE_ACTIVE != ClockStatus.OK
-            ):
-                buff.setUInt8(dt.status | ClockStatus.DAYLIGHT_SAVE_ACTIVE)
-            else:
-                buff.setUInt8(dt.status)
-        else:
-            buff.setUInt8(0xFF)
+        if isinstance(value, _GXLazyDateTime) and not (
+            settings and settings.dateTimeSkips
+        ):
+            # Received value is not modified. Bytes are used as they are.
+            raw = value.getRaw(settings is not None and settings.useUtc2NormalTime)
+            if raw is not None:
+                buff.set(raw)
+                return
+        buff.set(_GXDateTimeCodec.encode(settings, cls.__getDateTime(value)))
 
     @classmethod
     def setBcd(cls, buff, value):
@@ -1624,8 +1475,10 @@ class _GXCommon:
     def setBitString(cls, buff, val1, addCount):
         value = val1
         if isinstance(value, GXBitString):
-            value = value.value
-        if isinstance(value, str):
+            if addCount:
+                _GXCommon.setObjectCount(value.length, buff)
+            buff.set(value.value)
+        elif isinstance(value, str):
             val = 0
             str_ = str(value)
             if addCount:
@@ -1851,14 +1704,14 @@ class _GXCommon:
             if len(dateString) > 13:
                 second = int(dateString[12:14])
             return datetime(
-                year, month, day, hour, minute, second, 0, tzinfo=GXTimeZone(0)
+                year, month, day, hour, minute, second, 0, tzinfo=GXTimeZone.fromOffset(0)
             )
 
         if len(dateString) > 17:
             second = int(dateString[12:14])
         tz = dateString[len(dateString) - 4 :]
         return datetime(
-            year, month, day, hour, minute, second, 0, tzinfo=GXTimeZone(tz)
+            year, month, day, hour, minute, second, 0, tzinfo=GXTimeZone.fromOffset(tz)
         )
 
     @classmethod
@@ -39,6 +39,8 @@ from ..enums import DataType
 class _GXDataInfo:
     """This class is used in DLMS data parsing."""
 
+    __slots__ = ("index", "count", "type_", "complete", "xml")
+
     def __init__(self):
         """Constructor."""
         # Last array index.
@@ -0,0 +1,309 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+import struct
+from datetime import datetime
+from ..enums import DateTimeSkips, DateTimeExtraInfo, ClockStatus
+from ..GXTimeZone import GXTimeZone
+
+
+###Python 2 requires this
+# pylint: disable=bad-option-value,old-style-class,too-few-public-methods
+class _GXDateTimeCodec:
+    """
+    Converts COSEM date-time between 12 bytes and GXDateTime.
+    All fields are read and written with one struct call.
+    """
+
+    # Year, month, day, day of week, hour, minute, second,
+    # hundredths of second, deviation and clock status.
+    __FORMAT = struct.Struct(">HBBBBBBBhB")
+    # Year, month, day and day of week.
+    __DATE_FORMAT = struct.Struct(">HBBB")
+    # Hour, minute, second and hundredths of second.
+    __TIME_FORMAT = struct.Struct(">BBBB")
+
+    # Flags are handled as integers. Enum operators are slow.
+    _SKIP_YEAR = int(DateTimeSkips.YEAR)
+    _SKIP_MONTH = int(DateTimeSkips.MONTH)
+    _SKIP_DAY_OF_WEEK = int(DateTimeSkips.DAY_OF_WEEK)
+    _SKIP_DAY = int(DateTimeSkips.DAY)
+    _SKIP_HOUR = int(DateTimeSkips.HOUR)
+    _SKIP_MINUTE = int(DateTimeSkips.MINUTE)
+    _SKIP_SECOND = int(DateTimeSkips.SECOND)
+    _SKIP_MILLISECOND = int(DateTimeSkips.MILLISECOND)
+    _SKIP_DEVITATION = int(DateTimeSkips.DEVITATION)
+    _SKIP_STATUS = int(DateTimeSkips.STATUS)
+    _DST_BEGIN = int(DateTimeExtraInfo.DST_BEGIN)
+    _DST_END = int(DateTimeExtraInfo.DST_END)
+    _LAST_DAY2 = int(DateTimeExtraInfo.LAST_DAY2)
+    _LAST_DAY = int(DateTimeExtraInfo.LAST_DAY)
+    _DAYLIGHT_SAVE_ACTIVE = int(ClockStatus.DAYLIGHT_SAVE_ACTIVE)
+
+    #
+    # Size of COSEM date-time in bytes.
+    #
+    SIZE = 12
+
+    #
+    # Parse COSEM date-time.
+    #
+    # @param dt
+    # GXDateTime where values are updated.
+    # @param data
+    # Received DLMS data.
+    # @param index
+    # Start index of the date-time.
+    # @param useUtc2NormalTime
+    # Is deviation from UTC to normal time.
+    # Updated date-time.
+    #
+    @classmethod
+    def decode(cls, dt, data, index, useUtc2NormalTime):
+        # pylint: disable=too-many-locals,too-many-branches
+        (
+            year,
+            month,
+            day,
+            dayOfWeek,
+            hour,
+            minute,
+            second,
+            ms,
+            deviation,
+            status,
+        ) = cls.__FORMAT.unpack_from(data, index)
+        skip = 0
+        extra = 0
+        if dayOfWeek == 0xFF:
+            skip |= cls._SKIP_DAY_OF_WEEK
+        else:
+            dt.dayOfWeek = dayOfWeek
+        if ms != 0xFF:
+            ms *= 10
+        else:
+            ms = -1
+        if deviation == -32768:
+            deviation = 0x8000
+            skip |= cls._SKIP_DEVITATION
+        dt.status = status
+        if year < 1900 or year == 0xFFFF:
+            skip |= cls._SKIP_YEAR
+            year = 2000
+        if month == 0xFE:
+            extra |= cls._DST_BEGIN
+            month = 1
+        elif month == 0xFD:
+            extra |= cls._DST_END
+            month = 1
+        elif month < 1 or month > 12:
+            skip |= cls._SKIP_MONTH
+            month = 1
+        if day == 0xFE:
+            extra |= cls._LAST_DAY
+            day = 1
+        elif day == 0xFD:
+            extra |= cls._LAST_DAY2
+            day = 1
+        elif day == 0 or day > 31:
+            skip |= cls._SKIP_DAY
+            day = 1
+        if hour > 24:
+            skip |= cls._SKIP_HOUR
+            hour = 0
+        if minute > 60:
+            skip |= cls._SKIP_MINUTE
+            minute = 0
+        if second > 60:
+            skip |= cls._SKIP_SECOND
+            second = 0
+        #  If ms is Zero it's skipped.
+        if ms < 0 or ms > 1000:
+            skip |= cls._SKIP_MILLISECOND
+            ms = 0
+        dt.extra = DateTimeExtraInfo(extra)
+        if deviation == 0x8000:
+            dt.value = datetime(year, month, day, hour, minute, second, ms * 1000)
+        else:
+            if not useUtc2NormalTime:
+                deviation = -deviation
+            dt.value = datetime(
+                year,
+                month,
+                day,
+                hour,
+                minute,
+                second,
+                ms * 1000,
+                tzinfo=GXTimeZone.fromOffset(deviation),
+            )
+        dt.skip = DateTimeSkips(skip)
+        return dt
+
+    #
+    # Convert date-time to COSEM bytes.
+    #
+    # @param settings
+    # DLMS settings.
+    # @param dt
+    # Date-time value.
+    # Date-time as 12 bytes.
+    #
+    @classmethod
+    def encode(cls, settings, dt):
+        # pylint: disable=too-many-branches
+        value = dt.value
+        skip = int(dt.skip)
+        if settings and settings.dateTimeSkips:
+            skip = skip or int(settings.dateTimeSkips)
+        extra = int(dt.extra)
+        if skip & cls._SKIP_YEAR:
+            year = 0xFFFF
+        else:
+            year = value.year
+        if extra & cls._DST_BEGIN:
+            month = 0xFE
+        elif extra & cls._DST_END:
+            month = 0xFD
+        elif skip & cls._SKIP_MONTH:
+            month = 0xFF
+        else:
+            month = value.month
+        if extra & cls._LAST_DAY2:
+            day = 0xFD
+        elif extra & cls._LAST_DAY:
+            day = 0xFE
+        elif skip & cls._SKIP_DAY:
+            day = 0xFF
+        else:
+            day = value.day
+        if skip & cls._SKIP_DAY_OF_WEEK:
+            dayOfWeek = 0xFF
+        elif dt.dayOfWeek == 0:
+            dayOfWeek = value.weekday() + 1
+        else:
+            dayOfWeek = dt.dayOfWeek
+        hour = 0xFF if skip & cls._SKIP_HOUR else value.hour
+        minute = 0xFF if skip & cls._SKIP_MINUTE else value.minute
+        second = 0xFF if skip & cls._SKIP_SECOND else value.second
+        #  Hundredth of seconds is not used.
+        if skip & cls._SKIP_MILLISECOND:
+            ms = 0xFF
+        else:
+            ms = int(value.microsecond / 10000)
+        #  devitation not used.
+        if skip & cls._SKIP_DEVITATION:
+            deviation = -32768
+        else:
+            deviation = int(value.utcoffset().total_seconds() / 60)
+            if not (settings and settings.useUtc2NormalTime):
+                deviation = -deviation
+        if skip & cls._SKIP_STATUS:
+            status = 0xFF
+        elif value.dst() or int(dt.status) & cls._DAYLIGHT_SAVE_ACTIVE:
+            status = int(dt.status) | cls._DAYLIGHT_SAVE_ACTIVE
+        else:
+            status = int(dt.status)
+        return cls.__FORMAT.pack(
+            year,
+            month,
+            day,
+            dayOfWeek,
+            hour,
+            minute,
+            second,
+            ms,
+            deviation,
+            status,
+        )
+
+    #
+    # Convert date to COSEM bytes.
+    #
+    # @param dt
+    # Date value.
+    # Date as 5 bytes.
+    #
+    @classmethod
+    def encodeDate(cls, dt):
+        value = dt.value
+        skip = int(dt.skip)
+        extra = int(dt.extra)
+        if skip & cls._SKIP_YEAR:
+            year = 0xFFFF
+        else:
+            year = value.year
+        if extra & cls._DST_BEGIN:
+            month = 0xFE
+        elif extra & cls._DST_END:
+            month = 0xFD
+        elif skip & cls._SKIP_MONTH:
+            month = 0xFF
+        else:
+            month = value.month
+        if extra & cls._LAST_DAY2:
+            day = 0xFD
+        elif extra & cls._LAST_DAY:
+            day = 0xFE
+        elif skip & cls._SKIP_DAY:
+            day = 0xFF
+        else:
+            day = value.day
+        if skip & cls._SKIP_DAY_OF_WEEK:
+            dayOfWeek = 0xFF
+        elif dt.dayOfWeek == 0:
+            dayOfWeek = value.weekday() + 1
+        else:
+            dayOfWeek = dt.dayOfWeek
+        return cls.__DATE_FORMAT.pack(year, month, day, dayOfWeek)
+
+    #
+    # Convert time to COSEM bytes.
+    #
+    # @param dt
+    # Time value.
+    # Time as 4 bytes.
+    #
+    @classmethod
+    def encodeTime(cls, dt):
+        value = dt.value
+        skip = int(dt.skip)
+        hour = 0xFF if skip & cls._SKIP_HOUR else value.hour
+        minute = 0xFF if skip & cls._SKIP_MINUTE else value.minute
+        second = 0xFF if skip & cls._SKIP_SECOND else value.second
+        #  Hundredth of seconds is not used.
+        if skip & cls._SKIP_MILLISECOND:
+            ms = 0xFF
+        else:
+            ms = int(value.microsecond / 10000)
+        return cls.__TIME_FORMAT.pack(hour, minute, second, ms)
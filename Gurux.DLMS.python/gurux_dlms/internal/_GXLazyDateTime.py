@@ -0,0 +1,140 @@
+#
+#  --------------------------------------------------------------------------
+#   Gurux Ltd
+#
+#
+#
+#  Filename: $HeadURL$
+#
+#  Version: $Revision$,
+#                   $Date$
+#                   $Author$
+#
+#  Copyright (c) Gurux Ltd
+#
+# ---------------------------------------------------------------------------
+#
+#   DESCRIPTION
+#
+#  This file is a part of Gurux Device Framework.
+#
+#  Gurux Device Framework is Open Source software; you can redistribute it
+#  and/or modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; version 2 of the License.
+#  Gurux Device Framework is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#  See the GNU General Public License for more details.
+#
+#  More information of Gurux products: http://www.gurux.org
+#
+#  This code is licensed under the GNU General Public License v2.
+#  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
+# ---------------------------------------------------------------------------
+from ..GXDateTime import GXDateTime
+from ._GXDateTimeCodec import _GXDateTimeCodec
+
+
+# pylint: disable=super-init-not-called
+class _GXLazyDateTime(GXDateTime):
+    """
+    Date-time that keeps received 12 bytes and parses them only when a value
+    is accessed the first time.
+    """
+
+    __slots__ = (
+        "__raw",
+        "__useUtc2NormalTime",
+        "__value",
+        "__extra",
+        "__skip",
+        "__status",
+        "__dayOfWeek",
+    )
+
+    def __init__(self, data, useUtc2NormalTime):
+        """
+        Constructor.
+
+        data: COSEM date-time as 12 bytes.
+        useUtc2NormalTime: Is deviation from UTC to normal time.
+        """
+        self.__raw = data
+        self.__useUtc2NormalTime = useUtc2NormalTime
+        self.__value = None
+        self.__extra = None
+        self.__skip = None
+        self.__status = None
+        self.__dayOfWeek = 0xFF
+
+    def __parse(self):
+        if self.__raw is not None:
+            raw = self.__raw
+            self.__raw = None
+            _GXDateTimeCodec.decode(self, raw, 0, self.__useUtc2NormalTime)
+
+    def getRaw(self, useUtc2NormalTime):
+        """
+        Returns received bytes if the value is not accessed or modified.
+        Otherwise None is returned.
+
+        useUtc2NormalTime: Is deviation from UTC to normal time.
+        """
+        if useUtc2NormalTime == self.__useUtc2NormalTime:
+            return self.__raw
+        return None
+
+    def getValue(self):
+        self.__parse()
+        return self.__value
+
+    def setValue(self, value):
+        self.__parse()
+        self.__value = value
+
+    value = property(getValue, setValue)
+    """Date-time value."""
+
+    def getExtra(self):
+        self.__parse()
+        return self.__extra
+
+    def setExtra(self, value):
+        self.__parse()
+        self.__extra = value
+
+    extra = property(getExtra, setExtra)
+    """Extra date-time information."""
+
+    def getSkip(self):
+        self.__parse()
+        return self.__skip
+
+    def setSkip(self, value):
+        self.__parse()
+        self.__skip = value
+
+    skip = property(getSkip, setSkip)
+    """Skipped date-time fields."""
+
+    def getStatus(self):
+        self.__parse()
+        return self.__status
+
+    def setStatus(self, value):
+        self.__parse()
+        self.__status = value
+
+    status = property(getStatus, setStatus)
+    """Clock status."""
+
+    def getDayOfWeek(self):
+        self.__parse()
+        return self.__dayOfWeek
+
+    def setDayOfWeek(self, value):
+        self.__parse()
+        self.__dayOfWeek = value
+
+    dayOfWeek = property(getDayOfWeek, setDayOfWeek)
+    """Day of week."""
@@ -48,8 +48,6 @@ from .InactivityMode import InactivityMode
 from .StartProtocolType import StartProtocolType
 from .HDLCAddressType import HDLCAddressType
 from ..enums import Authentication, DataType, ObjectType
-if sys.version_info >= (3, 0):
-    import urllib.request
 
 #
 class GXManufacturerCollection(list):
@@ -100,6 +98,9 @@ class GXManufacturerCollection(list):
                 if it.tag == "File":
                     available[it.text] = datetime.datetime.strptime(it.attrib["Modified"], "%d-%m-%Y")
 
+            # pylint: disable=import-outside-toplevel
+            import urllib.request
+
             path = NamedTemporaryFile()
             path.close()
             urllib.request.urlretrieve("https://www.gurux.fi/obis/files.xml", path.name)
@@ -126,6 +127,9 @@ class GXManufacturerCollection(list):
             os.mkdir(directory)
             if not os.path.isdir(directory):
                 return
+        # pylint: disable=import-outside-toplevel
+        import urllib.request
+
         path = os.path.join(directory, "files.xml")
         urllib.request.urlretrieve("https://www.gurux.fi/obis/files.xml", path)
         for it in ET.parse(path).iter():
@@ -282,7 +282,7 @@ class GXDLMSAssociationLogicalName(GXDLMSObject, IGXDLMSBase):
                 self.__getAccessRights(settings, it, e.server, data)
                 settings.index = settings.index + 1
                 if settings.isServer:
-                    if not e.isSkipMaxPduSize and len(data) >= settings.maxPduSize:
+                    if not e.skipMaxPduSize and len(data) >= settings.maxPduSize:
                         break
         return data
 
@@ -197,7 +197,7 @@ class GXDLMSAssociationShortName(GXDLMSObject, IGXDLMSBase):
                     _GXCommon.setData(settings, bb, DataType.OCTET_STRING, _GXCommon.logicalNameToBytes(it.logicalName))
                     settings.index = settings.index + 1
                     if settings.isServer:
-                        if not e.isSkipMaxPduSize() and len(bb) >= settings.maxPduSize:
+                        if not e.skipMaxPduSize and len(bb) >= settings.maxPduSize:
                             break
         return bb.array()
 
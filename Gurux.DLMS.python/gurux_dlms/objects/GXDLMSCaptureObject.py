@@ -37,6 +37,8 @@ from .GXDLMSRestriction import GXDLMSRestriction
 ###Python 2 requires this
 # pylint: disable=bad-option-value,old-style-class,too-few-public-methods
 class GXDLMSCaptureObject:
+    __slots__ = ("attributeIndex", "dataIndex", "restriction", "columns")
+
     #
     # Constructor.
     #
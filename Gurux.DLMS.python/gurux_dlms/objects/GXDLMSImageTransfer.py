@@ -36,6 +36,7 @@ from .IGXDLMSBase import IGXDLMSBase
 from ..enums import ErrorCode
 from ..internal._GXCommon import _GXCommon
 from ..GXByteBuffer import GXByteBuffer
+from ..GXBitString import GXBitString
 from ..enums import ObjectType, DataType
 from .enums import ImageTransferStatus
 from .GXDLMSImageActivateInfo import GXDLMSImageActivateInfo
@@ -56,6 +57,10 @@ class GXDLMSImageTransfer(GXDLMSObject, IGXDLMSBase):
         sn : Short Name of the object.
         """
         GXDLMSObject.__init__(self, ObjectType.IMAGE_TRANSFER, ln, sn)
+        # Transferred blocks as a bitmap. Bitmap is used in the server side.
+        self.__blocks = None
+        # Amount of image blocks in the bitmap.
+        self.__blockCount = 0
         self.imageBlockSize = 200
         self.imageTransferredBlocksStatus = ""
         self.imageFirstNotTransferredBlockNumber = 0
@@ -105,17 +110,32 @@ class GXDLMSImageTransfer(GXDLMSObject, IGXDLMSBase):
     def getMethodCount(self):
         return 4
 
+    #
+    # Image transferred blocks status as a bit string.
+    #
+    def getImageTransferredBlocksStatus(self):
+        if self.__blocks is not None:
+            return str(self.__getBlocksStatus())
+        return self.__imageTransferredBlocksStatus
+
+    def setImageTransferredBlocksStatus(self, value):
+        self.__blocks = None
+        self.__imageTransferredBlocksStatus = value
+
+    imageTransferredBlocksStatus = property(getImageTransferredBlocksStatus, setImageTransferredBlocksStatus)
+
+    def __getBlocksStatus(self):
+        return GXBitString(bytes(self.__blocks), -self.__blockCount % 8)
+
     def invoke(self, settings, e):
         #  Image transfer initiate
         if e.index == 1:
             self.imageFirstNotTransferredBlockNumber = 0
-            self.imageTransferredBlocksStatus = ""
             value = e.parameters
             imageIdentifier = value[0]
             self.imageSize = value[1]
             self.imageTransferStatus = ImageTransferStatus.IMAGE_TRANSFER_INITIATED
-            list_ = []
-            list_.append(self.imageActivateInfo)
+            list_ = list(self.imageActivateInfo)
             item = None
             for it in self.imageActivateInfo:
                 if it.identification == imageIdentifier:
@@ -127,25 +147,31 @@ class GXDLMSImageTransfer(GXDLMSObject, IGXDLMSBase):
             item.size = self.imageSize
             item.identification = imageIdentifier
             self.imageActivateInfo = list_
-            cnt = int((self.imageSize / self.imageBlockSize))
-            if self.imageSize % self.imageBlockSize != 0:
-                cnt += 1
-            sb = ""
-            pos = 0
-            while pos < cnt:
-                sb += '0'
-                pos += 1
-            self.imageTransferredBlocksStatus = sb
+            cnt = self.getImageBlockCount(self.imageSize)
+            self.__blocks = bytearray((cnt + 7) // 8)
+            self.__blockCount = cnt
+            # Received blocks are written to the preallocated buffer.
+            # Application can set writable buffer (for example mmap) for the
+            # image before the transfer is initiated.
+            if self.imageData is None or len(self.imageData) < self.imageSize:
+                self.imageData = bytearray(self.imageSize)
             return None
         if e.index == 2:
             #  Image block transfer
             value = e.parameters
-            imageIndex = (value[0]).longValue()
-            tmp = self.imageTransferredBlocksStatus.encode()
-            tmp[int(imageIndex)] = '1'
-            self.imageTransferredBlocksStatus = str(tmp)
-            self.imageFirstNotTransferredBlockNumber = imageIndex + 1
-            self.imageData.put(imageIndex, value[1])
+            imageIndex = value[0]
+            if self.__blocks is None or imageIndex >= self.__blockCount:
+                e.error = ErrorCode.READ_WRITE_DENIED
+                return None
+            self.__blocks[imageIndex >> 3] |= 0x80 >> (imageIndex & 7)
+            pos = imageIndex * self.imageBlockSize
+            self.imageData[pos: pos + len(value[1])] = value[1]
+            # Find the first block that is not transferred.
+            index = self.imageFirstNotTransferredBlockNumber
+            blocks = self.__blocks
+            while index < self.__blockCount and blocks[index >> 3] & (0x80 >> (index & 7)):
+                index += 1
+            self.imageFirstNotTransferredBlockNumber = index
             self.imageTransferStatus = ImageTransferStatus.IMAGE_TRANSFER_INITIATED
             return None
         if e.index == 3:
@@ -199,7 +225,10 @@ class GXDLMSImageTransfer(GXDLMSObject, IGXDLMSBase):
         elif e.index == 2:
             ret = self.imageBlockSize
         elif e.index == 3:
-            ret = self.imageTransferredBlocksStatus
+            if self.__blocks is not None:
+                ret = self.__getBlocksStatus()
+            else:
+                ret = self.imageTransferredBlocksStatus
         elif e.index == 4:
             ret = self.imageFirstNotTransferredBlockNumber
         elif e.index == 5:
@@ -269,35 +298,72 @@ class GXDLMSImageTransfer(GXDLMSObject, IGXDLMSBase):
             raise ValueError("Invalid image block size.")
         if self.imageBlockSize > client.maxReceivePDUSize:
             raise ValueError("Image block size is bigger than max PDU size.")
+        if isinstance(imageIdentifier, str):
+            imageIdentifier = _GXCommon.getBytes(imageIdentifier)
         data = GXByteBuffer()
         data.setUInt8(DataType.STRUCTURE)
         data.setUInt8(2)
-        _GXCommon.setData(None, data, DataType.OCTET_STRING, _GXCommon.getBytes(imageIdentifier))
+        _GXCommon.setData(None, data, DataType.OCTET_STRING, imageIdentifier)
         _GXCommon.setData(None, data, DataType.UINT32, imageSize)
         return client.method(self, 1, data, DataType.ARRAY)
 
-    def imageBlockTransfer(self, client, imageBlockValue, imageBlockCount):
-        cnt = int(len(imageBlockValue) / self.imageBlockSize)
-        if (len(imageBlockValue) % self.imageBlockSize) != 0:
+    #
+    # Returns amount of image blocks.
+    #
+    # @param imageSize
+    #            Image size in bytes.
+    #
+    def getImageBlockCount(self, imageSize):
+        if self.imageBlockSize == 0:
+            raise ValueError("Invalid image block size.")
+        cnt = imageSize // self.imageBlockSize
+        if imageSize % self.imageBlockSize != 0:
             cnt += 1
+        return cnt
+
+    #
+    # Returns indexes of the image blocks that are not transferred.
+    # Image transferred blocks status and image first not transferred block
+    # number must be read first.
+    #
+    # @param imageSize
+    #            Image size in bytes.
+    #
+    def getNotTransferredBlocks(self, imageSize):
+        cnt = self.getImageBlockCount(imageSize)
+        status = self.imageTransferredBlocksStatus
+        if not status:
+            return list(range(min(self.imageFirstNotTransferredBlockNumber, cnt), cnt))
+        status = str(status)
+        return [pos for pos in range(cnt) if pos >= len(status) or status[pos] != "1"]
+
+    #
+    # Generate request for one image block.
+    #
+    # @param client
+    #            DLMS client.
+    # @param index
+    #            Block index.
+    # @param imageBlockValue
+    #            Image. Only the sent block is copied.
+    #
+    def imageBlock(self, client, index, imageBlockValue):
+        start = index * self.imageBlockSize
+        data = GXByteBuffer()
+        data.setUInt8(DataType.STRUCTURE)
+        data.setUInt8(2)
+        _GXCommon.setData(None, data, DataType.UINT32, index)
+        _GXCommon.setData(None, data, DataType.OCTET_STRING, imageBlockValue[start: start + self.imageBlockSize])
+        return client.method(self, 2, data, DataType.ARRAY)
+
+    def imageBlockTransfer(self, client, imageBlockValue, imageBlockCount):
+        cnt = self.getImageBlockCount(len(imageBlockValue))
         if imageBlockCount:
             imageBlockCount[0] = cnt
         packets = []
         pos = 0
         while pos != cnt:
-            data = GXByteBuffer()
-            data.setUInt8(DataType.STRUCTURE)
-            data.setUInt8(2)
-            _GXCommon.setData(None, data, DataType.UINT32, pos)
-            tmp = None
-            len_ = len(imageBlockValue) - ((pos + 1) * self.imageBlockSize)
-            #  If last packet
-            if len_ < 0:
-                tmp = imageBlockValue[pos * self.imageBlockSize:]
-            else:
-                tmp = imageBlockValue[pos * self.imageBlockSize: pos * self.imageBlockSize + self.imageBlockSize]
-            _GXCommon.setData(None, data, DataType.OCTET_STRING, tmp)
-            packets.append(client.method(self, 2, data, DataType.ARRAY))
+            packets.append(self.imageBlock(client, pos, imageBlockValue))
             pos += 1
         return packets
 
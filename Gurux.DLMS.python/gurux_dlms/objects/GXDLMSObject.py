@@ -33,6 +33,8 @@
 # ---------------------------------------------------------------------------
 from abc import abstractmethod
 from ..internal._GXCommon import _GXCommon
+from ..internal._GXDataInfo import _GXDataInfo
+from ..GXByteBuffer import GXByteBuffer
 from ..manufacturersettings import GXAttributeCollection, GXDLMSAttributeSettings
 from ..enums.DataType import DataType
 from ..enums.AccessMode import AccessMode
@@ -48,6 +50,10 @@ class GXDLMSObject(object):
     # Constructor,
     #
     def __init__(self, ot, ln=None, sn=0):
+        # Converter that updates OBIS code information when it's needed.
+        self.__converter = None
+        # Received access rights that are parsed when they are needed.
+        self.__accessRights = None
         # DLMS version number.
         self.version = 0
         self.objectType = ot
@@ -80,10 +86,26 @@ class GXDLMSObject(object):
     def isRead(self, index):
         if not self.canRead(index):
             return True
-        return not self.getLastReadTime(index)
+        return self.getLastReadTime(index) is not None
 
+    #
+    # Can attribute be read.
+    #
+    # @param index
+    # Attribute index.
+    #
     def canRead(self, index):
-        return int(self.getAccess(index)) and int(AccessMode.READ) != 0
+        # Access mode values are not flags.
+        return (
+            self.getAccess(index)
+            in (
+                AccessMode.READ,
+                AccessMode.READ_WRITE,
+                AccessMode.AUTHENTICATED_READ,
+                AccessMode.AUTHENTICATED_READ_WRITE,
+            )
+            and self.getAccess3(index) & AccessMode3.READ != 0
+        )
 
     #
     # Returns time when attribute was last time read.  -
@@ -93,10 +115,7 @@ class GXDLMSObject(object):
     # Is attribute read only.
     #
     def getLastReadTime(self, attributeIndex):
-        for k, v in self.readTimes.items():
-            if k == attributeIndex:
-                return v
-        return None
+        return self.readTimes.get(attributeIndex)
 
     #
     # Set time when attribute was last time read.
@@ -119,6 +138,75 @@ class GXDLMSObject(object):
             str_ += " " + self.description
         return str_
 
+    #
+    # Update OBIS code information when description or data types are
+    # accessed the first time.  This is reserved for internal use.
+    #
+    # @param value
+    # DLMS converter.
+    #
+    def _setConverter(self, value):
+        self.__converter = value
+
+    def __updateOBISCodeInformation(self):
+        if self.__converter:
+            converter = self.__converter
+            self.__converter = None
+            converter.updateOBISCodeInformation(self)
+
+    def getDescription(self):
+        self.__updateOBISCodeInformation()
+        return self.__description
+
+    def setDescription(self, value):
+        self.__updateOBISCodeInformation()
+        self.__description = value
+
+    #
+    # Description of COSEM object.
+    #
+    description = property(getDescription, setDescription)
+
+    #
+    # Set access rights from the association view. Access rights are parsed
+    # when attributes are accessed the first time.  This is reserved for
+    # internal use.
+    #
+    # @param value
+    # Access rights as bytes.
+    # @param lnVersion
+    # Version of the Association LN.
+    #
+    def _setAccessRights(self, value, lnVersion):
+        self.__accessRights = (value, lnVersion)
+
+    def __updateAccessRights(self):
+        value, lnVersion = self.__accessRights
+        self.__accessRights = None
+        accessRights = _GXCommon.getData(None, GXByteBuffer(value), _GXDataInfo())
+        for attributeAccess in accessRights[0]:
+            id_ = attributeAccess[0]
+            if id_ > 0:
+                mode = attributeAccess[1]
+                if lnVersion < 3:
+                    self.setAccess(id_, AccessMode(mode))
+                else:
+                    self.setAccess3(id_, AccessMode3(mode))
+        for methodAccess in accessRights[1]:
+            id_ = methodAccess[0]
+            tmp = 0
+            if isinstance(methodAccess[1], bool):
+                if bool((methodAccess)[1]):
+                    tmp = 1
+                else:
+                    tmp = 0
+            else:
+                tmp = methodAccess[1]
+            if lnVersion < 3:
+                self.setMethodAccess(id_, MethodAccessMode(tmp))
+            else:
+                self.setMethodAccess3(id_, MethodAccessMode3(tmp))
+
     #
     # Interface type of the COSEM object.
     #
@@ -153,13 +241,27 @@ class GXDLMSObject(object):
     # Object attribute collection.
     #
     def getAttributes(self):
-        return self.attributes
+        if self.__accessRights:
+            self.__updateAccessRights()
+        return self.__attributes
+
+    def setAttributes(self, value):
+        self.__attributes = value
+
+    attributes = property(getAttributes, setAttributes)
 
     #
     # Object method attribute collection.
     #
     def getMethodAttributes(self):
-        return self.methodAttributes
+        if self.__accessRights:
+            self.__updateAccessRights()
+        return self.__methodAttributes
+
+    def setMethodAttributes(self, value):
+        self.__methodAttributes = value
+
+    methodAttributes = property(getMethodAttributes, setMethodAttributes)
 
     #
     # Returns is attribute read only.  -
@@ -286,12 +388,14 @@ class GXDLMSObject(object):
         att.methodAccess3 = access
 
     def getDataType(self, index):
+        self.__updateOBISCodeInformation()
         att = self.attributes.find(index)
         if not att:
             return DataType.NONE
         return att.type_
 
     def getUIDataType(self, index):
+        self.__updateOBISCodeInformation()
         att = self.attributes.find(index)
         if not att:
             return DataType.NONE
@@ -338,6 +442,7 @@ class GXDLMSObject(object):
         raise ValueError("invoke")
 
     def setDataType(self, index, type_):
+        self.__updateOBISCodeInformation()
         att = self.attributes.find(index)
         if att is None:
             att = GXDLMSAttributeSettings(index)
@@ -345,6 +450,7 @@ class GXDLMSObject(object):
         att.type_ = type_
 
     def setUIDataType(self, index, type_):
+        self.__updateOBISCodeInformation()
         att = self.attributes.find(index)
         if att is None:
             att = GXDLMSAttributeSettings(index)
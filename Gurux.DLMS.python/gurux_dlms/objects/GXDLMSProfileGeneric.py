@@ -200,6 +200,30 @@ class GXDLMSProfileGeneric(GXDLMSObject, IGXDLMSBase):
             _GXCommon.setData(settings, data, DataType.UINT16, v.dataIndex)
         return data
 
+    def __getTypes(self):
+        types = [None] * len(self.captureObjects)
+        pos = 0
+        for k, v in self.captureObjects:
+            types[pos] = k.getDataType(v.attributeIndex)
+            pos += 1
+        return types
+
+    def __addRow(self, settings, data, row, columns, types):
+        data.setUInt8(DataType.STRUCTURE)
+        if not columns:
+            _GXCommon.setObjectCount(len(self.captureObjects), data)
+        else:
+            _GXCommon.setObjectCount(len(columns), data)
+        pos = 0
+        for value in row:
+            if columns is None or self.captureObjects[pos] in columns:
+                tp = types[pos]
+                if tp == DataType.NONE:
+                    tp = _GXCommon.getDLMSDataType(value)
+                    types[pos] = tp
+                _GXCommon.setData(settings, data, tp, value)
+            pos += 1
+
     def getData(self, settings, e, table, columns):
         data = GXByteBuffer()
         if settings.index == 0:
@@ -208,31 +232,12 @@ class GXDLMSProfileGeneric(GXDLMSObject, IGXDLMSBase):
                 _GXCommon.setObjectCount(e.rowEndIndex - e.rowBeginIndex, data)
             else:
                 _GXCommon.setObjectCount(len(table), data)
-        types = [None] * len(self.captureObjects)
-        pos = 0
-        for k, v in self.captureObjects:
-            types[pos] = k.getDataType(v.attributeIndex)
-            pos += 1
-        tp = None
+        types = self.__getTypes()
         for row in table:
-            items = row
-            data.setUInt8(DataType.STRUCTURE)
-            if not columns:
-                _GXCommon.setObjectCount(0, data)
-            else:
-                _GXCommon.setObjectCount(len(columns), data)
-            pos = 0
-            for value in items:
-                if columns is None or self.captureObjects[pos] in columns:
-                    tp = types[pos]
-                    if tp == DataType.NONE:
-                        tp = _GXCommon.getDLMSDataType(value)
-                        types[pos] = tp
-                    _GXCommon.setData(settings, data, tp, value)
-                pos += 1
+            self.__addRow(settings, data, row, columns, types)
             settings.setIndex(settings.index + 1)
-        if e.getRowEndIndex() != 0:
-            e.setRowBeginIndex(len(table))
+        if e.rowEndIndex != 0:
+            e.rowBeginIndex += len(table)
         return data.array()
 
     def getColumns(self, cols):
@@ -285,48 +290,88 @@ class GXDLMSProfileGeneric(GXDLMSObject, IGXDLMSBase):
             raise ValueError("Invalid selector.")
         return ret
 
-    def __getProfileGenericData(self, settings, e):
-        # pylint: disable=bad-option-value,chained-comparison
-        columns = None
-        if e.selector == 0 or e.parameters is None or e.getRowEndIndex() != 0:
-            return self.getData(settings, e, self.buffer, columns)
+    @classmethod
+    def __getRange(cls, settings, parameters):
+        info = _GXDataInfo()
+        info.type_ = DataType.DATETIME
+        start = _GXCommon.getData(settings, GXByteBuffer(parameters[1]), info).value
+        info.clear()
+        info.type_ = DataType.DATETIME
+        end = _GXCommon.getData(settings, GXByteBuffer(parameters[2]), info).value
+        return start, end
+
+    @classmethod
+    def __getTime(cls, row):
+        tm = row[0]
+        if isinstance(tm, GXDateTime):
+            return tm.value
+        return tm
+
+    #
+    # Returns buffer index of the first selected row and the count of the
+    # selected rows.
+    #
+    def __getSelection(self, settings, e):
         arr = e.parameters
-        columns = self.getSelectedColumns(e.selector, arr)
-        table = []
-        if e.selector == 1:
-            info = _GXDataInfo()
-            info.type_ = DataType.DATETIME
-            start = _GXCommon.getData(settings, GXByteBuffer(arr[1]), info).value
-            info.clear()
-            info.type_ = DataType.DATETIME
-            end = _GXCommon.getData(settings, GXByteBuffer(arr[2]), info).value
-            for row in self.buffer:
-                tm = None
-                tmp = (row)[0]
-                if isinstance(tmp, GXDateTime):
-                    tm = tmp.value
-                else:
-                    tm = tmp
-                if tm >= start >= 0 and tm <= end:
-                    table.append(row)
-        elif e.selector == 2:
-            start = arr[0]
-            if start == 0:
-                start = 1
-            count = arr[1]
-            if count == 0:
-                count = len(self.buffer)
-            if start + count > len(self.buffer):
-                count = len(self.buffer)
+        if e.selector == 1 and arr:
+            start, end = self.__getRange(settings, arr)
+            first = -1
+            count = 0
             pos = 0
-            while pos < count:
-                if pos + start - 1 == len(self.buffer):
-                    break
-                table.append(self.buffer[start + pos - 1])
+            for row in self.buffer:
+                if start <= self.__getTime(row) <= end:
+                    if first == -1:
+                        first = pos
+                    count += 1
                 pos += 1
-        else:
-            raise ValueError("Invalid selector.")
-        return self.getData(settings, e, table, columns)
+            return max(first, 0), count
+        if e.selector == 2 and arr:
+            #  Entries are one based and the last entry is included.
+            start = max(arr[0], 1)
+            end = arr[1]
+            if end == 0 or end > len(self.buffer):
+                end = len(self.buffer)
+            return start - 1, max(end - start + 1, 0)
+        return 0, len(self.buffer)
+
+    #
+    # Server encodes only the rows that fit to the PDU. Rest of the rows are
+    # encoded when the client asks for the next data block, so the whole
+    # buffer is never serialized at once.
+    #
+    def __getProfileGenericData(self, settings, e):
+        if e.rowEndIndex != 0:
+            #  Application has read the rows to the buffer.
+            return self.getData(settings, e, self.buffer, None)
+        columns = None
+        if e.selector != 0 and e.parameters:
+            columns = self.getSelectedColumns(e.selector, e.parameters)
+            if columns and columns[0] is self.captureObjects:
+                #  All columns are selected.
+                columns = None
+        data = GXByteBuffer()
+        if settings.index == 0:
+            e.bufferIndex, count = self.__getSelection(settings, e)
+            settings.setCount(count)
+            data.setUInt8(DataType.ARRAY)
+            _GXCommon.setObjectCount(count, data)
+        start = None
+        if e.selector == 1 and e.parameters:
+            start, end = self.__getRange(settings, e.parameters)
+        types = self.__getTypes()
+        while settings.index != settings.count and e.bufferIndex < len(self.buffer):
+            row = self.buffer[e.bufferIndex]
+            e.bufferIndex += 1
+            if start is None or start <= self.__getTime(row) <= end:
+                self.__addRow(settings, data, row, columns, types)
+                settings.setIndex(settings.index + 1)
+                if (
+                    settings.isServer
+                    and not e.skipMaxPduSize
+                    and len(data) >= settings.maxPduSize
+                ):
+                    break
+        return data.array()
 
     def getNames(self):
         return (
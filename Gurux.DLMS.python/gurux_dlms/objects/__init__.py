@@ -31,115 +31,238 @@
 #  This code is licensed under the GNU General Public License v2.
 #  Full text may be retrieved at http://www.gnu.org/licenses/gpl-2.0.txt
 # ---------------------------------------------------------------------------
-from .GXAdjacentCell import GXAdjacentCell
-from .GXApplicationContextName import GXApplicationContextName
-from .GXAuthenticationMechanismName import GXAuthenticationMechanismName
-from .GXChargePerUnitScaling import GXChargePerUnitScaling
-from .GXChargeTable import GXChargeTable
-from .GXCommodity import GXCommodity
-from .GXCreditChargeConfiguration import GXCreditChargeConfiguration
-from .GXCurrency import GXCurrency
-from .GXDLMSRegister import GXDLMSRegister
-from .GXDLMSDemandRegister import GXDLMSDemandRegister
-from .GXDLMSRegisterMonitor import GXDLMSRegisterMonitor
-from .GXDLMSRegisterActivation import GXDLMSRegisterActivation
-from .GXDLMSExtendedRegister import GXDLMSExtendedRegister
-from .GXDLMSAccount import GXDLMSAccount
-from .GXDLMSActionItem import GXDLMSActionItem
-from .GXDLMSActionSchedule import GXDLMSActionSchedule
-from .GXDLMSActionSet import GXDLMSActionSet
-from .GXDLMSActivityCalendar import GXDLMSActivityCalendar
-from .GXDLMSAssociationLogicalName import GXDLMSAssociationLogicalName
-from .GXDLMSAssociationShortName import GXDLMSAssociationShortName
-from .GXDLMSAutoAnswer import GXDLMSAutoAnswer
-from .GXDLMSAutoConnect import GXDLMSAutoConnect
-from .GXDLMSCaptureObject import GXDLMSCaptureObject
-from .GXDLMSCertificateInfo import GXDLMSCertificateInfo
-from .GXDLMSCharge import GXDLMSCharge
-from .GXDLMSClock import GXDLMSClock
-from .GXDLMSCredit import GXDLMSCredit
-from .GXDLMSData import GXDLMSData
-from .GXDLMSDayProfile import GXDLMSDayProfile
-from .GXDLMSDayProfileAction import GXDLMSDayProfileAction
-from .GXDLMSDisconnectControl import GXDLMSDisconnectControl
-from .GXDLMSEmergencyProfile import GXDLMSEmergencyProfile
-from .GXDLMSGprsSetup import GXDLMSGprsSetup
-from .GXDLMSGSMCellInfo import GXDLMSGSMCellInfo
-from .GXDLMSGSMDiagnostic import GXDLMSGSMDiagnostic
-from .GXDLMSHdlcSetup import GXDLMSHdlcSetup
-from .GXDLMSIECLocalPortSetup import GXDLMSIECLocalPortSetup
-from .GXDLMSIecTwistedPairSetup import GXDLMSIecTwistedPairSetup
-from .GXDLMSImageActivateInfo import GXDLMSImageActivateInfo
-from .GXDLMSImageTransfer import GXDLMSImageTransfer
-from .GXDLMSIp4Setup import GXDLMSIp4Setup
-from .GXDLMSIp4SetupIpOption import GXDLMSIp4SetupIpOption
-from .GXDLMSIp6Setup import GXDLMSIp6Setup
-from .GXDLMSLimiter import GXDLMSLimiter
-from .GXDLMSMacAddressSetup import GXDLMSMacAddressSetup
-from .GXDLMSMBusClient import GXDLMSMBusClient
-from .GXDLMSMBusMasterPortSetup import GXDLMSMBusMasterPortSetup
-from .GXDLMSMBusSlavePortSetup import GXDLMSMBusSlavePortSetup
-from .GXDLMSModemConfiguration import GXDLMSModemConfiguration
-from .GXDLMSModemInitialisation import GXDLMSModemInitialisation
-from .GXDLMSMonitoredValue import GXDLMSMonitoredValue
-from .GXDLMSObject import GXDLMSObject
-from .GXDLMSObjectCollection import GXDLMSObjectCollection
-from .GXDLMSObjectDefinition import GXDLMSObjectDefinition
-from .GXDLMSParameterMonitor import GXDLMSParameterMonitor
-from .GXDLMSPppSetup import GXDLMSPppSetup
-from .GXDLMSPppSetupIPCPOption import GXDLMSPppSetupIPCPOption
-from .GXDLMSPppSetupLcpOption import GXDLMSPppSetupLcpOption
-from .GXDLMSProfileGeneric import GXDLMSProfileGeneric
-from .GXDLMSPushSetup import GXDLMSPushSetup
-from .GXDLMSQualityOfService import GXDLMSQualityOfService
-from .GXDLMSSapAssignment import GXDLMSSapAssignment
-from .GXDLMSSchedule import GXDLMSSchedule
-from .GXDLMSScheduleEntry import GXDLMSScheduleEntry
-from .GXDLMSScript import GXDLMSScript
-from .GXDLMSScriptAction import GXDLMSScriptAction
-from .GXDLMSScriptTable import GXDLMSScriptTable
-from .GXDLMSSeasonProfile import GXDLMSSeasonProfile
-from .GXDLMSSecuritySetup import GXDLMSSecuritySetup
-from .GXDLMSSpecialDay import GXDLMSSpecialDay
-from .GXDLMSSpecialDaysTable import GXDLMSSpecialDaysTable
-from .GXDLMSTarget import GXDLMSTarget
-from .GXDLMSTcpUdpSetup import GXDLMSTcpUdpSetup
-from .GXDLMSTokenGateway import GXDLMSTokenGateway
-from .GXDLMSWeekProfile import GXDLMSWeekProfile
-from .GXNeighborDiscoverySetup import GXNeighborDiscoverySetup
-from .GXTokenGatewayConfiguration import GXTokenGatewayConfiguration
-from .GXUnitCharge import GXUnitCharge
-from .GXxDLMSContextType import GXxDLMSContextType
-from .GXXmlReader import GXXmlReader
-from .GXXmlWriter import GXXmlWriter
-from .GXXmlWriterSettings import GXXmlWriterSettings
-from .IGXDLMSBase import IGXDLMSBase
-from .GXDLMSUtilityTables import GXDLMSUtilityTables
-from .GXDLMSLlcSscsSetup import GXDLMSLlcSscsSetup
-from .GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters import GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters
-from .GXDLMSPrimeNbOfdmPlcMacSetup import GXDLMSPrimeNbOfdmPlcMacSetup
-from .GXDLMSPrimeNbOfdmPlcMacFunctionalParameters import GXDLMSPrimeNbOfdmPlcMacFunctionalParameters
-from .GXDLMSPrimeNbOfdmPlcMacCounters import GXDLMSPrimeNbOfdmPlcMacCounters
-from .GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData import GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData
-from .GXDLMSPrimeNbOfdmPlcApplicationsIdentification import GXDLMSPrimeNbOfdmPlcApplicationsIdentification
-from .GXMacMulticastEntry import GXMacMulticastEntry
-from .GXMacDirectTable import GXMacDirectTable
-from .GXMacAvailableSwitch import GXMacAvailableSwitch
-from .GXMacPhyCommunication import GXMacPhyCommunication
-from .GXDLMSNtpSetup import GXDLMSNtpSetup
-from .GXDLMSG3PlcMacLayerCounters import GXDLMSG3PlcMacLayerCounters
-from .GXDLMSMacPosTable import GXDLMSMacPosTable
-from .GXDLMSRoutingConfiguration import GXDLMSRoutingConfiguration
-from .GXDLMSRoutingTable import GXDLMSRoutingTable
-from .GXDLMSContextInformationTable import GXDLMSContextInformationTable
-from .GXDLMSBroadcastLogTable import GXDLMSBroadcastLogTable
-from .GXDLMSFunctionControl import GXDLMSFunctionControl
-from .GXDLMSG3Plc6LoWPan import GXDLMSG3Plc6LoWPan
-from .GXDLMSG3PlcMacSetup import GXDLMSG3PlcMacSetup
-from .GXRepetitionDelay import GXRepetitionDelay
-from .GXPushConfirmationParameter import GXPushConfirmationParameter
-from .GXPushProtectionParameters import GXPushProtectionParameters
-from .GXDLMSDataProtectionIdentifiedKey import GXDLMSDataProtectionIdentifiedKey
-from .GXDLMSDataProtectionWrappeddKey import GXDLMSDataProtectionWrappeddKey
-from .GXDLMSDataProtectionAgreedKey import GXDLMSDataProtectionAgreedKey
-from .GXDLMSRestriction import GXDLMSRestriction
+from .._GXLazyModule import _GXLazyModule
+
+# Exported classes are imported when they are used the first time. The
+# imports below are used by static code analysis and by Python versions where
+# the module class can't be changed.
+if not _GXLazyModule.install(
+    __name__,
+    {
+        "GXAdjacentCell": ".GXAdjacentCell",
+        "GXApplicationContextName": ".GXApplicationContextName",
+        "GXAuthenticationMechanismName": ".GXAuthenticationMechanismName",
+        "GXChargePerUnitScaling": ".GXChargePerUnitScaling",
+        "GXChargeTable": ".GXChargeTable",
+        "GXCommodity": ".GXCommodity",
+        "GXCreditChargeConfiguration": ".GXCreditChargeConfiguration",
+        "GXCurrency": ".GXCurrency",
+        "GXDLMSRegister": ".GXDLMSRegister",
+        "GXDLMSDemandRegister": ".GXDLMSDemandRegister",
+        "GXDLMSRegisterMonitor": ".GXDLMSRegisterMonitor",
+        "GXDLMSRegisterActivation": ".GXDLMSRegisterActivation",
+        "GXDLMSExtendedRegister": ".GXDLMSExtendedRegister",
+        "GXDLMSAccount": ".GXDLMSAccount",
+        "GXDLMSActionItem": ".GXDLMSActionItem",
+        "GXDLMSActionSchedule": ".GXDLMSActionSchedule",
+        "GXDLMSActionSet": ".GXDLMSActionSet",
+        "GXDLMSActivityCalendar": ".GXDLMSActivityCalendar",
+        "GXDLMSAssociationLogicalName": ".GXDLMSAssociationLogicalName",
+        "GXDLMSAssociationShortName": ".GXDLMSAssociationShortName",
+        "GXDLMSAutoAnswer": ".GXDLMSAutoAnswer",
+        "GXDLMSAutoConnect": ".GXDLMSAutoConnect",
+        "GXDLMSCaptureObject": ".GXDLMSCaptureObject",
+        "GXDLMSCertificateInfo": ".GXDLMSCertificateInfo",
+        "GXDLMSCharge": ".GXDLMSCharge",
+        "GXDLMSClock": ".GXDLMSClock",
+        "GXDLMSCredit": ".GXDLMSCredit",
+        "GXDLMSData": ".GXDLMSData",
+        "GXDLMSDayProfile": ".GXDLMSDayProfile",
+        "GXDLMSDayProfileAction": ".GXDLMSDayProfileAction",
+        "GXDLMSDisconnectControl": ".GXDLMSDisconnectControl",
+        "GXDLMSEmergencyProfile": ".GXDLMSEmergencyProfile",
+        "GXDLMSGprsSetup": ".GXDLMSGprsSetup",
+        "GXDLMSGSMCellInfo": ".GXDLMSGSMCellInfo",
+        "GXDLMSGSMDiagnostic": ".GXDLMSGSMDiagnostic",
+        "GXDLMSHdlcSetup": ".GXDLMSHdlcSetup",
+        "GXDLMSIECLocalPortSetup": ".GXDLMSIECLocalPortSetup",
+        "GXDLMSIecTwistedPairSetup": ".GXDLMSIecTwistedPairSetup",
+        "GXDLMSImageActivateInfo": ".GXDLMSImageActivateInfo",
+        "GXDLMSImageTransfer": ".GXDLMSImageTransfer",
+        "GXDLMSIp4Setup": ".GXDLMSIp4Setup",
+        "GXDLMSIp4SetupIpOption": ".GXDLMSIp4SetupIpOption",
+        "GXDLMSIp6Setup": ".GXDLMSIp6Setup",
+        "GXDLMSLimiter": ".GXDLMSLimiter",
+        "GXDLMSMacAddressSetup": ".GXDLMSMacAddressSetup",
+        "GXDLMSMBusClient": ".GXDLMSMBusClient",
+        "GXDLMSMBusMasterPortSetup": ".GXDLMSMBusMasterPortSetup",
+        "GXDLMSMBusSlavePortSetup": ".GXDLMSMBusSlavePortSetup",
+        "GXDLMSModemConfiguration": ".GXDLMSModemConfiguration",
+        "GXDLMSModemInitialisation": ".GXDLMSModemInitialisation",
+        "GXDLMSMonitoredValue": ".GXDLMSMonitoredValue",
+        "GXDLMSObject": ".GXDLMSObject",
+        "GXDLMSObjectCollection": ".GXDLMSObjectCollection",
+        "GXDLMSObjectDefinition": ".GXDLMSObjectDefinition",
+        "GXDLMSParameterMonitor": ".GXDLMSParameterMonitor",
+        "GXDLMSPppSetup": ".GXDLMSPppSetup",
+        "GXDLMSPppSetupIPCPOption": ".GXDLMSPppSetupIPCPOption",
+        "GXDLMSPppSetupLcpOption": ".GXDLMSPppSetupLcpOption",
+        "GXDLMSProfileGeneric": ".GXDLMSProfileGeneric",
+        "GXDLMSPushSetup": ".GXDLMSPushSetup",
+        "GXDLMSQualityOfService": ".GXDLMSQualityOfService",
+        "GXDLMSSapAssignment": ".GXDLMSSapAssignment",
+        "GXDLMSSchedule": ".GXDLMSSchedule",
+        "GXDLMSScheduleEntry": ".GXDLMSScheduleEntry",
+        "GXDLMSScript": ".GXDLMSScript",
+        "GXDLMSScriptAction": ".GXDLMSScriptAction",
+        "GXDLMSScriptTable": ".GXDLMSScriptTable",
+        "GXDLMSSeasonProfile": ".GXDLMSSeasonProfile",
+        "GXDLMSSecuritySetup": ".GXDLMSSecuritySetup",
+        "GXDLMSSpecialDay": ".GXDLMSSpecialDay",
+        "GXDLMSSpecialDaysTable": ".GXDLMSSpecialDaysTable",
+        "GXDLMSTarget": ".GXDLMSTarget",
+        "GXDLMSTcpUdpSetup": ".GXDLMSTcpUdpSetup",
+        "GXDLMSTokenGateway": ".GXDLMSTokenGateway",
+        "GXDLMSWeekProfile": ".GXDLMSWeekProfile",
+        "GXNeighborDiscoverySetup": ".GXNeighborDiscoverySetup",
+        "GXTokenGatewayConfiguration": ".GXTokenGatewayConfiguration",
+        "GXUnitCharge": ".GXUnitCharge",
+        "GXxDLMSContextType": ".GXxDLMSContextType",
+        "GXXmlReader": ".GXXmlReader",
+        "GXXmlWriter": ".GXXmlWriter",
+        "GXXmlWriterSettings": ".GXXmlWriterSettings",
+        "IGXDLMSBase": ".IGXDLMSBase",
+        "GXDLMSUtilityTables": ".GXDLMSUtilityTables",
+        "GXDLMSLlcSscsSetup": ".GXDLMSLlcSscsSetup",
+        "GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters": ".GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters",
+        "GXDLMSPrimeNbOfdmPlcMacSetup": ".GXDLMSPrimeNbOfdmPlcMacSetup",
+        "GXDLMSPrimeNbOfdmPlcMacFunctionalParameters": ".GXDLMSPrimeNbOfdmPlcMacFunctionalParameters",
+        "GXDLMSPrimeNbOfdmPlcMacCounters": ".GXDLMSPrimeNbOfdmPlcMacCounters",
+        "GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData": ".GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData",
+        "GXDLMSPrimeNbOfdmPlcApplicationsIdentification": ".GXDLMSPrimeNbOfdmPlcApplicationsIdentification",
+        "GXMacMulticastEntry": ".GXMacMulticastEntry",
+        "GXMacDirectTable": ".GXMacDirectTable",
+        "GXMacAvailableSwitch": ".GXMacAvailableSwitch",
+        "GXMacPhyCommunication": ".GXMacPhyCommunication",
+        "GXDLMSNtpSetup": ".GXDLMSNtpSetup",
+        "GXDLMSG3PlcMacLayerCounters": ".GXDLMSG3PlcMacLayerCounters",
+        "GXDLMSMacPosTable": ".GXDLMSMacPosTable",
+        "GXDLMSRoutingConfiguration": ".GXDLMSRoutingConfiguration",
+        "GXDLMSRoutingTable": ".GXDLMSRoutingTable",
+        "GXDLMSContextInformationTable": ".GXDLMSContextInformationTable",
+        "GXDLMSBroadcastLogTable": ".GXDLMSBroadcastLogTable",
+        "GXDLMSFunctionControl": ".GXDLMSFunctionControl",
+        "GXDLMSG3Plc6LoWPan": ".GXDLMSG3Plc6LoWPan",
+        "GXDLMSG3PlcMacSetup": ".GXDLMSG3PlcMacSetup",
+        "GXRepetitionDelay": ".GXRepetitionDelay",
+        "GXPushConfirmationParameter": ".GXPushConfirmationParameter",
+        "GXPushProtectionParameters": ".GXPushProtectionParameters",
+        "GXDLMSDataProtectionIdentifiedKey": ".GXDLMSDataProtectionIdentifiedKey",
+        "GXDLMSDataProtectionWrappeddKey": ".GXDLMSDataProtectionWrappeddKey",
+        "GXDLMSDataProtectionAgreedKey": ".GXDLMSDataProtectionAgreedKey",
+        "GXDLMSRestriction": ".GXDLMSRestriction",
+    },
+    ["enums"],
+):
+    from .GXAdjacentCell import GXAdjacentCell
+    from .GXApplicationContextName import GXApplicationContextName
+    from .GXAuthenticationMechanismName import GXAuthenticationMechanismName
+    from .GXChargePerUnitScaling import GXChargePerUnitScaling
+    from .GXChargeTable import GXChargeTable
+    from .GXCommodity import GXCommodity
+    from .GXCreditChargeConfiguration import GXCreditChargeConfiguration
+    from .GXCurrency import GXCurrency
+    from .GXDLMSRegister import GXDLMSRegister
+    from .GXDLMSDemandRegister import GXDLMSDemandRegister
+    from .GXDLMSRegisterMonitor import GXDLMSRegisterMonitor
+    from .GXDLMSRegisterActivation import GXDLMSRegisterActivation
+    from .GXDLMSExtendedRegister import GXDLMSExtendedRegister
+    from .GXDLMSAccount import GXDLMSAccount
+    from .GXDLMSActionItem import GXDLMSActionItem
+    from .GXDLMSActionSchedule import GXDLMSActionSchedule
+    from .GXDLMSActionSet import GXDLMSActionSet
+    from .GXDLMSActivityCalendar import GXDLMSActivityCalendar
+    from .GXDLMSAssociationLogicalName import GXDLMSAssociationLogicalName
+    from .GXDLMSAssociationShortName import GXDLMSAssociationShortName
+    from .GXDLMSAutoAnswer import GXDLMSAutoAnswer
+    from .GXDLMSAutoConnect import GXDLMSAutoConnect
+    from .GXDLMSCaptureObject import GXDLMSCaptureObject
+    from .GXDLMSCertificateInfo import GXDLMSCertificateInfo
+    from .GXDLMSCharge import GXDLMSCharge
+    from .GXDLMSClock import GXDLMSClock
+    from .GXDLMSCredit import GXDLMSCredit
+    from .GXDLMSData import GXDLMSData
+    from .GXDLMSDayProfile import GXDLMSDayProfile
+    from .GXDLMSDayProfileAction import GXDLMSDayProfileAction
+    from .GXDLMSDisconnectControl import GXDLMSDisconnectControl
+    from .GXDLMSEmergencyProfile import GXDLMSEmergencyProfile
+    from .GXDLMSGprsSetup import GXDLMSGprsSetup
+    from .GXDLMSGSMCellInfo import GXDLMSGSMCellInfo
+    from .GXDLMSGSMDiagnostic import GXDLMSGSMDiagnostic
+    from .GXDLMSHdlcSetup import GXDLMSHdlcSetup
+    from .GXDLMSIECLocalPortSetup import GXDLMSIECLocalPortSetup
+    from .GXDLMSIecTwistedPairSetup import GXDLMSIecTwistedPairSetup
+    from .GXDLMSImageActivateInfo import GXDLMSImageActivateInfo
+    from .GXDLMSImageTransfer import GXDLMSImageTransfer
+    from .GXDLMSIp4Setup import GXDLMSIp4Setup
+    from .GXDLMSIp4SetupIpOption import GXDLMSIp4SetupIpOption
+    from .GXDLMSIp6Setup import GXDLMSIp6Setup
+    from .GXDLMSLimiter import GXDLMSLimiter
+    from .GXDLMSMacAddressSetup import GXDLMSMacAddressSetup
+    from .GXDLMSMBusClient import GXDLMSMBusClient
+    from .GXDLMSMBusMasterPortSetup import GXDLMSMBusMasterPortSetup
+    from .GXDLMSMBusSlavePortSetup import GXDLMSMBusSlavePortSetup
+    from .GXDLMSModemConfiguration import GXDLMSModemConfiguration
+    from .GXDLMSModemInitialisation import GXDLMSModemInitialisation
+    from .GXDLMSMonitoredValue import GXDLMSMonitoredValue
+    from .GXDLMSObject import GXDLMSObject
+    from .GXDLMSObjectCollection import GXDLMSObjectCollection
+    from .GXDLMSObjectDefinition import GXDLMSObjectDefinition
+    from .GXDLMSParameterMonitor import GXDLMSParameterMonitor
+    from .GXDLMSPppSetup import GXDLMSPppSetup
+    from .GXDLMSPppSetupIPCPOption import GXDLMSPppSetupIPCPOption
+    from .GXDLMSPppSetupLcpOption import GXDLMSPppSetupLcpOption
+    from .GXDLMSProfileGeneric import GXDLMSProfileGeneric
+    from .GXDLMSPushSetup import GXDLMSPushSetup
+    from .GXDLMSQualityOfService import GXDLMSQualityOfService
+    from .GXDLMSSapAssignment import GXDLMSSapAssignment
+    from .GXDLMSSchedule import GXDLMSSchedule
+    from .GXDLMSScheduleEntry import GXDLMSScheduleEntry
+    from .GXDLMSScript import GXDLMSScript
+    from .GXDLMSScriptAction import GXDLMSScriptAction
+    from .GXDLMSScriptTable import GXDLMSScriptTable
+    from .GXDLMSSeasonProfile import GXDLMSSeasonProfile
+    from .GXDLMSSecuritySetup import GXDLMSSecuritySetup
+    from .GXDLMSSpecialDay import GXDLMSSpecialDay
+    from .GXDLMSSpecialDaysTable import GXDLMSSpecialDaysTable
+    from .GXDLMSTarget import GXDLMSTarget
+    from .GXDLMSTcpUdpSetup import GXDLMSTcpUdpSetup
+    from .GXDLMSTokenGateway import GXDLMSTokenGateway
+    from .GXDLMSWeekProfile import GXDLMSWeekProfile
+    from .GXNeighborDiscoverySetup import GXNeighborDiscoverySetup
+    from .GXTokenGatewayConfiguration import GXTokenGatewayConfiguration
+    from .GXUnitCharge import GXUnitCharge
+    from .GXxDLMSContextType import GXxDLMSContextType
+    from .GXXmlReader import GXXmlReader
+    from .GXXmlWriter import GXXmlWriter
+    from .GXXmlWriterSettings import GXXmlWriterSettings
+    from .IGXDLMSBase import IGXDLMSBase
+    from .GXDLMSUtilityTables import GXDLMSUtilityTables
+    from .GXDLMSLlcSscsSetup import GXDLMSLlcSscsSetup
+    from .GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters import GXDLMSPrimeNbOfdmPlcPhysicalLayerCounters
+    from .GXDLMSPrimeNbOfdmPlcMacSetup import GXDLMSPrimeNbOfdmPlcMacSetup
+    from .GXDLMSPrimeNbOfdmPlcMacFunctionalParameters import GXDLMSPrimeNbOfdmPlcMacFunctionalParameters
+    from .GXDLMSPrimeNbOfdmPlcMacCounters import GXDLMSPrimeNbOfdmPlcMacCounters
+    from .GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData import GXDLMSPrimeNbOfdmPlcMacNetworkAdministrationData
+    from .GXDLMSPrimeNbOfdmPlcApplicationsIdentification import GXDLMSPrimeNbOfdmPlcApplicationsIdentification
+    from .GXMacMulticastEntry import GXMacMulticastEntry
+    from .GXMacDirectTable import GXMacDirectTable
+    from .GXMacAvailableSwitch import GXMacAvailableSwitch
+    from .GXMacPhyCommunication import GXMacPhyCommunication
+    from .GXDLMSNtpSetup import GXDLMSNtpSetup
+    from .GXDLMSG3PlcMacLayerCounters import GXDLMSG3PlcMacLayerCounters
+    from .GXDLMSMacPosTable import GXDLMSMacPosTable
+    from .GXDLMSRoutingConfiguration import GXDLMSRoutingConfiguration
+    from .GXDLMSRoutingTable import GXDLMSRoutingTable
+    from .GXDLMSContextInformationTable import GXDLMSContextInformationTable
+    from .GXDLMSBroadcastLogTable import GXDLMSBroadcastLogTable
+    from .GXDLMSFunctionControl import GXDLMSFunctionControl
+    from .GXDLMSG3Plc6LoWPan import GXDLMSG3Plc6LoWPan
+    from .GXDLMSG3PlcMacSetup import GXDLMSG3PlcMacSetup
+    from .GXRepetitionDelay import GXRepetitionDelay
+    from .GXPushConfirmationParameter import GXPushConfirmationParameter
+    from .GXPushProtectionParameters import GXPushProtectionParameters
+    from .GXDLMSDataProtectionIdentifiedKey import GXDLMSDataProtectionIdentifiedKey
+    from .GXDLMSDataProtectionWrappeddKey import GXDLMSDataProtectionWrappeddKey
+    from .GXDLMSDataProtectionAgreedKey import GXDLMSDataProtectionAgreedKey
+    from .GXDLMSRestriction import GXDLMSRestriction